@@ -0,0 +1,337 @@
+from functools import lru_cache
+from heapq import heappop, heappush
+from itertools import islice
+
+from engine import SnakeEngine, UP, DOWN, LEFT, RIGHT, CELL_EMPTY, CELL_SNAKE
+
+
+def hamiltonian_cycle(cols, rows, first_row=SnakeEngine.FIRST_ROW):
+    """
+        Construiește un ciclu care trece o singură dată prin fiecare celulă jucabilă (rândurile de la first_row).
+
+        Dacă numărul de rânduri jucabile este par, rândurile sunt parcurse în serpentină pe coloanele 1..cols-1, iar
+        coloana 0 este drumul de întoarcere; altfel, dacă numărul de coloane este par, coloanele sunt parcurse în
+        serpentină pe rândurile de sub first_row, iar rândul first_row este drumul de întoarcere.
+
+        Args:
+            cols (int): Numărul de coloane ale tablei.
+            rows (int): Numărul de rânduri ale tablei.
+            first_row (int): Primul rând jucabil.
+
+        Returns:
+            list of tuple: Celulele (coloană, rând) ale ciclului, în ordine, sau None dacă tabla nu are un astfel de
+            ciclu (ambele dimensiuni jucabile sunt impare sau tabla este prea mică).
+    """
+    height = rows - first_row
+    if cols < 2 or height < 2:
+        return None
+    cells = []
+    if height % 2 == 0:
+        for offset in range(height):
+            row = first_row + offset
+            columns = range(1, cols) if offset % 2 == 0 else range(cols - 1, 0, -1)
+            cells.extend((col, row) for col in columns)
+        cells.extend((0, row) for row in range(rows - 1, first_row - 1, -1))
+    elif cols % 2 == 0:
+        for col in range(cols):
+            rows_range = range(first_row + 1, rows) if col % 2 == 0 else range(rows - 1, first_row, -1)
+            cells.extend((col, row) for row in rows_range)
+        cells.extend((col, first_row) for col in range(cols - 1, -1, -1))
+    else:
+        return None
+    return cells
+
+
+@lru_cache(maxsize=8)
+def _adjacency(cols, rows, first_row):
+    """
+        Returns:
+            tuple: Pentru fiecare celulă, tuplul vecinilor ei jucabili (sus, jos, stânga, dreapta).
+    """
+    cells = cols * rows
+    neighbours = []
+    for index in range(cells):
+        col, row = index % cols, index // cols
+        around = []
+        if row > first_row:
+            around.append(index - cols)
+        if row < rows - 1:
+            around.append(index + cols)
+        if col > 0:
+            around.append(index - 1)
+        if col < cols - 1:
+            around.append(index + 1)
+        neighbours.append(tuple(around) if row >= first_row else ())
+    return tuple(neighbours)
+
+
+class Autopilot:
+    """
+    Pilot automat: alege directia sarpelui la fiecare tick.
+
+    Pe tablele fara obstacole care au un ciclu hamiltonian, sarpele urmeaza ciclul si ia scurtaturi spre mancare
+    doar cat timp ordinea corpului pe ciclu ramane valida, deci nu se poate bloca si poate umple tabla; decizia este
+    O(1). Pe celelalte table, cauta cel mai scurt drum (A* cu euristica Manhattan pe harta de ocupare a motorului)
+    pana la mancare si il urmeaza doar daca, dupa ce mananca, capul poate ajunge inca la coada; altfel urmareste
+    coada pe drumul cel mai lung, iar daca nici asta nu este posibil alege vecinul cu cea mai mare zona libera.
+
+    Instanta poate fi folosita direct ca politica de self-play: autopilot(engine, rng) -> directie.
+
+    Atribute:
+
+    • cols: int - numarul de coloane al tablei pentru care sunt pregatite structurile interne
+    • rows: int - numarul de randuri al tablei pentru care sunt pregatite structurile interne
+    • cycle: list - ciclul hamiltonian al tablei curente sau None daca nu este folosit
+
+    Metode:
+
+    • choose(engine) - alege directia pentru urmatorul tick
+    • reset() - uita starea jocului curent (de exemplu dupa ce jucatorul a condus sarpele manual)
+
+    """
+
+    def __init__(self):
+        self.cols = None
+        self.rows = None
+        self.cycle = None
+        self._obstacles = None
+        self._adjacency = ()
+        self._position = None
+        self._moves = {}
+        self._game = None
+        self._expected = None
+        self._stalled = 0
+        self._score = None
+
+    def __call__(self, engine, rng=None):
+        return self.choose(engine)
+
+    def reset(self):
+        """
+            Uită starea jocului curent; ordinea corpului pe ciclu este verificată din nou la următoarea decizie.
+        """
+        self._expected = None
+        self._stalled = 0
+        self._score = None
+
+    def choose(self, engine):
+        """
+            Alege direcția pentru următorul tick.
+
+            Args:
+                engine (SnakeEngine): Motorul jocului.
+
+            Returns:
+                str: Direcția aleasă; dacă orice mutare duce la moarte, direcția curentă.
+        """
+        if engine.obstacles is not self._obstacles or engine.cols != self.cols or engine.rows != self.rows:
+            self._prepare(engine)
+        if self._game != (engine, engine.seed):
+            self.reset()
+            self._game = (engine, engine.seed)
+        cols = engine.cols
+        col, row = engine.snake[0]
+        head = row * cols + col
+
+        target = None
+        if self.cycle is not None and self._on_cycle(engine, head):
+            target = self._cycle_move(engine, head)
+        self._expected = target
+        if target is None:
+            target = self._search_move(engine, head)
+        if target is None:
+            return engine.direction or RIGHT
+        return self._moves[target - head]
+
+    def _prepare(self, engine):
+        """
+            Pregătește vecinii celulelor și, dacă tabla nu are obstacole, ciclul hamiltonian.
+        """
+        self.cols, self.rows = engine.cols, engine.rows
+        self._obstacles = engine.obstacles
+        self._adjacency = _adjacency(engine.cols, engine.rows, engine.FIRST_ROW)
+        self._moves = {-engine.cols: UP, engine.cols: DOWN, -1: LEFT, 1: RIGHT}
+        self.reset()
+        self.cycle = hamiltonian_cycle(engine.cols, engine.rows, engine.FIRST_ROW) if not engine.obstacles else None
+        self._position = None
+        if self.cycle is not None:
+            self._position = [-1] * (engine.cols * engine.rows)
+            for position, (col, row) in enumerate(self.cycle):
+                self._position[row * engine.cols + col] = position
+
+    def _distance(self, start, end):
+        """
+            Distanța de la `start` la `end` pe ciclu, în sensul de parcurgere.
+        """
+        return (self._position[end] - self._position[start]) % len(self.cycle)
+
+    def _on_cycle(self, engine, head):
+        """
+            Verifică dacă segmentele șarpelui, de la coadă la cap, sunt în ordinea ciclului (condiția pentru ca
+            scurtăturile să fie sigure). Verificarea completă, O(lungime), se face doar când capul nu este acolo
+            unde l-a dus ultima decizie, adică la un joc nou sau după o mutare făcută de altcineva.
+        """
+        if self._expected == head:
+            return True
+        cols = engine.cols
+        span = 0
+        previous = None
+        for col, row in reversed(engine.snake):
+            index = row * cols + col
+            if previous is not None:
+                span += self._distance(previous, index)
+            previous = index
+        return span < len(self.cycle)
+
+    def _cycle_move(self, engine, head):
+        """
+            Alege vecinul următor pe ciclu sau o scurtătură spre mâncare care păstrează ordinea corpului.
+
+            O scurtătură sare peste celule libere, care rămân în urma capului; ea este permisă doar cât timp șarpele
+            ocupă mai puțin de jumătate din tablă și în fața capului rămân cel puțin un sfert din celule libere, ca
+            mâncarea apărută chiar în fața lui să nu-l poată prinde între cap și coadă.
+        """
+        cols = engine.cols
+        size = len(self.cycle)
+        tail_col, tail_row = engine.snake[-1]
+        gap = self._distance(head, tail_row * cols + tail_col)
+        length = len(engine.snake)
+        if engine.food is not None:
+            food_col, food_row = engine.food
+            to_food = self._distance(head, food_row * cols + food_col)
+        else:
+            to_food = size
+        shortcuts = length * 2 < size
+
+        best, best_distance = None, 0
+        for neighbour in self._adjacency[head]:
+            distance = self._distance(head, neighbour)
+            if distance == 0 or distance >= gap or distance > to_food:
+                continue
+            if distance > 1 and not (shortcuts and gap - distance - 1 >= size // 4):
+                continue
+            if distance > best_distance:
+                best, best_distance = neighbour, distance
+        return best
+
+    def _search_move(self, engine, head):
+        """
+            Alege mutarea prin căutare pe harta de ocupare: drumul cel mai scurt spre mâncare dacă este sigur,
+            altfel urmărirea cozii, altfel vecinul cu cea mai mare zonă liberă.
+
+            Dacă șarpele a urmărit coada mai multe tick-uri decât are tabla celule, drumul spre mâncare este urmat
+            chiar și nesigur, ca jocul să nu se blocheze într-o buclă fără sfârșit.
+        """
+        cols = engine.cols
+        grid = engine.grid
+        adjacency = self._adjacency
+        food = engine.food[1] * cols + engine.food[0] if engine.food is not None else None
+
+        if engine.score != self._score:
+            self._score = engine.score
+            self._stalled = 0
+        if food is not None:
+            path = self._find_path(grid, head, food)
+            if path is not None and (self._stalled > len(grid) or self._safe_after(engine, path)):
+                return path[0]
+        self._stalled += 1
+
+        tail_col, tail_row = engine.snake[-1]
+        distances = self._distances(grid, tail_row * cols + tail_col)
+        best, best_distance = None, -1
+        for neighbour in adjacency[head]:
+            if grid[neighbour] == CELL_EMPTY and neighbour in distances and neighbour != food:
+                if distances[neighbour] > best_distance:
+                    best, best_distance = neighbour, distances[neighbour]
+        if best is not None:
+            return best
+
+        best_area = 0
+        for neighbour in adjacency[head]:
+            if grid[neighbour] == CELL_EMPTY:
+                area = len(self._distances(grid, neighbour))
+                if area > best_area:
+                    best, best_area = neighbour, area
+        return best
+
+    def _find_path(self, board, start, goal, occupied_goal=False):
+        """
+            Caută cu A* (euristica Manhattan) cel mai scurt drum prin celule libere de la `start` la `goal`.
+
+            Cu `occupied_goal`, celula `goal` poate fi ocupată (coada șarpelui), dar nu poate fi atinsă direct din
+            `start`: mutarea în celula cozii este o coliziune.
+
+            Returns:
+                list of int: Celulele drumului, fără `start` și cu `goal` la final, sau None dacă nu există.
+        """
+        adjacency = self._adjacency
+        cols = self.cols
+        goal_col, goal_row = goal % cols, goal // cols
+        parent = {start: None}
+        cost = {start: 0}
+        heap = [(abs(start % cols - goal_col) + abs(start // cols - goal_row), 0, start)]
+        while heap:
+            _, depth, index = heappop(heap)
+            steps = -depth
+            if index == goal:
+                path = []
+                while index != start:
+                    path.append(index)
+                    index = parent[index]
+                path.reverse()
+                return path
+            if steps > cost[index]:
+                continue
+            steps += 1
+            for neighbour in adjacency[index]:
+                if neighbour == goal and occupied_goal:
+                    if index == start:
+                        continue
+                elif board[neighbour] != CELL_EMPTY:
+                    continue
+                if steps < cost.get(neighbour, steps + 1):
+                    cost[neighbour] = steps
+                    parent[neighbour] = index
+                    estimate = abs(neighbour % cols - goal_col) + abs(neighbour // cols - goal_row)
+                    heappush(heap, (steps + estimate, -steps, neighbour))
+        return None
+
+    def _distances(self, board, start):
+        """
+            Returns:
+                dict: Distanța de la `start` la fiecare celulă liberă accesibilă din ea.
+        """
+        adjacency = self._adjacency
+        distances = {start: 0}
+        frontier = [start]
+        step = 0
+        while frontier:
+            step += 1
+            following = []
+            for index in frontier:
+                for neighbour in adjacency[index]:
+                    if neighbour not in distances and board[neighbour] == CELL_EMPTY:
+                        distances[neighbour] = step
+                        following.append(neighbour)
+            frontier = following
+        return distances
+
+    def _safe_after(self, engine, path):
+        """
+            Verifică dacă, după ce șarpele a urmat drumul și a mâncat, capul mai poate ajunge la coadă.
+        """
+        cols = engine.cols
+        snake = engine.snake
+        length = len(snake)
+        kept = length + 1 - len(path)
+        board = bytearray(engine.grid)
+        for col, row in islice(snake, max(kept, 0), None):
+            board[row * cols + col] = CELL_EMPTY
+        for index in path:
+            board[index] = CELL_SNAKE
+        if kept > 0:
+            tail_col, tail_row = snake[kept - 1]
+            tail = tail_row * cols + tail_col
+        else:
+            tail = path[len(path) - 1 - length]
+        return self._find_path(board, path[-1], tail, occupied_goal=True) is not None
@@ -0,0 +1,239 @@
+import numpy as np
+
+from engine import (SnakeEngine, UP, DOWN, LEFT, RIGHT, MOVED, ATE, WALL, SELF, OBSTACLE, WON, CELL_EMPTY,
+                    CELL_SNAKE, CELL_OBSTACLE)
+from levels import load_level_pack
+
+# Codurile actiunilor si ale rezultatelor folosite in tablourile NumPy; indexul din tuplu este codul.
+ACTIONS = (UP, DOWN, LEFT, RIGHT)
+RESULTS = (MOVED, ATE, WALL, SELF, OBSTACLE, WON)
+
+NO_ACTION = -1
+_DX = np.array([0, 0, -1, 1], dtype=np.int32)
+_DY = np.array([-1, 1, 0, 0], dtype=np.int32)
+_OPPOSITE = np.array([1, 0, 3, 2], dtype=np.int8)
+_MOVED, _ATE, _WALL, _SELF, _OBSTACLE, _WON = range(len(RESULTS))
+
+# Numarul de incercari vectorizate de plasare a mancarii inainte de cautarea exacta a celulelor libere.
+_SPAWN_ATTEMPTS = 16
+
+
+class BatchEngine:
+    """
+    Simulator vectorizat pentru N jocuri Snake independente, pe aceeasi tabla.
+
+    Toate jocurile sunt tinute in tablouri NumPy si avansate impreuna de un singur apel `step(actions)`, cu
+    aceleasi reguli ca SnakeEngine (coliziuni cu marginile, cu propriul corp si cu obstacolele, mancare, scor,
+    victorie cand tabla s-a umplut). Este folosit pentru antrenarea AI-ului si echilibrarea nivelelor, unde o bucla
+    peste N obiecte SnakeEngine ar fi mult prea lenta.
+
+    Celulele sunt indexate ca in SnakeEngine: rand * cols + coloana.
+
+    Atribute:
+
+    • n: int - numarul de jocuri
+    • cols: int - numarul de coloane ale tablei
+    • rows: int - numarul de randuri ale tablei
+    • obstacles: list - celulele (coloana, rand) ocupate de obstacole, comune tuturor jocurilor
+    • grid: ndarray (n, rows * cols) uint8 - hartile de ocupare (CELL_EMPTY, CELL_SNAKE, CELL_OBSTACLE)
+    • body: ndarray (n, rows * cols) int32 - corpurile sarpilor, ca buffer circular de indecsi de celule
+    • head_ptr: ndarray (n,) int32 - pozitia capului in body
+    • length: ndarray (n,) int32 - lungimea fiecarui sarpe
+    • food: ndarray (n,) int32 - celula mancarii (-1 daca tabla este plina)
+    • direction: ndarray (n,) int8 - directia curenta, ca index in ACTIONS (-1 inainte de prima mutare)
+    • score: ndarray (n,) int32 - scorurile
+    • done: ndarray (n,) bool - True pentru jocurile terminate
+    • cause: ndarray (n,) int8 - codul rezultatului care a terminat jocul, ca index in RESULTS (-1 daca nu)
+    • rng: obiect de tip numpy.random.Generator - generatorul folosit pentru mancare
+
+    Metode:
+
+    • from_level(n, level, obstacles_file, block_size, seed) - creeaza simulatorul pentru un nivel din fisier
+    • reset(games=None) - reseteaza jocurile date (implicit toate)
+    • step(actions) - avanseaza toate jocurile cu un tick
+    • heads() - celulele in care se afla capetele sarpilor
+
+    """
+
+    def __init__(self, n, cols, rows, obstacles=(), seed=None):
+        """
+            Inițializează simulatorul.
+
+            Args:
+                n (int): Numărul de jocuri simulate în paralel.
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+                obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+                seed (int): Sămânța generatorului de numere aleatoare (opțional).
+        """
+        self.n = n
+        self.cols = cols
+        self.rows = rows
+        self.obstacles = list(obstacles)
+        self.rng = np.random.default_rng(seed)
+
+        cells = cols * rows
+        self._obstacle_grid = np.zeros(cells, dtype=np.uint8)
+        for col, row in self.obstacles:
+            if 0 <= col < cols and 0 <= row < rows:
+                self._obstacle_grid[row * cols + col] = CELL_OBSTACLE
+        zone = np.zeros(cells, dtype=bool)
+        last_food_row = rows - SnakeEngine.FOOD_BOTTOM_MARGIN
+        zone[SnakeEngine.FOOD_FIRST_ROW * cols:min(last_food_row + 1, rows) * cols] = True
+        self._spawn_cells = np.flatnonzero(zone & (self._obstacle_grid == CELL_EMPTY)).astype(np.int32)
+
+        self.grid = np.empty((n, cells), dtype=np.uint8)
+        self.body = np.zeros((n, cells), dtype=np.int32)
+        self.head_ptr = np.zeros(n, dtype=np.int32)
+        self.length = np.zeros(n, dtype=np.int32)
+        self.food = np.full(n, -1, dtype=np.int32)
+        self.direction = np.full(n, NO_ACTION, dtype=np.int8)
+        self.score = np.zeros(n, dtype=np.int32)
+        self.done = np.zeros(n, dtype=bool)
+        self.cause = np.full(n, -1, dtype=np.int8)
+        self._games = np.arange(n)
+        self.reset()
+
+    @classmethod
+    def from_level(cls, n, level, obstacles_file="tabla.json", block_size=20, seed=None):
+        """
+            Creează simulatorul pentru un nivel din fișierul de nivele.
+
+            Args:
+                n (int): Numărul de jocuri simulate în paralel.
+                level (str): Nivelul de dificultate ("usor", "normal", "hardcore").
+                obstacles_file (str): Calea către fișierul JSON cu nivelele.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                seed (int): Sămânța generatorului de numere aleatoare (opțional).
+
+            Returns:
+                BatchEngine: Simulatorul pentru nivelul cerut.
+        """
+        pack = load_level_pack(obstacles_file, block_size)
+        return cls(n, pack.cols, pack.rows, pack.level(level).obstacles(), seed=seed)
+
+    def reset(self, games=None):
+        """
+            Resetează jocurile date: șarpele în centrul tablei, scorul 0 și mâncare nouă.
+
+            Args:
+                games (array-like): Indecșii sau masca booleană a jocurilor resetate; implicit toate.
+        """
+        games = self._games if games is None else self._games[games]
+        if len(games) == 0:
+            return
+        head = (self.rows // 2) * self.cols + self.cols // 2
+        self.grid[games] = self._obstacle_grid
+        self.grid[games, head] = CELL_SNAKE
+        self.grid[games, head - 1] = CELL_SNAKE
+        self.body[games, 0] = head - 1
+        self.body[games, 1] = head
+        self.head_ptr[games] = 1
+        self.length[games] = 2
+        self.direction[games] = NO_ACTION
+        self.score[games] = 0
+        self.done[games] = False
+        self.cause[games] = -1
+        self._spawn_food(games)
+
+    def heads(self):
+        """
+            Returns:
+                ndarray (n,) int32: Celula capului fiecărui șarpe.
+        """
+        return self.body[self._games, self.head_ptr]
+
+    def step(self, actions):
+        """
+            Avansează toate jocurile cu un tick.
+
+            Jocurile terminate nu se mai modifică până la `reset`. Ca în SnakeEngine, o acțiune opusă direcției
+            curente este ignorată, iar NO_ACTION (-1) păstrează direcția curentă.
+
+            Args:
+                actions (array-like): Câte o acțiune pentru fiecare joc, ca index în ACTIONS sau NO_ACTION.
+
+            Returns:
+                ndarray (n,) int8: Rezultatul fiecărui joc, ca index în RESULTS; jocurile deja terminate
+                raportează cauza terminării.
+
+            Raises:
+                ValueError: Dacă un joc activ nu are încă nicio direcție.
+        """
+        actions = np.asarray(actions, dtype=np.int8)
+        active = ~self.done
+        current = self.direction
+        accept = active & (actions != NO_ACTION) & ((current == NO_ACTION) | (actions != _OPPOSITE[current]))
+        self.direction = np.where(accept, actions, current).astype(np.int8)
+        if np.any(active & (self.direction == NO_ACTION)):
+            raise ValueError("Sarpele nu are inca o directie")
+
+        result = np.where(active, _MOVED, self.cause).astype(np.int8)
+        games = np.flatnonzero(active)
+        if len(games) == 0:
+            return result
+
+        cols = self.cols
+        direction = self.direction[games]
+        head = self.body[games, self.head_ptr[games]]
+        col = head % cols + _DX[direction]
+        row = head // cols + _DY[direction]
+        wall = (col < 0) | (col >= cols) | (row < SnakeEngine.FIRST_ROW) | (row >= self.rows)
+        target = np.where(wall, 0, row * cols + col)
+        cell = self.grid[games, target]
+        hit = np.where(wall, _WALL, np.where(cell == CELL_SNAKE, _SELF,
+                                             np.where(cell == CELL_OBSTACLE, _OBSTACLE, _MOVED)))
+
+        dead = hit != _MOVED
+        if np.any(dead):
+            dead_games = games[dead]
+            self.done[dead_games] = True
+            self.cause[dead_games] = hit[dead]
+            result[dead_games] = hit[dead]
+            games, target = games[~dead], target[~dead]
+
+        capacity = self.body.shape[1]
+        ate = target == self.food[games]
+        grow = games[ate]
+        move = games[~ate]
+
+        tail_ptr = (self.head_ptr[move] - self.length[move] + 1) % capacity
+        self.grid[move, self.body[move, tail_ptr]] = CELL_EMPTY
+        self.head_ptr[games] = (self.head_ptr[games] + 1) % capacity
+        self.body[games, self.head_ptr[games]] = target
+        self.grid[games, target] = CELL_SNAKE
+
+        if len(grow):
+            self.length[grow] += 1
+            self.score[grow] += 1
+            result[grow] = _ATE
+            self._spawn_food(grow)
+            won = grow[self.food[grow] < 0]
+            self.done[won] = True
+            self.cause[won] = _WON
+            result[won] = _WON
+        return result
+
+    def _spawn_food(self, games):
+        """
+            Plasează mâncarea pe o celulă liberă aleatoare, pentru fiecare joc dat.
+
+            Încearcă întâi eșantionarea vectorizată cu respingere, care reușește aproape mereu când tabla nu este
+            plină; jocurile rămase sunt rezolvate exact, din lista celulelor libere. Dacă nu mai există nicio celulă
+            liberă, mâncarea devine -1.
+        """
+        spawn = self._spawn_cells
+        if len(spawn) == 0:
+            self.food[games] = -1
+            return
+        pending = np.asarray(games)
+        for _ in range(_SPAWN_ATTEMPTS):
+            candidates = spawn[self.rng.integers(len(spawn), size=len(pending))]
+            free = self.grid[pending, candidates] == CELL_EMPTY
+            self.food[pending[free]] = candidates[free]
+            pending = pending[~free]
+            if len(pending) == 0:
+                return
+        for game in pending:
+            free_cells = spawn[self.grid[game, spawn] == CELL_EMPTY]
+            self.food[game] = self.rng.choice(free_cells) if len(free_cells) else -1
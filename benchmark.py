@@ -0,0 +1,274 @@
+"""
+Benchmark-uri pentru caile critice ale jocului: tick-ul motorului, generarea mancarii, desenarea si incarcarea
+nivelelor.
+
+Rezultatele sunt scrise in format JSON, ca sa poata fi comparate intre versiuni:
+
+    python benchmark.py --output bench.json
+    python benchmark.py --compare bench.json
+
+Benchmark-urile de desenare au nevoie de un display; fara display sunt marcate ca "skipped".
+"""
+import argparse
+import base64
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+from autopilot import hamiltonian_cycle
+from engine import SnakeEngine, DIRECTIONS
+from levels import load_level_pack, encode_bitmap
+
+
+def _measure(function, repeat=5, number=1):
+    """
+        Măsoară cel mai bun timp pentru `number` apeluri ale funcției, din `repeat` încercări.
+
+        Returns:
+            float: Durata unui singur apel, în secunde.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def _long_snake(cols, rows, length, seed=0):
+    """
+        Creează un motor în care șarpele are lungimea dată și se poate mișca la nesfârșit pe un ciclu.
+
+        Șarpele este hrănit cu mâncare pusă în fața capului până atinge lungimea cerută; apoi mâncarea este scoasă
+        de pe tablă, ca tick-urile măsurate să fie doar mișcări.
+
+        Returns:
+            tuple: Motorul și o funcție care întoarce direcția următoare pe ciclu.
+    """
+    engine = SnakeEngine(cols, rows, seed=seed)
+    cycle = hamiltonian_cycle(cols, rows, engine.FIRST_ROW)
+    head, tail = engine.snake[0], engine.snake[1]
+    position = cycle.index(head)
+    if cycle[position - 1] != tail:
+        cycle.reverse()
+    successor = {cell: cycle[(i + 1) % len(cycle)] for i, cell in enumerate(cycle)}
+    moves = {delta: direction for direction, delta in DIRECTIONS.items()}
+
+    def next_direction():
+        col, row = engine.snake[0]
+        next_col, next_row = successor[(col, row)]
+        return moves[(next_col - col, next_row - row)]
+
+    while len(engine.snake) < length:
+        engine.food = successor[engine.snake[0]]
+        engine.step(next_direction())
+    engine.food = None
+    return engine, next_direction
+
+
+def bench_ticks(lengths, cols=128, rows=129, ticks=20000):
+    """
+        Tick-uri pe secundă în funcție de lungimea șarpelui.
+    """
+    results = {}
+    for length in lengths:
+        engine, next_direction = _long_snake(cols, rows, length)
+
+        def run():
+            for _ in range(ticks):
+                engine.step(next_direction())
+
+        results[str(length)] = ticks / _measure(run, repeat=3)
+    return {"board": [cols, rows], "ticks_per_second": results}
+
+
+def bench_food_spawn(fill_ratios, cols=128, rows=129, calls=20000):
+    """
+        Latența generării mâncării în funcție de cât de plină este tabla.
+    """
+    results = {}
+    playable = cols * (rows - SnakeEngine.FIRST_ROW)
+    for ratio in fill_ratios:
+        engine, _ = _long_snake(cols, rows, max(2, int(playable * ratio)))
+        results[str(ratio)] = _measure(engine.generate_food, number=calls) * 1e6
+    return {"board": [cols, rows], "microseconds_per_call": results}
+
+
+def bench_render(board_sizes, ticks=2000):
+    """
+        Costul desenării complete (o dată pe joc) și al actualizării incrementale (la fiecare tick), în funcție de
+        dimensiunea tablei, pentru CanvasRenderer și SpriteRenderer (cheile "sprite_"). Are nevoie de un display.
+    """
+    try:
+        import tkinter as tk
+        root = tk.Tk()
+    except Exception as error:
+        return {"skipped": str(error)}
+    from renderer import CanvasRenderer, SpriteRenderer
+
+    results = {}
+    try:
+        for size in board_sizes:
+            canvas = tk.Canvas(root, width=size * 4, height=size * 4)
+            engine, next_direction = _long_snake(size, size + 1, size * 4)
+            measured = {}
+            for prefix, renderer_class in (("", CanvasRenderer), ("sprite_", SpriteRenderer)):
+                renderer = renderer_class(canvas, 4, "green", "red", "blue")
+
+                def draw_all():
+                    renderer.reset(engine)
+                    root.update_idletasks()
+
+                def run():
+                    for _ in range(ticks):
+                        engine.step(next_direction())
+                        renderer.update()
+                    root.update_idletasks()
+
+                measured[prefix + "full_draw_ms"] = _measure(draw_all, repeat=3) * 1000
+                measured[prefix + "tick_update_us"] = _measure(run, repeat=3) / ticks * 1e6
+            results[str(size)] = measured
+            canvas.destroy()
+    finally:
+        root.destroy()
+    return {"boards": results}
+
+
+def bench_level_load(obstacle_counts, block_size=20):
+    """
+        Timpul de încărcare a unui fișier de nivele cu multe obstacole: parsare, validare și compilare (fără
+        cache) pentru lista "obstacole" și pentru formatul compact "bitmap", respectiv citirea nivelelor compilate
+        din cache. Raportează și dimensiunea fișierelor.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for count in obstacle_counts:
+            side = int(count ** 0.5) + 4
+            cells = [(i % side, i // side) for i in range(count)]
+            board = {"width": side * block_size, "height": (side * 2 + 4) * block_size}
+            bitmap = {"latime": side, "inaltime": side,
+                      "date": base64.b64encode(encode_bitmap(cells, side, side)).decode("ascii")}
+            formats = {
+                "list": {"obstacole": [{"x": col * block_size, "y": row * block_size} for col, row in cells]},
+                "bitmap": {"bitmap": bitmap},
+            }
+
+            measured = {}
+            for name, level in formats.items():
+                path = os.path.join(directory, f"tabla-{count}-{name}.json")
+                with open(path, "w") as file:
+                    json.dump({"dimensiuniTabla": board,
+                               "nivele": {level_name: level for level_name in ("usor", "normal", "hardcore")}},
+                              file)
+                cache_dir = os.path.join(directory, "cache")
+                measured[name] = {
+                    "file_bytes": os.path.getsize(path),
+                    "parse_ms": _measure(lambda: load_level_pack(path, block_size, use_cache=False), repeat=3) * 1000,
+                    "cached_ms": _measure(lambda: load_level_pack(path, block_size, cache_dir=cache_dir),
+                                          repeat=3) * 1000,
+                }
+            results[str(count)] = measured
+    return {"milliseconds_and_bytes": results}
+
+
+def bench_batch(games=(64, 1024), ticks=200):
+    """
+        Tick-uri pe secundă ale simulatorului vectorizat (necesită NumPy).
+    """
+    try:
+        import numpy as np
+        from batch import BatchEngine
+    except ImportError as error:
+        return {"skipped": str(error)}
+
+    results = {}
+    for n in games:
+        engine = BatchEngine.from_level(n, "hardcore", seed=0)
+        actions = np.random.default_rng(0).integers(4, size=(ticks, n))
+
+        def run():
+            for tick in range(ticks):
+                engine.step(actions[tick])
+                engine.reset(engine.done)
+
+        results[str(n)] = n * ticks / _measure(run, repeat=3)
+    return {"ticks_per_second": results}
+
+
+def run_all(quick=False):
+    """
+        Rulează toate benchmark-urile.
+
+        Args:
+            quick (bool): Dimensiuni mai mici, pentru o verificare rapidă.
+
+        Returns:
+            dict: Rezultatele, împreună cu informații despre mediu.
+    """
+    if quick:
+        lengths, ratios, boards, counts = (10, 1000), (0.1, 0.9), (32,), (1000,)
+    else:
+        lengths, ratios, boards, counts = (10, 100, 1000, 10000), (0.1, 0.5, 0.9, 0.99), (32, 64, 128), \
+            (1000, 10000, 100000)
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "quick": quick,
+        },
+        "ticks": bench_ticks(lengths),
+        "food_spawn": bench_food_spawn(ratios),
+        "render": bench_render(boards),
+        "level_load": bench_level_load(counts),
+        "batch": bench_batch(),
+    }
+
+
+def _flatten(results, prefix=""):
+    values = {}
+    for key, value in results.items():
+        if key == "meta":
+            continue
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            values.update(_flatten(value, name + "."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[name] = value
+    return values
+
+
+def compare(old, new):
+    """
+        Compară două rezultate și întoarce raportul new / old pentru fiecare măsurătoare comună.
+    """
+    old_values, new_values = _flatten(old), _flatten(new)
+    return {name: new_values[name] / old_values[name]
+            for name in sorted(old_values.keys() & new_values.keys()) if old_values[name]}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark-uri Snake")
+    parser.add_argument("--quick", action="store_true", help="dimensiuni mici, pentru o verificare rapida")
+    parser.add_argument("--output", help="fisierul JSON in care se scriu rezultatele")
+    parser.add_argument("--compare", help="rezultatele unei versiuni anterioare, pentru comparatie")
+    args = parser.parse_args(argv)
+
+    results = run_all(quick=args.quick)
+    if args.compare:
+        with open(args.compare) as file:
+            results["ratio_vs_baseline"] = compare(json.load(file), results)
+    text = json.dumps(results, indent=4)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
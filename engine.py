@@ -0,0 +1,624 @@
+import math
+import random
+from array import array
+from collections import deque
+
+UP = "Up"
+DOWN = "Down"
+LEFT = "Left"
+RIGHT = "Right"
+
+DIRECTIONS = {UP: (0, -1), DOWN: (0, 1), LEFT: (-1, 0), RIGHT: (1, 0)}
+OPPOSITE = {UP: DOWN, DOWN: UP, LEFT: RIGHT, RIGHT: LEFT}
+
+MOVED = "moved"
+ATE = "ate"
+WALL = "wall"
+SELF = "self"
+OBSTACLE = "obstacle"
+WON = "won"
+
+CELL_EMPTY = 0
+CELL_SNAKE = 1
+CELL_OBSTACLE = 2
+
+# Peste acest numar de celule, make_engine foloseste SparseSnakeEngine: harta densa si indexul celulelor libere ar
+# ocupa sute de MB pe o arena de 10.000 x 10.000.
+SPARSE_CELLS = 1 << 22
+
+
+def make_engine(cols, rows, obstacles=(), seed=None):
+    """
+        Creează motorul potrivit pentru dimensiunea tablei: SnakeEngine sau, pentru table foarte mari,
+        SparseSnakeEngine.
+
+        Args:
+            cols (int): Numărul de coloane ale tablei.
+            rows (int): Numărul de rânduri ale tablei.
+            obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+            seed (int): Sămânța primului joc (opțional).
+
+        Returns:
+            SnakeEngine: Motorul jocului.
+    """
+    engine_class = SparseSnakeEngine if cols * rows > SPARSE_CELLS else SnakeEngine
+    return engine_class(cols, rows, obstacles, seed=seed)
+
+
+class SnakeEngine:
+    """
+    Motorul jocului Snake, independent de Tkinter.
+
+    Contine toate regulile jocului (miscarea, coliziunile cu marginile, cu propriul corp si cu obstacolele,
+    mancarea si scorul) si lucreaza in coordonate de celula (coloana, rand), nu in pixeli. Poate fi rulat pe
+    servere fara display pentru boti, reluari si teste de incarcare; SnakeGame il foloseste doar pentru desenare.
+
+    Atribute:
+
+    • cols: int - numarul de coloane ale tablei
+    • rows: int - numarul de randuri ale tablei
+    • obstacles: list - lista de celule (coloana, rand) ocupate de obstacole
+    • grid: bytearray - harta de ocupare a tablei, cate un octet (CELL_EMPTY, CELL_SNAKE, CELL_OBSTACLE) pentru
+      fiecare celula, la indexul rand * cols + coloana
+    • rng: obiect de tip random.Random - generatorul propriu al jocului, folosit pentru mancare
+    • seed: int - samanta jocului curent; acelasi seed si aceleasi comenzi reproduc exact acelasi joc
+    • snake: deque - celulele segmentelor sarpelui, capul fiind primul; adaugarea capului si scoaterea cozii
+      sunt O(1)
+    • food: tuple - celula in care se afla mancarea sau None daca nu mai exista nicio celula libera
+    • direction: str - directia curenta ("Up", "Down", "Left", "Right") sau None inainte de start
+    • score: int - scorul curent
+    • game_over: bool - True daca jocul s-a terminat, False altfel
+    • last_tail: tuple - celula eliberata de coada la ultimul tick, sau None daca sarpele a crescut
+    • cause: str - cauza terminarii jocului (WALL, SELF, OBSTACLE sau WON cand tabla s-a umplut) sau None
+
+    Metode:
+
+    • spawn_cells(cols, rows) - celulele in care apare sarpele la inceputul jocului
+    • reset(seed=None) - readuce sarpele in pozitia initiala si genereaza mancarea
+    • turn(direction) - schimba directia, fara a permite intoarcerea directa inapoi
+    • step(direction=None) - avanseaza jocul cu un tick
+    • generate_food() - genereaza mancarea
+    • snapshot() - salveaza starea jocului intr-un EngineState
+    • restore(state) - readuce jocul la o stare salvata cu snapshot
+    • clone() - un motor nou, independent, in aceeasi stare, care imparte obstacolele cu cel curent
+
+    """
+
+    # Randul 0 este rezervat: in jocul original orice y < block_size era coliziune cu marginea.
+    FIRST_ROW = 1
+    # Mancarea apare doar intre randurile FOOD_FIRST_ROW si rows - FOOD_BOTTOM_MARGIN, ca in generate_food.
+    FOOD_FIRST_ROW = 2
+    FOOD_BOTTOM_MARGIN = 3
+    # Atributele fixe ale nivelului, comune motorului si tuturor clonelor lui; clone() nu le copiaza.
+    SHARED = ("cols", "rows", "obstacles", "_obstacle_grid", "_spawnable")
+
+    def __init__(self, cols, rows, obstacles=(), seed=None):
+        """
+            Inițializează motorul jocului.
+
+            Args:
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+                obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+                seed (int): Sămânța primului joc (opțional); implicit una aleatoare.
+        """
+        self.cols = cols
+        self.rows = rows
+        self.obstacles = list(obstacles)
+        self.rng = random.Random()
+
+        self._obstacle_grid = bytearray(cols * rows)
+        for col, row in self.obstacles:
+            if 0 <= col < cols and 0 <= row < rows:
+                self._obstacle_grid[row * cols + col] = CELL_OBSTACLE
+        self.grid = bytearray(self._obstacle_grid)
+
+        # Celulele in care poate aparea mancarea: zona de mancare fara obstacole.
+        self._spawnable = bytearray(cols * rows)
+        last_food_row = rows - self.FOOD_BOTTOM_MARGIN
+        for index in range(self.FOOD_FIRST_ROW * cols, min(last_food_row + 1, rows) * cols):
+            if self._obstacle_grid[index] == CELL_EMPTY:
+                self._spawnable[index] = 1
+        # Indexul celulelor libere: lista celulelor + pozitia fiecarei celule in lista (-1 daca nu este libera).
+        # Sunt tablouri array("i"), nu liste, ca o copie (snapshot, clone) sa fie o simpla copiere de memorie.
+        self._free = array("i")
+        self._free_pos = array("i", [-1]) * (cols * rows)
+        self.reset(seed)
+
+    @property
+    def rng(self):
+        """
+            Generatorul propriu al jocului.
+
+            O clonă primește doar starea generatorului părintelui și își construiește propriul generator abia la
+            prima folosire, deoarece copierea stării unui random.Random costă mai mult decât restul clonei.
+        """
+        if self._rng_state is not None:
+            if self._rng_pending:
+                if self._rng is None:
+                    self._rng = random.Random(0)
+                self._rng.setstate(self._rng_state)
+                self._rng_pending = False
+            # Cine cere generatorul poate extrage numere din el, deci starea memorata nu mai este valabila.
+            self._rng_state = None
+        return self._rng
+
+    @rng.setter
+    def rng(self, value):
+        self._rng = value
+        self._rng_state = None
+        self._rng_pending = False
+
+    def _rng_snapshot(self):
+        """
+            Returnează starea generatorului, memorată până la următoarea folosire a lui `rng`, astfel încât mai
+            multe clone sau snapshot-uri făcute între două tick-uri să citească starea o singură dată.
+        """
+        if self._rng_state is None:
+            self._rng_state = self._rng.getstate()
+        return self._rng_state
+
+    @staticmethod
+    def spawn_cells(cols, rows):
+        """
+            Returnează celulele în care apare șarpele la începutul jocului, capul fiind primul.
+
+            Args:
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+
+            Returns:
+                list of tuple: Celulele (coloană, rând) ale șarpelui inițial.
+        """
+        col, row = cols // 2, rows // 2
+        return [(col, row), (col - 1, row)]
+
+    def reset(self, seed=None):
+        """
+            Resetează starea jocului.
+
+            Șarpele este readus în centrul tablei, cu lungimea 2, scorul devine 0 și se generează mâncarea.
+            Generatorul jocului este reinițializat cu sămânța noului joc, deci fiecare joc poate fi reprodus
+            doar din `seed` și din comenzile primite.
+
+            Args:
+                seed (int): Sămânța noului joc (opțional); implicit este extrasă din generatorul jocului anterior,
+                    astfel că un șir de jocuri pornit cu aceeași sămânță este și el determinist.
+        """
+        if seed is None:
+            seed = self.rng.getrandbits(32)
+        self.seed = seed
+        self.rng.seed(seed)
+
+        self.snake = deque(self.spawn_cells(self.cols, self.rows))
+        self._reset_cells()
+        self.direction = None
+        self.score = 0
+        self.game_over = False
+        self.cause = None
+        self.last_tail = None
+        self.food = self.generate_food()
+
+    def _reset_cells(self):
+        """
+            Readuce harta de ocupare la obstacolele nivelului plus șarpele inițial și reconstruiește indexul
+            celulelor libere.
+        """
+        self.grid[:] = self._obstacle_grid
+        for col, row in self.snake:
+            self.grid[row * self.cols + col] = CELL_SNAKE
+
+        free_pos = self._free_pos
+        for index in self._free:
+            free_pos[index] = -1
+        self._free = array("i", [index for index, spawnable in enumerate(self._spawnable)
+                                 if spawnable and self.grid[index] == CELL_EMPTY])
+        for position, index in enumerate(self._free):
+            free_pos[index] = position
+
+    def turn(self, direction):
+        """
+            Schimbă direcția șarpelui.
+
+            Direcția nu se schimbă dacă cea nouă este opusă direcției curente, pentru ca șarpele să nu se poată
+            întoarce direct în propriul corp.
+
+            Args:
+                direction (str): Direcția nouă ("Up", "Down", "Left", "Right").
+
+            Returns:
+                bool: True dacă direcția a fost acceptată, False altfel.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Directie necunoscuta: {direction!r}")
+        if self.direction is not None and direction == OPPOSITE[self.direction]:
+            return False
+        self.direction = direction
+        return True
+
+    def generate_food(self):
+        """
+            Generează poziția aleatoare pentru mâncarea șarpelui.
+
+            Celula este aleasă din indexul celulelor libere, deci nu se află niciodată pe șarpe sau pe un obstacol,
+            iar alegerea durează O(1) indiferent cât de plină este tabla.
+
+            Returns:
+                tuple: Un tuplu (coloană, rând) reprezentând celula mâncării, sau None dacă nu mai există nicio
+                celulă liberă.
+        """
+        if not self._free:
+            return None
+        index = self._free[self.rng.randrange(len(self._free))]
+        return index % self.cols, index // self.cols
+
+    def _take_cell(self, index):
+        """
+            Scoate o celulă din indexul celulelor libere (swap-remove în O(1)).
+        """
+        position = self._free_pos[index]
+        if position < 0:
+            return
+        last = self._free.pop()
+        if last != index:
+            self._free[position] = last
+            self._free_pos[last] = position
+        self._free_pos[index] = -1
+
+    def _release_cell(self, index):
+        """
+            Adaugă o celulă eliberată în indexul celulelor libere, dacă mâncarea poate apărea acolo.
+        """
+        if self._spawnable[index]:
+            self._free_pos[index] = len(self._free)
+            self._free.append(index)
+
+    def step(self, direction=None):
+        """
+            Avansează jocul cu un tick.
+
+            Mută capul șarpelui în direcția curentă, verifică coliziunile și mănâncă mâncarea dacă este cazul.
+            Dacă jocul s-a terminat deja, starea nu se mai modifică.
+
+            Args:
+                direction (str): Direcția nouă (opțional); este aplicată prin `turn` înainte de mutare.
+
+            Returns:
+                str: MOVED, ATE sau, la sfârșitul jocului, cauza acestuia (WALL, SELF, OBSTACLE, WON).
+
+            Raises:
+                ValueError: Dacă șarpele nu are încă o direcție.
+        """
+        if self.game_over:
+            return self.cause
+        if direction is not None:
+            self.turn(direction)
+        if self.direction is None:
+            raise ValueError("Sarpele nu are inca o directie")
+
+        dx, dy = DIRECTIONS[self.direction]
+        col, row = self.snake[0]
+        col += dx
+        row += dy
+
+        index = row * self.cols + col
+        if col < 0 or col >= self.cols or row < self.FIRST_ROW or row >= self.rows:
+            cause = WALL
+        else:
+            cell = self.grid[index]
+            if cell == CELL_SNAKE:
+                cause = SELF
+            elif cell == CELL_OBSTACLE:
+                cause = OBSTACLE
+            else:
+                cause = None
+        if cause is not None:
+            self.game_over = True
+            self.cause = cause
+            return cause
+
+        self.snake.appendleft((col, row))
+        self.grid[index] = CELL_SNAKE
+        self._take_cell(index)
+
+        if (col, row) == self.food:
+            self.last_tail = None
+            self.score += 1
+            self.food = self.generate_food()
+            if self.food is None:
+                self.game_over = True
+                self.cause = WON
+                return WON
+            return ATE
+        tail_col, tail_row = self.last_tail = self.snake.pop()
+        tail = tail_row * self.cols + tail_col
+        self.grid[tail] = CELL_EMPTY
+        self._release_cell(tail)
+        return MOVED
+
+    def snapshot(self):
+        """
+            Salvează starea jocului.
+
+            Starea salvată nu conține obstacolele și celelalte date fixe ale nivelului, iar harta de ocupare și
+            indexul celulelor libere sunt copiate ca blocuri de memorie, deci un snapshot costă câteva microsecunde.
+
+            Returns:
+                EngineState: Starea curentă a jocului.
+        """
+        return EngineState(self.snake.copy(), self._save_cells(), self.food, self.direction, self.score,
+                           self.game_over, self.cause, self.last_tail, self.seed, self._rng_snapshot())
+
+    def restore(self, state):
+        """
+            Readuce jocul la o stare salvată cu `snapshot`. Starea este copiată, deci poate fi restaurată de
+            oricâte ori.
+
+            Args:
+                state (EngineState): Starea salvată, de la acest motor sau de la o clonă a lui.
+        """
+        self._load_state(state, copy=True)
+
+    def clone(self):
+        """
+            Creează un motor nou, în aceeași stare cu motorul curent.
+
+            Clona împarte cu motorul curent datele fixe ale nivelului (SHARED), fără să le copieze, și are propria
+            hartă de ocupare, propriul șarpe și propriul generator, deci cele două jocuri continuă independent.
+            Pentru aceleași comenzi, clona generează aceeași mâncare ca motorul curent.
+
+            Returns:
+                SnakeEngine: Clona, de același tip cu motorul curent.
+        """
+        twin = object.__new__(type(self))
+        for name in self.SHARED:
+            setattr(twin, name, getattr(self, name))
+        twin._rng = None
+        twin._load_state(self.snapshot(), copy=False)
+        return twin
+
+    def _save_cells(self):
+        """
+            Returnează copii ale hărții de ocupare și ale indexului celulelor libere, pentru `snapshot`.
+        """
+        return self.grid[:], self._free[:], self._free_pos[:]
+
+    def _load_cells(self, cells, copy):
+        """
+            Încarcă harta de ocupare și indexul celulelor libere salvate cu `_save_cells`.
+
+            Args:
+                cells (tuple): Valoarea returnată de `_save_cells`.
+                copy (bool): True dacă datele trebuie copiate, False dacă pot fi preluate (clone).
+        """
+        grid, free, free_pos = cells
+        if copy:
+            # Harta existenta este suprascrisa pe loc, ca referintele la ea (de exemplu vederi NumPy) sa ramana valide.
+            self.grid[:] = grid
+            self._free = free[:]
+            self._free_pos[:] = free_pos
+        else:
+            self.grid, self._free, self._free_pos = grid, free, free_pos
+
+    def _load_state(self, state, copy):
+        """
+            Încarcă o stare salvată cu `snapshot`.
+
+            Args:
+                state (EngineState): Starea salvată.
+                copy (bool): True dacă datele mutabile trebuie copiate, False dacă pot fi preluate (clone).
+        """
+        self.snake = state.snake.copy() if copy else state.snake
+        self._load_cells(state.cells, copy)
+        self.food = state.food
+        self.direction = state.direction
+        self.score = state.score
+        self.game_over = state.game_over
+        self.cause = state.cause
+        self.last_tail = state.last_tail
+        self.seed = state.seed
+        self._rng_state = state.rng_state
+        self._rng_pending = True
+
+
+class EngineState:
+    """
+    Starea unui joc salvata cu SnakeEngine.snapshot si restaurata cu SnakeEngine.restore.
+
+    Contine doar ce se schimba in timpul jocului; obstacolele si celelalte date fixe raman in motor. Foloseste
+    __slots__, deci ocupa putina memorie cand un bot de cautare pastreaza mii de stari.
+
+    Atribute:
+
+    • snake: deque - celulele segmentelor sarpelui, capul fiind primul
+    • cells: tuple - harta de ocupare si indexul celulelor libere, in forma folosita de motorul care a salvat starea
+    • food: tuple - celula mancarii sau None
+    • direction: str - directia curenta sau None
+    • score: int - scorul
+    • game_over: bool - True daca jocul s-a terminat
+    • cause: str - cauza terminarii jocului sau None
+    • last_tail: tuple - celula eliberata de coada la ultimul tick sau None
+    • seed: int - samanta jocului
+    • rng_state: tuple - starea generatorului jocului
+
+    """
+
+    __slots__ = ("snake", "cells", "food", "direction", "score", "game_over", "cause", "last_tail", "seed",
+                 "rng_state")
+
+    def __init__(self, snake, cells, food, direction, score, game_over, cause, last_tail, seed, rng_state):
+        self.snake = snake
+        self.cells = cells
+        self.food = food
+        self.direction = direction
+        self.score = score
+        self.game_over = game_over
+        self.cause = cause
+        self.last_tail = last_tail
+        self.seed = seed
+        self.rng_state = rng_state
+
+
+class SparseGrid:
+    """
+    Harta de ocupare rara: sunt pastrate doar celulele ocupate, intr-un dict index -> valoare.
+
+    Se foloseste ca bytearray-ul din SnakeEngine (grid[index] citeste, grid[index] = valoare scrie), dar memoria
+    depinde de numarul de celule ocupate, nu de dimensiunea tablei.
+
+    Metode:
+
+    • load(cells) - inlocuieste continutul hartii cu celulele date
+
+    """
+
+    def __init__(self, size, cells=None):
+        self._size = size
+        self._cells = dict(cells or {})
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, index):
+        return self._cells.get(index, CELL_EMPTY)
+
+    def __setitem__(self, index, value):
+        if value == CELL_EMPTY:
+            self._cells.pop(index, None)
+        else:
+            self._cells[index] = value
+
+    def load(self, cells):
+        """
+            Înlocuiește conținutul hărții.
+
+            Args:
+                cells (dict): Celulele ocupate, index -> valoare.
+        """
+        self._cells = dict(cells)
+
+
+class SparseSnakeEngine(SnakeEngine):
+    """
+    Varianta SnakeEngine pentru table uriase (de exemplu 10.000 x 10.000 de celule).
+
+    Regulile sunt aceleasi, dar harta de ocupare este un SparseGrid, iar in locul indexului celulelor libere se
+    pastreaza doar numarul lor, total si pe blocuri de aproximativ sqrt(n) celule ale zonei de mancare: mancarea
+    este plasata prin esantionare cu respingere, care reuseste aproape mereu din prima incercare cand tabla este in
+    mare parte libera, iar pe tabla aproape plina este aleasa prin numaratoarea pe blocuri, in O(sqrt(n)). Din acest
+    motiv sirul pozitiilor mancarii difera de cel al SnakeEngine pentru acelasi seed.
+
+    Atribute:
+
+    • grid: obiect de tip SparseGrid - harta de ocupare a tablei
+
+    """
+
+    # Numarul de incercari aleatoare de plasare a mancarii inainte de cautarea exacta a celulelor libere.
+    SPAWN_ATTEMPTS = 64
+    SHARED = ("cols", "rows", "obstacles", "_obstacle_cells", "_zone_start", "_zone_end", "_spawnable_count",
+              "_block_size", "_block_spawnable")
+
+    def __init__(self, cols, rows, obstacles=(), seed=None):
+        """
+            Inițializează motorul jocului.
+
+            Args:
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+                obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+                seed (int): Sămânța primului joc (opțional); implicit una aleatoare.
+        """
+        self.cols = cols
+        self.rows = rows
+        self.obstacles = list(obstacles)
+        self.rng = random.Random()
+
+        self._obstacle_cells = {}
+        for col, row in self.obstacles:
+            if 0 <= col < cols and 0 <= row < rows:
+                self._obstacle_cells[row * cols + col] = CELL_OBSTACLE
+        self.grid = SparseGrid(cols * rows, self._obstacle_cells)
+
+        # Zona de mancare este intervalul de indecsi [_zone_start, _zone_end), fara obstacole.
+        last_food_row = min(rows - self.FOOD_BOTTOM_MARGIN, rows - 1)
+        self._zone_start = self.FOOD_FIRST_ROW * cols
+        self._zone_end = max(self._zone_start, (last_food_row + 1) * cols)
+        self._spawnable_count = self._zone_end - self._zone_start - sum(
+            1 for index in self._obstacle_cells if self._zone_start <= index < self._zone_end)
+        # Numarul celulelor libere ale fiecarui bloc din zona de mancare, pentru alegerea exacta din generate_food.
+        size = self._zone_end - self._zone_start
+        self._block_size = max(1, math.isqrt(size))
+        self._block_spawnable = array("q", (min(self._block_size, size - start)
+                                            for start in range(0, size, self._block_size)))
+        for index in self._obstacle_cells:
+            if self._zone_start <= index < self._zone_end:
+                self._block_spawnable[(index - self._zone_start) // self._block_size] -= 1
+        self._free_count = 0
+        self._block_free = None
+        self.reset(seed)
+
+    def _reset_cells(self):
+        self.grid.load(self._obstacle_cells)
+        self._free_count = self._spawnable_count
+        self._block_free = array("q", self._block_spawnable)
+        for col, row in self.snake:
+            index = row * self.cols + col
+            self.grid[index] = CELL_SNAKE
+            self._take_cell(index)
+
+    def _save_cells(self):
+        return dict(self.grid._cells), self._free_count, self._block_free[:]
+
+    def _load_cells(self, cells, copy):
+        occupied, self._free_count, block_free = cells
+        if copy:
+            self.grid.load(occupied)
+            self._block_free = block_free[:]
+        else:
+            self.grid = SparseGrid(self.cols * self.rows)
+            self.grid._cells = occupied
+            self._block_free = block_free
+
+    def _take_cell(self, index):
+        if self._zone_start <= index < self._zone_end:
+            self._free_count -= 1
+            self._block_free[(index - self._zone_start) // self._block_size] -= 1
+
+    def _release_cell(self, index):
+        if self._zone_start <= index < self._zone_end:
+            self._free_count += 1
+            self._block_free[(index - self._zone_start) // self._block_size] += 1
+
+    def generate_food(self):
+        """
+            Generează poziția aleatoare pentru mâncarea șarpelui.
+
+            Încearcă celule aleatoare din zona de mâncare până găsește una liberă; dacă tabla este aproape plină,
+            alege exact una dintre celulele libere rămase: numărătoarea pe blocuri găsește blocul care o conține,
+            care este apoi parcurs, deci alegerea costă O(sqrt(n)) pentru o zonă de n celule, nu O(n).
+
+            Returns:
+                tuple: Un tuplu (coloană, rând) reprezentând celula mâncării, sau None dacă nu mai există nicio
+                celulă liberă.
+        """
+        if self._free_count <= 0:
+            return None
+        start, size = self._zone_start, self._zone_end - self._zone_start
+        for _ in range(self.SPAWN_ATTEMPTS):
+            index = start + self.rng.randrange(size)
+            if self.grid[index] == CELL_EMPTY:
+                return index % self.cols, index // self.cols
+        rank = self.rng.randrange(self._free_count)
+        for block, free in enumerate(self._block_free):
+            if rank < free:
+                break
+            rank -= free
+        start += block * self._block_size
+        cells = self.grid._cells
+        for index in range(start, min(start + self._block_size, self._zone_end)):
+            if index not in cells:
+                if rank == 0:
+                    return index % self.cols, index // self.cols
+                rank -= 1
+        raise RuntimeError("Numaratoarea celulelor libere nu corespunde hartii de ocupare")
@@ -0,0 +1,363 @@
+import numpy as np
+
+from batch import ACTIONS, RESULTS, BatchEngine
+from engine import SnakeEngine, MOVED, ATE, WALL, SELF, OBSTACLE, WON, CELL_OBSTACLE
+from levels import LEVEL_CONFIG, load_level_pack
+
+# gymnasium este optional: fara el mediile au aceeasi interfata (reset, step), dar nu si spatiile de observatii si
+# de actiuni.
+try:
+    import gymnasium as gym
+    from gymnasium import spaces
+except ImportError:
+    gym = None
+    spaces = None
+
+# Recompensele implicite pentru fiecare rezultat al unui tick.
+REWARDS = {MOVED: 0.0, ATE: 1.0, WALL: -1.0, SELF: -1.0, OBSTACLE: -1.0, WON: 10.0}
+# Cat se adauga la recompensa in distance_reward pentru fiecare celula cu care capul se apropie de mancare.
+DISTANCE_REWARD = 0.01
+
+
+def default_reward(engine, result):
+    """
+        Recompensa implicită a unui tick: valoarea din REWARDS pentru rezultatul lui.
+
+        Args:
+            engine (SnakeEngine): Motorul jocului, după tick.
+            result (str): Rezultatul tick-ului (MOVED, ATE, WALL, SELF, OBSTACLE, WON).
+
+        Returns:
+            float: Recompensa.
+    """
+    return REWARDS[result]
+
+
+def distance_reward(engine, result):
+    """
+        Recompensa implicită plus un termen mic pentru apropierea capului de mâncare (distanța Manhattan).
+
+        Args:
+            engine (SnakeEngine): Motorul jocului, după tick.
+            result (str): Rezultatul tick-ului.
+
+        Returns:
+            float: Recompensa.
+    """
+    reward = REWARDS[result]
+    if result == MOVED and engine.food is not None:
+        food_col, food_row = engine.food
+        (col, row), (previous_col, previous_row) = engine.snake[0], engine.snake[1]
+        before = abs(previous_col - food_col) + abs(previous_row - food_row)
+        after = abs(col - food_col) + abs(row - food_row)
+        reward += DISTANCE_REWARD * (before - after)
+    return reward
+
+
+def _level_board(level, obstacles_file, block_size):
+    """
+        Returnează dimensiunile tablei și obstacolele unui nivel din fișierul de nivele.
+
+        Raises:
+            ValueError: Dacă nivelul nu este unul din LEVEL_CONFIG.
+    """
+    if level not in LEVEL_CONFIG:
+        raise ValueError(f"Nivel necunoscut: {level!r}")
+    pack = load_level_pack(obstacles_file, block_size)
+    return pack.cols, pack.rows, pack.level(level).obstacles()
+
+
+def _observation_space(shape, cols, rows):
+    """
+        Returnează spațiul observațiilor (gymnasium) pentru hărți de forma `shape` + (rows, cols).
+    """
+    cells = cols * rows
+    return spaces.Dict({
+        "grid": spaces.Box(0, CELL_OBSTACLE, shape + (rows, cols), dtype=np.uint8),
+        "head": spaces.Box(-1, cells - 1, shape, dtype=np.int32),
+        "food": spaces.Box(-1, cells - 1, shape, dtype=np.int32),
+    })
+
+
+class SnakeEnv(gym.Env if gym is not None else object):
+    """
+    Mediu de invatare prin recompensa (interfata gymnasium) pentru un joc Snake, peste SnakeEngine.
+
+    Actiunile sunt indecsi in ACTIONS (Up, Down, Left, Right); ca in joc, o actiune opusa directiei curente este
+    ignorata. Observatia este un dict cu:
+
+    • "grid": ndarray (rows, cols) uint8 - harta de ocupare a motorului (CELL_EMPTY, CELL_SNAKE, CELL_OBSTACLE)
+    • "head": ndarray () int32 - celula capului, ca rand * cols + coloana
+    • "food": ndarray () int32 - celula mancarii sau -1
+
+    "grid" este o vedere NumPy peste bytearray-ul motorului, nu o copie, iar "head" si "food" sunt tablouri
+    actualizate pe loc: reset si step returneaza mereu acelasi dict, fara nicio alocare. Cine pastreaza observatii
+    (de exemplu intr-un replay buffer) trebuie sa le copieze.
+
+    Atribute:
+
+    • engine: obiect de tip SnakeEngine - jocul
+    • reward_fn: callable - functia (engine, result) -> float care calculeaza recompensa unui tick
+    • max_ticks: int - numarul de tick-uri dupa care jocul este trunchiat
+    • ticks: int - numarul de tick-uri ale jocului curent
+    • config: dict - configuratia nivelului din LEVEL_CONFIG, sau None
+    • observation_space, action_space: spatiile gymnasium (doar daca gymnasium este instalat)
+
+    Metode:
+
+    • from_level(level, obstacles_file, block_size, **options) - creeaza mediul pentru un nivel din fisier
+    • reset(seed=None, options=None) - incepe un joc nou
+    • step(action) - avanseaza jocul cu un tick
+
+    """
+
+    metadata = {"render_modes": []}
+
+    def __init__(self, cols, rows, obstacles=(), reward_fn=default_reward, max_ticks=10000, config=None):
+        """
+            Inițializează mediul.
+
+            Args:
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+                obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+                reward_fn (callable): Funcția (engine, result) -> float care calculează recompensa unui tick.
+                max_ticks (int): Numărul de tick-uri după care jocul este trunchiat.
+                config (dict): Configurația nivelului din LEVEL_CONFIG (opțional).
+        """
+        self.engine = SnakeEngine(cols, rows, obstacles)
+        self.reward_fn = reward_fn
+        self.max_ticks = max_ticks
+        self.config = config
+        self.ticks = 0
+        self._head = np.zeros((), dtype=np.int32)
+        self._food = np.zeros((), dtype=np.int32)
+        self._observation = {
+            "grid": np.frombuffer(self.engine.grid, dtype=np.uint8).reshape(rows, cols),
+            "head": self._head,
+            "food": self._food,
+        }
+        if gym is not None:
+            self.observation_space = _observation_space((), cols, rows)
+            self.action_space = spaces.Discrete(len(ACTIONS))
+
+    @classmethod
+    def from_level(cls, level, obstacles_file="tabla.json", block_size=20, **options):
+        """
+            Creează mediul pentru un nivel din fișierul de nivele.
+
+            Args:
+                level (str): Nivelul de dificultate ("usor", "normal", "hardcore").
+                obstacles_file (str): Calea către fișierul JSON cu nivelele.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                **options: Celelalte argumente ale constructorului (reward_fn, max_ticks).
+
+            Returns:
+                SnakeEnv: Mediul pentru nivelul cerut.
+
+            Raises:
+                ValueError: Dacă nivelul nu este unul din LEVEL_CONFIG.
+        """
+        cols, rows, obstacles = _level_board(level, obstacles_file, block_size)
+        return cls(cols, rows, obstacles, config=LEVEL_CONFIG[level], **options)
+
+    def reset(self, seed=None, options=None):
+        """
+            Începe un joc nou.
+
+            Args:
+                seed (int): Sămânța jocului (opțional); același seed și aceleași acțiuni reproduc același joc.
+                options (dict): Ignorat; există pentru compatibilitatea cu gymnasium.
+
+            Returns:
+                tuple: (observație, info).
+        """
+        if gym is not None:
+            super().reset(seed=seed)
+        self.engine.reset(seed)
+        self.ticks = 0
+        self._update_observation()
+        return self._observation, {"score": 0, "seed": self.engine.seed}
+
+    def step(self, action):
+        """
+            Avansează jocul cu un tick.
+
+            Args:
+                action (int): Acțiunea, ca index în ACTIONS.
+
+            Returns:
+                tuple: (observație, recompensă, terminat, trunchiat, info); info conține rezultatul tick-ului
+                ("result") și scorul ("score").
+        """
+        engine = self.engine
+        result = engine.step(ACTIONS[action])
+        self.ticks += 1
+        self._update_observation()
+        return (self._observation, self.reward_fn(engine, result), engine.game_over,
+                self.ticks >= self.max_ticks and not engine.game_over, {"result": result, "score": engine.score})
+
+    def _update_observation(self):
+        """
+            Actualizează pe loc celulele capului și mâncării din observație.
+        """
+        engine = self.engine
+        col, row = engine.snake[0]
+        self._head[()] = row * engine.cols + col
+        self._food[()] = -1 if engine.food is None else engine.food[1] * engine.cols + engine.food[0]
+
+
+class VectorSnakeEnv:
+    """
+    Varianta vectorizata a SnakeEnv: n jocuri pe aceeasi tabla, avansate impreuna de BatchEngine.
+
+    Observatia are aceleasi chei ca in SnakeEnv, cu o dimensiune in plus pentru joc: "grid" (n, rows, cols) este o
+    vedere peste BatchEngine.grid, "food" este chiar BatchEngine.food, iar "head" (n,) este actualizat pe loc.
+    Recompensele sunt citite dintr-un tabel indexat cu codul rezultatului (RESULTS) sau, ca in SnakeEnv, calculate
+    de o functie reward_fn, aici vectorizata: primeste BatchEngine-ul si codurile rezultatelor tuturor jocurilor.
+    Jocurile terminate sau trunchiate sunt resetate automat la sfarsitul aceluiasi step; scorul lor final este in
+    info["score"].
+
+    Atribute:
+
+    • engine: obiect de tip BatchEngine - jocurile
+    • num_envs: int - numarul de jocuri
+    • rewards: ndarray float32 - recompensa fiecarui rezultat, ca index in RESULTS
+    • reward_fn: callable - functia (engine, results) -> recompensele celor n jocuri, sau None pentru tabelul rewards
+    • max_ticks: int - numarul de tick-uri dupa care un joc este trunchiat
+    • ticks: ndarray (n,) int32 - numarul de tick-uri ale fiecarui joc
+    • config: dict - configuratia nivelului din LEVEL_CONFIG, sau None
+    • observation_space, action_space: spatiile gymnasium ale tuturor jocurilor (doar daca gymnasium este instalat)
+    • single_observation_space, single_action_space: spatiile unui singur joc
+
+    Metode:
+
+    • from_level(n, level, obstacles_file, block_size, **options) - creeaza mediul pentru un nivel din fisier
+    • reset(seed=None, options=None) - reseteaza toate jocurile
+    • step(actions) - avanseaza toate jocurile cu un tick
+
+    """
+
+    def __init__(self, n, cols, rows, obstacles=(), rewards=None, reward_fn=None, max_ticks=10000, config=None,
+                 seed=None):
+        """
+            Inițializează mediul.
+
+            Args:
+                n (int): Numărul de jocuri.
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+                obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+                rewards (dict): Recompensa fiecărui rezultat (opțional); implicit REWARDS.
+                reward_fn (callable): Funcția (engine, results) -> array (n,) care calculează recompensele unui tick
+                    (opțional); primește BatchEngine-ul după tick, înaintea resetării jocurilor terminate, și codurile
+                    rezultatelor, ca index în RESULTS. Dacă este dată, tabelul `rewards` nu este folosit.
+                max_ticks (int): Numărul de tick-uri după care un joc este trunchiat.
+                config (dict): Configurația nivelului din LEVEL_CONFIG (opțional).
+                seed (int): Sămânța generatorului de numere aleatoare (opțional).
+        """
+        self.engine = BatchEngine(n, cols, rows, obstacles, seed=seed)
+        self.num_envs = n
+        rewards = REWARDS if rewards is None else rewards
+        self.rewards = np.array([rewards[result] for result in RESULTS], dtype=np.float32)
+        self.reward_fn = reward_fn
+        self.max_ticks = max_ticks
+        self.config = config
+        self.ticks = np.zeros(n, dtype=np.int32)
+
+        self._reward = np.zeros(n, dtype=np.float32)
+        self._terminated = np.zeros(n, dtype=bool)
+        self._score = np.zeros(n, dtype=np.int32)
+        self._truncated = np.zeros(n, dtype=bool)
+        self._finished = np.zeros(n, dtype=bool)
+        self._head = np.zeros(n, dtype=np.int32)
+        self._head_index = np.zeros(n, dtype=np.intp)
+        self._head_offsets = np.arange(n, dtype=np.intp) * (cols * rows)
+        self._body = self.engine.body.reshape(-1)
+        self._observation = {
+            "grid": self.engine.grid.reshape(n, rows, cols),
+            "head": self._head,
+            "food": self.engine.food,
+        }
+        if gym is not None:
+            self.single_observation_space = _observation_space((), cols, rows)
+            self.single_action_space = spaces.Discrete(len(ACTIONS))
+            self.observation_space = _observation_space((n,), cols, rows)
+            self.action_space = spaces.MultiDiscrete([len(ACTIONS)] * n)
+
+    @classmethod
+    def from_level(cls, n, level, obstacles_file="tabla.json", block_size=20, **options):
+        """
+            Creează mediul pentru un nivel din fișierul de nivele.
+
+            Args:
+                n (int): Numărul de jocuri.
+                level (str): Nivelul de dificultate ("usor", "normal", "hardcore").
+                obstacles_file (str): Calea către fișierul JSON cu nivelele.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                **options: Celelalte argumente ale constructorului (rewards, reward_fn, max_ticks, seed).
+
+            Returns:
+                VectorSnakeEnv: Mediul pentru nivelul cerut.
+
+            Raises:
+                ValueError: Dacă nivelul nu este unul din LEVEL_CONFIG.
+        """
+        cols, rows, obstacles = _level_board(level, obstacles_file, block_size)
+        return cls(n, cols, rows, obstacles, config=LEVEL_CONFIG[level], **options)
+
+    def reset(self, seed=None, options=None):
+        """
+            Resetează toate jocurile.
+
+            Args:
+                seed (int): Sămânța nouă a generatorului de numere aleatoare (opțional).
+                options (dict): Ignorat; există pentru compatibilitatea cu gymnasium.
+
+            Returns:
+                tuple: (observație, info).
+        """
+        if seed is not None:
+            self.engine.rng = np.random.default_rng(seed)
+        self.engine.reset()
+        self.ticks[:] = 0
+        self._update_heads()
+        return self._observation, {}
+
+    def step(self, actions):
+        """
+            Avansează toate jocurile cu un tick și resetează jocurile terminate sau trunchiate.
+
+            Args:
+                actions (array-like): Câte o acțiune pentru fiecare joc, ca index în ACTIONS.
+
+            Returns:
+                tuple: (observație, recompense, terminate, trunchiate, info); info conține rezultatul fiecărui joc
+                ("result", ca index în RESULTS) și scorul de dinaintea resetării ("score").
+        """
+        engine = self.engine
+        results = engine.step(actions)
+        self.ticks += 1
+        if self.reward_fn is not None:
+            self._reward[:] = self.reward_fn(engine, results)
+        else:
+            np.take(self.rewards, results, out=self._reward, mode="clip")
+        np.copyto(self._terminated, engine.done)
+        np.greater_equal(self.ticks, self.max_ticks, out=self._truncated)
+        self._truncated &= ~self._terminated
+        np.copyto(self._score, engine.score)
+
+        np.logical_or(self._terminated, self._truncated, out=self._finished)
+        if self._finished.any():
+            engine.reset(self._finished)
+            self.ticks[self._finished] = 0
+        self._update_heads()
+        return (self._observation, self._reward, self._terminated, self._truncated,
+                {"result": results, "score": self._score})
+
+    def _update_heads(self):
+        """
+            Actualizează pe loc celulele capetelor din observație.
+        """
+        np.add(self._head_offsets, self.engine.head_ptr, out=self._head_index)
+        np.take(self._body, self._head_index, out=self._head, mode="clip")
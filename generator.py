@@ -0,0 +1,170 @@
+import argparse
+import base64
+import json
+import random
+from collections import deque
+from functools import lru_cache
+
+from engine import SnakeEngine
+from levels import OBSTACLE_ROW_OFFSET, encode_bitmap
+
+DEFAULT_DENSITIES = {"usor": 0.03, "normal": 0.08, "hardcore": 0.15}
+
+_FREE = 0
+_WALL = 1
+_BORDER = 2
+
+
+@lru_cache(maxsize=16)
+def _adjacency(cols, rows):
+    """
+        Returns:
+            tuple: Pentru fiecare celulă, tuplul vecinilor ei (sus, jos, stânga, dreapta) aflați pe tablă.
+    """
+    cells = cols * rows
+    neighbours = []
+    for index in range(cells):
+        col = index % cols
+        around = []
+        if index >= cols:
+            around.append(index - cols)
+        if index + cols < cells:
+            around.append(index + cols)
+        if col > 0:
+            around.append(index - 1)
+        if col < cols - 1:
+            around.append(index + 1)
+        neighbours.append(tuple(around))
+    return tuple(neighbours)
+
+
+def _flood(board, start, adjacency, visited):
+    """
+        Marchează în `visited` toate celulele libere accesibile din `start`.
+    """
+    stack = [start]
+    visited[start] = 1
+    while stack:
+        for neighbour in adjacency[stack.pop()]:
+            if not visited[neighbour] and board[neighbour] == _FREE:
+                visited[neighbour] = 1
+                stack.append(neighbour)
+
+
+def _open_path(board, visited, adjacency):
+    """
+        Găsește cel mai scurt drum prin obstacole de la zona accesibilă la o celulă liberă inaccesibilă și elimină
+        obstacolele de pe el.
+
+        Returns:
+            int: Prima celulă a drumului, vecină cu zona accesibilă, de unde flood-fill-ul trebuie continuat.
+    """
+    parent = {}
+    queue = deque()
+    for index in range(len(board)):
+        if visited[index]:
+            for neighbour in adjacency[index]:
+                if board[neighbour] == _WALL and neighbour not in parent:
+                    parent[neighbour] = None
+                    queue.append(neighbour)
+    while queue:
+        index = queue.popleft()
+        for neighbour in adjacency[index]:
+            if board[neighbour] == _FREE and not visited[neighbour]:
+                while True:
+                    board[index] = _FREE
+                    if parent[index] is None:
+                        return index
+                    index = parent[index]
+            if board[neighbour] == _WALL and neighbour not in parent:
+                parent[neighbour] = index
+                queue.append(neighbour)
+    raise RuntimeError("Zona inaccesibila nu poate fi conectata")
+
+
+def generate_obstacles(cols, rows, density, seed=None):
+    """
+        Generează obstacolele unui nivel, garantând că orice celulă liberă este accesibilă din poziția de start.
+
+        Obstacolele sunt puse aleator, cu densitatea cerută, doar în rândurile care pot fi descrise în fișierul de
+        nivele (de la OBSTACLE_ROW_OFFSET în jos), niciodată pe șarpele inițial sau lângă capul lui. Apoi un
+        flood-fill din poziția de start a șarpelui verifică faptul că fiecare celulă liberă este accesibilă;
+        buzunarele închise sunt deschise prin eliminarea celor mai puține obstacole posibile. Astfel mâncarea nu
+        poate apărea niciodată într-o zonă în care șarpele nu poate ajunge.
+
+        Args:
+            cols (int): Numărul de coloane ale tablei.
+            rows (int): Numărul de rânduri ale tablei.
+            density (float): Fracțiunea celulelor eligibile ocupate de obstacole, între 0 și 1.
+            seed (int): Sămânța generatorului (opțional); aceeași sămânță produce același nivel.
+
+        Returns:
+            list of tuple: Celulele (coloană, rând) ocupate de obstacole, în coordonatele motorului.
+    """
+    if not 0 <= density < 1:
+        raise ValueError("Densitatea trebuie sa fie intre 0 si 1")
+    rng = random.Random(seed)
+    cells = cols * rows
+    first_row = max(SnakeEngine.FIRST_ROW, OBSTACLE_ROW_OFFSET)
+    adjacency = _adjacency(cols, rows)
+
+    board = bytearray(cells)
+    board[:SnakeEngine.FIRST_ROW * cols] = bytes([_BORDER]) * (SnakeEngine.FIRST_ROW * cols)
+    spawn = [row * cols + col for col, row in SnakeEngine.spawn_cells(cols, rows)]
+    protected = set(spawn) | set(adjacency[spawn[0]])
+    candidates = [index for index in range(first_row * cols, cells) if index not in protected]
+    for index in rng.sample(candidates, int(len(candidates) * density)):
+        board[index] = _WALL
+
+    visited = bytearray(cells)
+    _flood(board, spawn[0], adjacency, visited)
+    # Fiecare buzunar inaccesibil este legat de zona accesibila; drumul deschis si buzunarul sunt apoi marcate
+    # printr-un nou flood-fill, pornit de la capatul drumului.
+    for index in range(cells):
+        while board[index] == _FREE and not visited[index]:
+            _flood(board, _open_path(board, visited, adjacency), adjacency, visited)
+
+    return [(index % cols, index // cols) for index in range(cells) if board[index] == _WALL]
+
+
+def generate_level_pack(cols, rows, block_size=20, densities=None, seed=None):
+    """
+        Generează un set complet de nivele, în formatul fișierului tabla.json (obstacole ca bitmap compact).
+
+        Args:
+            cols (int): Numărul de coloane ale tablei.
+            rows (int): Numărul de rânduri ale tablei.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+            densities (dict): Densitatea obstacolelor pentru fiecare nivel; implicit DEFAULT_DENSITIES.
+            seed (int): Sămânța generatorului (opțional).
+
+        Returns:
+            dict: Datele nivelelor, care pot fi salvate ca JSON și încărcate cu `levels.load_level_pack`.
+    """
+    rng = random.Random(seed)
+    densities = densities if densities is not None else DEFAULT_DENSITIES
+    height = rows - OBSTACLE_ROW_OFFSET
+    levels = {}
+    for name, density in densities.items():
+        obstacles = generate_obstacles(cols, rows, density, seed=rng.getrandbits(32))
+        bits = encode_bitmap([(col, row - OBSTACLE_ROW_OFFSET) for col, row in obstacles], cols, height)
+        levels[name] = {"bitmap": {"latime": cols, "inaltime": height, "date": base64.b64encode(bits).decode("ascii")}}
+    return {"dimensiuniTabla": {"width": cols * block_size, "height": rows * block_size}, "nivele": levels}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generator de nivele Snake")
+    parser.add_argument("--output", required=True, help="fisierul JSON generat")
+    parser.add_argument("--cols", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=30)
+    parser.add_argument("--block-size", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    data = generate_level_pack(args.cols, args.rows, args.block_size, seed=args.seed)
+    with open(args.output, "w") as file:
+        json.dump(data, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+import time
+from collections import deque
+
+from engine import DIRECTIONS, OPPOSITE
+from scheduler import TickStats
+
+
+class InputQueue:
+    """
+    Coada comenzilor de directie, consumata de bucla jocului cate o comanda pe tick.
+
+    Apasarile de taste nu mai schimba directia imediat, ci sunt puse in coada impreuna cu momentul apasarii. La
+    fiecare tick se aplica prima comanda valida fata de directia aplicata la tick-ul anterior, deci doua apasari
+    rapide (de exemplu W apoi A cand sarpele merge spre dreapta) se aplica pe doua tick-uri consecutive in loc sa
+    intoarca sarpele in propriul corp, iar o apasare rapida nu mai este pierduta.
+
+    Atribute:
+
+    • maxlen: int - numarul maxim de comenzi in asteptare; comenzile peste limita sunt ignorate
+    • clock: callable - ceasul folosit pentru latenta (implicit time.perf_counter)
+    • latency: obiect de tip TickStats - latenta comenzilor aplicate, de la apasare la tick-ul in care au efect
+    • dropped: int - numarul de comenzi ignorate pentru ca coada era plina
+    • rejected: int - numarul de comenzi ignorate pentru ca erau opuse directiei curente
+
+    Metode:
+
+    • push(direction) - adauga o comanda in coada
+    • pop(current) - scoate comanda care se aplica la tick-ul curent
+    • clear() - goleste coada
+    • summary() - dictionar cu statisticile comenzilor, in milisecunde
+
+    """
+
+    def __init__(self, maxlen=3, clock=time.perf_counter):
+        self.maxlen = maxlen
+        self.clock = clock
+        self.latency = TickStats()
+        self.dropped = 0
+        self.rejected = 0
+        self._pending = deque()
+
+    def __len__(self):
+        return len(self._pending)
+
+    def push(self, direction):
+        """
+            Adaugă o comandă în coadă, marcată cu momentul apăsării.
+
+            O comandă identică cu ultima din coadă (de exemplu repetarea automată a unei taste ținute apăsate) nu
+            mai este adăugată.
+
+            Args:
+                direction (str): Direcția cerută ("Up", "Down", "Left", "Right").
+
+            Returns:
+                bool: True dacă comanda a fost adăugată, False altfel.
+
+            Raises:
+                ValueError: Dacă direcția nu este validă.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Directie necunoscuta: {direction!r}")
+        if self._pending and self._pending[-1][0] == direction:
+            return False
+        if len(self._pending) >= self.maxlen:
+            self.dropped += 1
+            return False
+        self._pending.append((direction, self.clock()))
+        return True
+
+    def pop(self, current):
+        """
+            Scoate din coadă comanda care se aplică la tick-ul curent.
+
+            Comenzile care nu schimbă nimic (aceeași direcție) sau care ar întoarce șarpele în propriul corp (direcția
+            opusă) sunt sărite; prima comandă validă este returnată și latența ei este înregistrată.
+
+            Args:
+                current (str): Direcția aplicată la tick-ul anterior (None înainte de prima mutare).
+
+            Returns:
+                str: Direcția de aplicat sau None dacă nu există nicio comandă validă.
+        """
+        while self._pending:
+            direction, pressed = self._pending.popleft()
+            if direction == current:
+                continue
+            if current is not None and direction == OPPOSITE[current]:
+                self.rejected += 1
+                continue
+            self.latency.record(self.clock() - pressed)
+            return direction
+        return None
+
+    def clear(self):
+        """
+            Golește coada, de exemplu la un joc nou.
+        """
+        self._pending.clear()
+
+    def summary(self):
+        """
+            Returns:
+                dict: Numărul de comenzi aplicate, ignorate (coadă plină) și respinse, plus latența medie, p95 și
+                maximă în milisecunde.
+        """
+        stats = self.latency.summary()
+        return {
+            "applied": stats["ticks"],
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "mean_latency_ms": stats["mean_ms"],
+            "p95_latency_ms": stats["p95_ms"],
+            "max_latency_ms": stats["max_ms"],
+        }
@@ -0,0 +1,234 @@
+import cProfile
+import functools
+import io
+import json
+import pstats
+import time
+import tracemalloc
+
+
+class CallStats:
+    """
+    Statistici despre apelurile unei functii instrumentate.
+
+    Atribute:
+
+    • calls: int - numarul de apeluri
+    • total: float - durata totala a apelurilor, in secunde
+    • max: float - cea mai lunga durata a unui apel, in secunde
+
+    Metode:
+
+    • record(duration) - inregistreaza durata unui apel
+    • summary() - dictionar cu statisticile, in milisecunde
+
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration):
+        """
+            Înregistrează durata unui apel.
+
+            Args:
+                duration (float): Durata apelului, în secunde.
+        """
+        self.calls += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def summary(self):
+        """
+            Returns:
+                dict: Numărul de apeluri și duratele totală, medie și maximă în milisecunde.
+        """
+        return {
+            "calls": self.calls,
+            "total_ms": self.total * 1000,
+            "mean_ms": self.total / self.calls * 1000 if self.calls else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+class Instrumentation:
+    """
+    Instrumentare optionala a jocului: durata apelurilor functiilor importante si, la cerere, profilare cu cProfile
+    si tracemalloc.
+
+    Cand instrumentarea este dezactivata, `wrap` nu modifica nimic, deci jocul nu plateste niciun cost. Cand este
+    activata, metodele alese sunt inlocuite, doar pe obiectul dat, cu o functie care masoara fiecare apel cu
+    perf_counter.
+
+    Atribute:
+
+    • enabled: bool - True daca instrumentarea este activa
+    • clock: callable - ceasul folosit pentru masuratori (implicit time.perf_counter)
+    • timers: dict - statisticile (CallStats) pentru fiecare functie instrumentata, dupa nume
+    • capturing: bool - True cat timp profilarea cu cProfile si tracemalloc este pornita
+    • capture: dict - rezultatul ultimei profilari (functiile cele mai costisitoare si alocarile de memorie) sau None
+
+    Metode:
+
+    • wrap(obj, name) - instrumenteaza metoda name a obiectului obj
+    • timed(label) - context manager care masoara un bloc de cod
+    • start_capture() - porneste profilarea cu cProfile si tracemalloc
+    • stop_capture(limit=20) - opreste profilarea si pastreaza rezultatul
+    • toggle_capture() - porneste sau opreste profilarea
+    • report() - dictionar cu toate masuratorile
+    • dump(path, extra=None) - scrie masuratorile intr-un fisier JSON
+
+    """
+
+    def __init__(self, enabled=False, clock=time.perf_counter):
+        self.enabled = enabled
+        self.clock = clock
+        self.timers = {}
+        self.capturing = False
+        self.capture = None
+        self._profiler = None
+
+    def _stats(self, label):
+        stats = self.timers.get(label)
+        if stats is None:
+            stats = self.timers[label] = CallStats()
+        return stats
+
+    def wrap(self, obj, name):
+        """
+            Instrumentează metoda `name` a obiectului `obj`, sub numele "<Clasă>.<metodă>".
+
+            Metoda este înlocuită doar pe instanța dată; apelurile interne (de exemplu `self.generate_food()` din
+            `SnakeEngine.step`) trec și ele prin funcția instrumentată. O metodă deja instrumentată nu mai este
+            înfășurată încă o dată.
+
+            Args:
+                obj (object): Obiectul a cărui metodă este instrumentată.
+                name (str): Numele metodei.
+        """
+        if not self.enabled:
+            return
+        function = getattr(obj, name)
+        if getattr(function, "__wrapped__", None) is not None:
+            return
+        stats = self._stats(f"{type(obj).__name__}.{name}")
+        clock = self.clock
+
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                stats.record(clock() - start)
+
+        setattr(obj, name, timed)
+
+    def timed(self, label):
+        """
+            Context manager care măsoară durata unui bloc de cod, sub numele `label`.
+
+            Args:
+                label (str): Numele măsurătorii.
+        """
+        return _Timer(self, label)
+
+    def start_capture(self):
+        """
+            Pornește profilarea cu cProfile și urmărirea alocărilor de memorie cu tracemalloc.
+        """
+        if not self.enabled or self.capturing:
+            return
+        self._profiler = cProfile.Profile()
+        tracemalloc.start()
+        self._profiler.enable()
+        self.capturing = True
+
+    def stop_capture(self, limit=20):
+        """
+            Oprește profilarea și păstrează rezultatul în `capture`.
+
+            Args:
+                limit (int): Numărul de funcții și de locuri de alocare păstrate.
+
+            Returns:
+                dict: Funcțiile cu cel mai mare timp cumulat (text, în formatul pstats) și locurile cu cele mai multe
+                alocări de memorie, sau None dacă profilarea nu era pornită.
+        """
+        if not self.capturing:
+            return None
+        self._profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.capturing = False
+
+        text = io.StringIO()
+        pstats.Stats(self._profiler, stream=text).sort_stats("cumulative").print_stats(limit)
+        self._profiler = None
+        self.capture = {
+            "profile": text.getvalue(),
+            "memory": {
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top": [{"where": str(stat.traceback), "bytes": stat.size, "count": stat.count}
+                        for stat in snapshot.statistics("lineno")[:limit]],
+            },
+        }
+        return self.capture
+
+    def toggle_capture(self):
+        """
+            Pornește profilarea dacă este oprită, altfel o oprește.
+
+            Returns:
+                bool: True dacă profilarea a rămas pornită.
+        """
+        if self.capturing:
+            self.stop_capture()
+        else:
+            self.start_capture()
+        return self.capturing
+
+    def report(self):
+        """
+            Returns:
+                dict: Statisticile fiecărei funcții instrumentate și rezultatul ultimei profilări.
+        """
+        return {
+            "timers": {label: stats.summary() for label, stats in sorted(self.timers.items())},
+            "capture": self.capture,
+        }
+
+    def dump(self, path, extra=None):
+        """
+            Scrie măsurătorile într-un fișier JSON.
+
+            Args:
+                path (str): Calea fișierului.
+                extra (dict): Date suplimentare adăugate în raport (opțional), de exemplu nivelul și scorul.
+        """
+        data = dict(extra or {})
+        data.update(self.report())
+        with open(path, "w") as file:
+            json.dump(data, file, indent=4)
+
+
+class _Timer:
+    def __init__(self, instrumentation, label):
+        self._instrumentation = instrumentation
+        self._label = label
+        self._start = None
+
+    def __enter__(self):
+        if self._instrumentation.enabled:
+            self._start = self._instrumentation.clock()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._start is not None:
+            self._instrumentation._stats(self._label).record(self._instrumentation.clock() - self._start)
+        return False
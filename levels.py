@@ -0,0 +1,439 @@
+import base64
+import hashlib
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+
+from engine import SnakeEngine
+
+LEVEL_CONFIG = {
+    "usor": {"obstacole": 3, "viteza": 150},
+    "normal": {"obstacole": 5, "viteza": 150},
+    "hardcore": {"obstacole": 10, "viteza": 75}
+}
+
+# Obstacolele din fisier sunt deplasate cu doua blocuri in jos, sub panoul de scor. Offset-ul este acelasi in jocul
+# grafic si in simularile fara interfata.
+OBSTACLE_ROW_OFFSET = 2
+
+# Se schimba la orice modificare a formatului compilat, ca vechile fisiere din cache sa fie ignorate.
+CACHE_VERSION = 3
+CACHE_DIR_NAME = ".levelcache"
+# Fisierul din cache: CACHE_MAGIC, lungimea antetului JSON (uint32 little-endian), antetul JSON (cheia, dimensiunile,
+# sidecar-urile si, pentru fiecare nivel, numele si lungimile datelor), apoi datele brute ale nivelelor, in ordine:
+# indecsii (array("I").tobytes()) si bitset-ul. Nu contine obiecte Python, deci citirea lui nu poate executa cod.
+CACHE_MAGIC = b"SNKL"
+_CACHE_HEADER = struct.Struct("<4sI")
+
+# Pe langa lista "obstacole" (cate un obiect {"x", "y"} in pixeli), un nivel poate descrie obstacolele compact, in
+# celule (coloana, rand), inainte de OBSTACLE_ROW_OFFSET:
+#   "dreptunghiuri": [[coloana, rand, latime, inaltime], ...]
+#   "randuri": [[rand, coloana, lungime], ...] - segmente orizontale (run-length)
+#   "bitmap": {"latime": W, "inaltime": H, "date": "<base64>"} sau {"latime": W, "inaltime": H, "fisier": "x.bin"}
+#       - cate un bit pentru fiecare celula, rand cu rand, bitul cel mai putin semnificativ primul; fisierul binar
+#       este relativ la fisierul de nivele si este citit prin mmap
+# Toate formele prezente intr-un nivel sunt reunite.
+_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+
+class LevelError(ValueError):
+    """
+    Eroare de validare a unui fisier de nivele.
+    """
+
+
+class CompiledLevel:
+    """
+    Un nivel compilat: obstacolele ca lista compacta de indecsi de celule si ca bitset.
+
+    Celulele sunt indexate ca in SnakeEngine: rand * cols + coloana.
+
+    Atribute:
+
+    • name: str - numele nivelului
+    • cols: int - numarul de coloane ale tablei
+    • rows: int - numarul de randuri ale tablei
+    • indices: array - indecsii celulelor cu obstacole, sortati crescator
+    • bitset: bytes - cate un bit pentru fiecare celula, 1 daca celula este un obstacol
+
+    Metode:
+
+    • obstacles() - lista celulelor (coloana, rand) cu obstacole
+    • is_obstacle(col, row) - True daca celula este un obstacol
+
+    """
+
+    def __init__(self, name, cols, rows, indices, bitset=None):
+        self.name = name
+        self.cols = cols
+        self.rows = rows
+        if bitset is None:
+            self.indices = array("I", sorted(indices))
+            bitset = bytearray((cols * rows + 7) // 8)
+            for index in self.indices:
+                bitset[index >> 3] |= 1 << (index & 7)
+        else:
+            self.indices = indices
+        self.bitset = bytes(bitset)
+
+    def obstacles(self):
+        """
+            Returns:
+                list of tuple: Celulele (coloană, rând) ocupate de obstacole.
+        """
+        cols = self.cols
+        return [(index % cols, index // cols) for index in self.indices]
+
+    def is_obstacle(self, col, row):
+        """
+            Returns:
+                bool: True dacă celula (col, row) este un obstacol.
+        """
+        index = row * self.cols + col
+        return bool(self.bitset[index >> 3] & (1 << (index & 7)))
+
+
+class LevelPack:
+    """
+    Toate nivelele dintr-un fisier, validate si compilate.
+
+    Atribute:
+
+    • width: int - latimea tablei, in pixeli
+    • height: int - inaltimea tablei, in pixeli
+    • block_size: int - dimensiunea unui bloc, in pixeli
+    • cols: int - numarul de coloane ale tablei
+    • rows: int - numarul de randuri ale tablei
+    • levels: dict - nivelele compilate (CompiledLevel), dupa nume
+    • sidecars: list - caile fisierelor binare de bitmap folosite de nivele
+
+    Metode:
+
+    • level(name) - nivelul compilat cu numele dat
+
+    """
+
+    def __init__(self, width, height, block_size, levels, sidecars=()):
+        self.width = width
+        self.height = height
+        self.block_size = block_size
+        self.cols = width // block_size
+        self.rows = height // block_size
+        self.levels = levels
+        self.sidecars = list(sidecars)
+
+    def level(self, name):
+        """
+            Returns:
+                CompiledLevel: Nivelul cu numele dat.
+
+            Raises:
+                KeyError: Dacă nivelul nu există.
+        """
+        return self.levels[name]
+
+
+def load_data(obstacles_file):
+    """
+        Încarcă datele nivelelor dintr-un fișier JSON, fără a depinde de Tkinter.
+
+        Args:
+            obstacles_file (str): Calea către fișierul JSON ce conține dimensiunile tablei și obstacolele.
+
+        Returns:
+            dict: Datele din fișier.
+
+        Raises:
+            FileNotFoundError: Dacă fișierul specificat nu există.
+            JSONDecodeError: Dacă fișierul nu este un JSON valid.
+    """
+    with open(obstacles_file, "r") as file:
+        return json.load(file)
+
+
+def board_size(data, block_size):
+    """
+        Calculează dimensiunea tablei în celule.
+
+        Args:
+            data (dict): Datele încărcate cu `load_data`.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+
+        Returns:
+            tuple: Numărul de coloane și de rânduri ale tablei.
+    """
+    return data["dimensiuniTabla"]["width"] // block_size, data["dimensiuniTabla"]["height"] // block_size
+
+
+def level_obstacles(data, level, block_size):
+    """
+        Obține celulele ocupate de obstacole pentru un nivel, exact ca în jocul cu interfață grafică.
+
+        Args:
+            data (dict): Datele încărcate cu `load_data`.
+            level (str): Nivelul de dificultate ("usor", "normal", "hardcore").
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+
+        Returns:
+            list of tuple: O listă de celule (coloană, rând) pentru fiecare obstacol.
+    """
+    return [(obs["x"] // block_size, obs["y"] // block_size + OBSTACLE_ROW_OFFSET)
+            for obs in data["nivele"][level].get("obstacole", [])]
+
+
+def encode_bitmap(cells, width, height):
+    """
+        Codifică o listă de celule ca bitmap compact, în formatul cheii "bitmap" din fișierul de nivele.
+
+        Args:
+            cells (iterable of tuple): Celulele (coloană, rând) cu obstacole.
+            width (int): Lățimea bitmap-ului, în celule.
+            height (int): Înălțimea bitmap-ului, în celule.
+
+        Returns:
+            bytes: Câte un bit pentru fiecare celulă, rând cu rând.
+    """
+    bits = bytearray((width * height + 7) // 8)
+    for col, row in cells:
+        index = row * width + col
+        bits[index >> 3] |= 1 << (index & 7)
+    return bytes(bits)
+
+
+def _bitmap_cells(bits, width, height):
+    """
+        Decodifică un bitmap în celule; octeții nuli sunt săriți în C, cu o expresie regulată.
+    """
+    if len(bits) < (width * height + 7) // 8:
+        raise LevelError(f"Bitmap-ul are {len(bits)} octeti, prea putin pentru {width}x{height} celule")
+    cells = width * height
+    for match in _NONZERO_BYTE.finditer(bits):
+        base = match.start() * 8
+        byte = bits[match.start()]
+        for bit in range(8):
+            if byte >> bit & 1 and base + bit < cells:
+                yield (base + bit) % width, (base + bit) // width
+
+
+def _compact_cells(level, base_dir, sidecars):
+    """
+        Celulele (coloană, rând) descrise de formele compacte ale unui nivel, înainte de OBSTACLE_ROW_OFFSET.
+    """
+    for col, row, width, height in level.get("dreptunghiuri", []):
+        for r in range(row, row + height):
+            for c in range(col, col + width):
+                yield c, r
+    for row, col, length in level.get("randuri", []):
+        for c in range(col, col + length):
+            yield c, row
+    bitmap = level.get("bitmap")
+    if bitmap is None:
+        return
+    width, height = bitmap["latime"], bitmap["inaltime"]
+    if "date" in bitmap:
+        yield from _bitmap_cells(base64.b64decode(bitmap["date"]), width, height)
+        return
+    path = os.path.join(base_dir, bitmap["fisier"])
+    sidecars.append(os.path.abspath(path))
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield from _bitmap_cells(b"", width, height)
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as bits:
+            yield from _bitmap_cells(bits, width, height)
+
+
+def compile_levels(data, block_size, base_dir="."):
+    """
+        Validează și compilează toate nivelele din datele unui fișier.
+
+        Pentru fiecare nivel se verifică faptul că obstacolele sunt pe tablă (în rândurile jucabile), că nu se
+        repetă în lista "obstacole" și că nu se suprapun cu poziția de start a șarpelui. Formele compacte
+        ("dreptunghiuri", "randuri", "bitmap") se pot suprapune între ele; celulele lor sunt reunite.
+
+        Args:
+            data (dict): Datele încărcate cu `load_data`.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+            base_dir (str): Directorul față de care sunt rezolvate fișierele binare de bitmap.
+
+        Returns:
+            LevelPack: Nivelele compilate.
+
+        Raises:
+            LevelError: Dacă datele nu sunt valide.
+    """
+    try:
+        width, height = data["dimensiuniTabla"]["width"], data["dimensiuniTabla"]["height"]
+        levels = data["nivele"]
+    except (KeyError, TypeError) as error:
+        raise LevelError(f"Lipseste campul {error} din fisierul de nivele") from None
+    if not isinstance(width, int) or not isinstance(height, int) or width < block_size or height < block_size:
+        raise LevelError(f"Dimensiuni invalide ale tablei: {width}x{height}")
+
+    cols, rows = width // block_size, height // block_size
+    spawn = {row * cols + col for col, row in SnakeEngine.spawn_cells(cols, rows)}
+    compiled = {}
+    sidecars = []
+    for name in levels:
+        try:
+            cells = level_obstacles(data, name, block_size)
+            compact = [(col, row + OBSTACLE_ROW_OFFSET) for col, row in _compact_cells(levels[name], base_dir,
+                                                                                         sidecars)]
+        except (KeyError, TypeError, ValueError) as error:
+            if isinstance(error, LevelError):
+                raise LevelError(f"Nivelul {name!r}: {error}") from None
+            raise LevelError(f"Nivelul {name!r} are un obstacol invalid: {error!r}") from None
+        indices = set()
+        for col, row in cells:
+            index = _checked_index(name, col, row, cols, rows, spawn)
+            if index in indices:
+                raise LevelError(f"Nivelul {name!r}: obstacolul ({col}, {row}) apare de doua ori")
+            indices.add(index)
+        for col, row in compact:
+            indices.add(_checked_index(name, col, row, cols, rows, spawn))
+        compiled[name] = CompiledLevel(name, cols, rows, indices)
+    return LevelPack(width, height, block_size, compiled, sidecars)
+
+
+def _checked_index(name, col, row, cols, rows, spawn):
+    if not (0 <= col < cols and SnakeEngine.FIRST_ROW <= row < rows):
+        raise LevelError(f"Nivelul {name!r}: obstacolul ({col}, {row}) este in afara tablei")
+    index = row * cols + col
+    if index in spawn:
+        raise LevelError(f"Nivelul {name!r}: obstacolul ({col}, {row}) se suprapune cu pozitia de start")
+    return index
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cache_path(obstacles_file, cache_dir):
+    directory = cache_dir if cache_dir is not None else os.path.join(os.path.dirname(os.path.abspath(obstacles_file)),
+                                                                     CACHE_DIR_NAME)
+    return os.path.join(directory, os.path.basename(obstacles_file) + ".pack")
+
+
+def load_level_pack(obstacles_file, block_size=20, cache_dir=None, use_cache=True):
+    """
+        Încarcă, validează și compilează nivelele dintr-un fișier, folosind un cache pe disc.
+
+        Fișierul este citit o singură dată; cheia cache-ului este hash-ul SHA-256 al conținutului, împreună cu
+        dimensiunea blocului și versiunea formatului, iar fișierele binare de bitmap au și ele hash-ul verificat.
+        La o potrivire, nivelele compilate sunt citite direct din cache, fără a mai parsa și valida JSON-ul.
+        Cache-ul conține doar numere și octeți, cu lungimile verificate la citire, și este scris atomic, deci un
+        proces întrerupt nu îl poate corupe; un cache invalid este pur și simplu ignorat.
+
+        Args:
+            obstacles_file (str): Calea către fișierul JSON cu nivelele.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+            cache_dir (str): Directorul cache-ului; implicit ".levelcache" lângă fișierul de nivele.
+            use_cache (bool): False pentru a ignora cache-ul.
+
+        Returns:
+            LevelPack: Nivelele compilate.
+
+        Raises:
+            FileNotFoundError: Dacă fișierul specificat nu există.
+            JSONDecodeError: Dacă fișierul nu este un JSON valid.
+            LevelError: Dacă nivelele nu sunt valide.
+    """
+    with open(obstacles_file, "rb") as file:
+        raw = file.read()
+    key = (hashlib.sha256(raw).hexdigest()
+           + f":{block_size}:{CACHE_VERSION}:{sys.byteorder}:{array('I').itemsize}")
+    path = _cache_path(obstacles_file, cache_dir)
+
+    if use_cache:
+        try:
+            with open(path, "rb") as file:
+                cached = _unpack(file.read(), key)
+            if cached is not None:
+                pack, digests = cached
+                if all(_file_hash(sidecar) == digest for sidecar, digest in digests.items()):
+                    return pack
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    pack = compile_levels(json.loads(raw), block_size, os.path.dirname(os.path.abspath(obstacles_file)))
+    if use_cache:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temporary = f"{path}.{os.getpid()}.tmp"
+            with open(temporary, "wb") as file:
+                file.write(_pack(pack, key))
+            os.replace(temporary, path)
+        except OSError:
+            pass
+    return pack
+
+
+def _pack(pack, key):
+    """
+        Codifică nivelele compilate în formatul cache-ului (vezi CACHE_MAGIC).
+    """
+    levels = []
+    blobs = []
+    for name, level in pack.levels.items():
+        indices = level.indices.tobytes()
+        levels.append([name, len(indices), len(level.bitset)])
+        blobs += [indices, level.bitset]
+    header = json.dumps({
+        "key": key,
+        "width": pack.width,
+        "height": pack.height,
+        "block_size": pack.block_size,
+        "levels": levels,
+        "sidecars": {sidecar: _file_hash(sidecar) for sidecar in pack.sidecars},
+    }).encode("utf-8")
+    return _CACHE_HEADER.pack(CACHE_MAGIC, len(header)) + header + b"".join(blobs)
+
+
+def _unpack(data, key):
+    """
+        Decodifică un fișier din cache.
+
+        Returns:
+            tuple: (LevelPack, dict cale -> hash al fișierelor de bitmap), sau None dacă cheia nu se potrivește.
+
+        Raises:
+            ValueError: Dacă fișierul nu are formatul cache-ului sau lungimile datelor nu se potrivesc.
+    """
+    if len(data) < _CACHE_HEADER.size:
+        raise ValueError("Cache trunchiat")
+    magic, header_size = _CACHE_HEADER.unpack_from(data)
+    position = _CACHE_HEADER.size + header_size
+    if magic != CACHE_MAGIC or position > len(data):
+        raise ValueError("Cache invalid")
+    header = json.loads(data[_CACHE_HEADER.size:position])
+    if header["key"] != key:
+        return None
+
+    width, height, block_size = int(header["width"]), int(header["height"]), int(header["block_size"])
+    cols, rows = width // block_size, height // block_size
+    bitset_size = (cols * rows + 7) // 8
+    levels = {}
+    for name, indices_size, level_bitset_size in header["levels"]:
+        indices = array("I")
+        if indices_size % indices.itemsize or level_bitset_size != bitset_size:
+            raise ValueError("Lungimi invalide in cache")
+        end = position + indices_size + bitset_size
+        if end > len(data):
+            raise ValueError("Cache trunchiat")
+        indices.frombytes(data[position:position + indices_size])
+        if indices and max(indices) >= cols * rows:
+            raise ValueError("Celula in afara tablei in cache")
+        levels[str(name)] = CompiledLevel(str(name), cols, rows, indices, data[position + indices_size:end])
+        position = end
+    if position != len(data):
+        raise ValueError("Date in plus in cache")
+    digests = {str(path): str(digest) for path, digest in header["sidecars"].items()}
+    return LevelPack(width, height, block_size, levels, digests), digests
@@ -1,6 +1,36 @@
 import tkinter as tk
+import argparse
+import asyncio
+import getpass
 import json
-import random
+import os
+import queue
+import sys
+import time
+
+from autopilot import Autopilot
+from engine import make_engine, SparseSnakeEngine, MOVED, ATE, WON
+from inputs import InputQueue
+from instrumentation import Instrumentation
+from levels import LEVEL_CONFIG, load_level_pack
+from multiplayer import DEFAULT_PORT, MSG_WELCOME, ClientState, ThreadedClient, start_local_server
+from renderer import CanvasRenderer, SpriteRenderer, ViewportRenderer, MultiSnakeRenderer
+from replay import ReplayRecorder
+from scheduler import TickScheduler
+from scores import ScoreStore
+from screens import ScreenManager
+
+# Starile jocului (SnakeGame.state) si tranzitiile permise din fiecare stare.
+MENU = "menu"
+READY = "ready"
+RUNNING = "running"
+GAME_OVER = "game_over"
+TRANSITIONS = {
+    MENU: {READY},
+    READY: {READY, RUNNING, MENU},
+    RUNNING: {READY, GAME_OVER, MENU},
+    GAME_OVER: {READY, MENU},
+}
 
 
 class SnakeGame:
@@ -18,19 +48,49 @@ class SnakeGame:
     • snake_color: str - culoarea sarpelui
     • food_color: str - culoarea mancarii
     • obstacle_color: str - culoarea obstacolelor
-    • width: int - latimea ferestrei
-    • height: int - inaltimea ferestrei
-    • data: dict - dictionarul care contine datele din fisierul obstacles_file
+    • width: int - latimea tablei de joc, in pixeli
+    • height: int - inaltimea tablei de joc, in pixeli
+    • viewport: bool - True daca tabla nu incape pe ecran (sau s-a cerut explicit) si se deseneaza doar fereastra
+      din jurul capului (ViewportRenderer)
+    • view_width: int - latimea canvas-ului, in pixeli (egala cu width fara viewport)
+    • view_height: int - inaltimea canvas-ului, in pixeli (egala cu height fara viewport)
+    • levels: obiect de tip LevelPack - nivelele din fisierul obstacles_file, validate si compilate
     • obstacles: list - lista de obstacole
-    • score: int - scorul curent
-    • high_score: int - high score-ul
-    • snake: list - lista de coordonate a segmentelor sarpelui
-    • food: tuple - coordonatele mancarii
-    • direction: str - directia in care se misca sarpele
-    • game_over: bool - True daca jocul s-a terminat, False altfel
-    • game_started: bool - True daca jocul a inceput, False altfel
-    • canvas: obiect de tip Canvas - canvas-ul pe care se deseneaza jocul
+    • engine: obiect de tip SnakeEngine - motorul care contine regulile si starea jocului (sarpele, mancarea,
+      directia, scorul)
+    • high_score: int - high score-ul nivelului curent (citit din score_store la inceputul jocului, daca exista)
+    • score_store: obiect de tip ScoreStore - scorurile salvate pe disc (None - scorurile nu sunt pastrate intre
+      sesiuni)
+    • player: str - numele jucatorului sub care sunt salvate scorurile
+    • state: str - starea jocului: MENU (ecranele de meniu), READY (jocul asteapta prima directie), RUNNING (bucla
+      jocului ruleaza) sau GAME_OVER
+    • game_started: bool - True daca jocul ruleaza (starea RUNNING), False altfel
+    • screens: obiect de tip ScreenManager - ecranele ferestrei (start, dificultate, instructiuni, joc), construite
+      o singura data
+    • canvas: obiect de tip Canvas - canvas-ul pe care se deseneaza jocul, acelasi pentru toate jocurile
+    • renderer: obiect de tip CanvasRenderer - deseneaza incremental starea motorului pe canvas
+    • sprites: bool - True pentru desenarea din imagini pre-rasterizate (SpriteRenderer), False pentru forme
+      vectoriale (CanvasRenderer); ignorat in modul viewport
+    • start_message: int - id-ul textului de start afisat pe canvas
+    • scheduler: obiect de tip TickScheduler - planifica tick-urile la perioada fixa a nivelului si masoara
+      durata lor
+    • inputs: obiect de tip InputQueue - comenzile de directie in asteptare, aplicate cate una pe tick, si latenta
+      lor
     • level_config: dict - dictionarul care contine configuratia nivelelor
+    • replay_dir: str - directorul in care se salveaza replay-urile jocurilor terminate (None - nu se salveaza)
+    • recorder: obiect de tip ReplayRecorder - inregistreaza jocul curent (seed, nivel, schimbarile de directie)
+    • last_replay: obiect de tip Replay - inregistrarea ultimului joc terminat
+    • debug_dir: str - directorul in care se scriu rapoartele de instrumentare la sfarsitul jocului (None -
+      instrumentarea este dezactivata)
+    • instrumentation: obiect de tip Instrumentation - duratele apelurilor update, generate_food, draw_*, load_data,
+      load_level_pack si save_debug_report si profilarea la cerere (tasta F9)
+    • debug_label: obiect de tip Label - afiseaza FPS-ul, durata medie a tick-ului si lungimea sarpelui in
+      score_panel (None daca instrumentarea este dezactivata)
+    • autopilot: obiect de tip Autopilot - alege directia la fiecare tick cand pilotul automat este pornit (None -
+      jocul este condus de jucator)
+    • network: obiect de tip ThreadedClient - conexiunea la serverul jocului cu mai multi jucatori (None - joc
+      local)
+    • network_state: obiect de tip ClientState - copia starii jocului cu mai multi jucatori, primita de la server
 
     Metode:
 
@@ -38,12 +98,25 @@ class SnakeGame:
     • get_obstacles_for_level(level) - returneaza obstacolele pentru nivelul level
     • set_game_parameters(nivel) - seteaza parametrii jocului pentru nivelul nivel
     • load_obstacles(obstacles_file) - incarca obstacolele din fisierul obstacles_file
+    • create_engine() - creeaza motorul jocului pentru obstacolele curente
     • create_start_screen() - creeaza ecranul de start
+    • create_difficulty_screen() - creeaza ecranul de alegere a dificultatii
+    • create_instructions_screen() - creeaza ecranul cu instructiuni
+    • create_game_screen() - creeaza canvas-ul jocului
     • show_difficulty_options() - afiseaza optiunile de dificultate
     • show_instructions() - afiseaza instructiunile
     • show_start_screen() - afiseaza ecranul de start
     • on_key_press(event) - gestioneaza apasarea unei taste
-    • wait_for_start() - asteapta ca jocul sa inceapa
+    • set_direction(direction) - schimba directia sarpelui si porneste jocul daca nu a inceput
+    • toggle_autopilot() - porneste sau opreste pilotul automat
+    • start_autopilot_game() - porneste jocul nou condus de pilotul automat, daca acesta este pornit
+    • start_multiplayer(host, port) - porneste jocul cu mai multi jucatori, ca client al unui server
+    • poll_network() - aplica si deseneaza mesajele primite de la server
+    • stop_multiplayer(message=None) - inchide conexiunea cu serverul si opreste verificarea mesajelor
+    • on_close() - inchide conexiunea cu serverul si fereastra jocului
+    • set_state(state) - trece jocul in alta stare si anuleaza timerele starii anterioare
+    • schedule(name, delay_ms, callback) - programeaza un timer cu nume, inlocuind timerul cu acelasi nume
+    • cancel_timers() - anuleaza toate timerele programate
     • start_game(nivel="normal", event=None) - incepe jocul
     • start_game_up(event) - incepe jocul cu directia Up
     • start_game_down(event) - incepe jocul cu directia Down
@@ -53,29 +126,51 @@ class SnakeGame:
     • move_right(event) - muta sarpele la dreapta
     • move_up(event) - muta sarpele in sus
     • move_down(event) - muta sarpele in jos
-    • generate_food() - genereaza mancarea
     • update() - actualizeaza jocul
+    • instrument_game() - instrumenteaza motorul si renderer-ul jocului curent
+    • update_debug_overlay() - actualizeaza textul de diagnostic din score_panel
+    • save_replay() - pastreaza si, optional, salveaza inregistrarea jocului terminat
+    • save_debug_report() - scrie masuratorile jocului terminat intr-un fisier JSON
     • display_game_over() - afiseaza mesajul de Game Over
     • reset_to_start_screen() - reseteaza jocul la ecranul de start
     • reset_game() - reseteaza jocul
-    • draw_snake() - deseneaza sarpele
-    • draw_food() - deseneaza mancarea
-    • draw_obstacles() - deseneaza obstacolele
 
     """
 
     # INITIALIZAREA SI CONFIGURAREA JOCULUI
-    def __init__(self, root, block_size, obstacles_file):
+    def __init__(self, root, block_size, obstacles_file, replay_dir=None, debug_dir=None, sprites=False,
+                 viewport=False, score_store=None, player="jucator"):
         """
         Initializeaza jocul.
 
         :param: root: feresatra Tkinter principala
         :param: block_size: dimensiunea unui bloc din tabla de joc
         :param: obstacles_file: numele fisierului care contine obstacolele
+        :param: replay_dir: directorul in care se salveaza replay-urile (optional)
+        :param: debug_dir: directorul in care se scriu rapoartele de instrumentare (optional; activeaza
+            instrumentarea si afisajul de diagnostic)
+        :param: sprites: True pentru desenarea din imagini pre-rasterizate (optional)
+        :param: viewport: True pentru camera care urmareste sarpele chiar daca tabla incape pe ecran (optional)
+        :param: score_store: scorurile salvate pe disc, de tip ScoreStore (optional)
+        :param: player: numele jucatorului sub care sunt salvate scorurile (optional)
         :return: None
         """
         self.root = root
+        self.sprites = sprites
+        self.score_store = score_store
+        self.player = player
+        self.replay_dir = replay_dir
+        self.debug_dir = debug_dir
+        self.recorder = None
+        self.last_replay = None
+        self.autopilot = None
+        self.network = None
+        self.network_state = None
+        self.instrumentation = Instrumentation(enabled=debug_dir is not None)
+        self.instrumentation.wrap(self, "load_data")
+        self.instrumentation.wrap(self, "update")
         self.root.configure(bg='lightblue')
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         self.block_size = block_size
         self.load_data(obstacles_file)
 
@@ -83,6 +178,12 @@ class SnakeGame:
         self.score_panel.pack(side="top", fill="x")
         self.score_label = tk.Label(self.score_panel, font=("Pixelify Sans", 16), bg="lightblue")
         self.score_label.pack()
+        self.debug_label = None
+        if self.instrumentation.enabled:
+            self.debug_label = tk.Label(self.score_panel, font=("Pixelify Sans", 10), bg="lightblue")
+            self.debug_label.pack()
+            self._overlay_frames = 0
+            self._overlay_time = time.perf_counter()
 
         self.button_font = ("Pixelify Sans", 20, "bold")
 
@@ -93,35 +194,91 @@ class SnakeGame:
         self.root.title("Snake Game")
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        x = (screen_width - self.width) // 2
-        y = (screen_height - self.height) // 2
-        self.root.geometry(f"{self.width}x{self.height}+{x}+{y}")
+        # Tablele mai mari decat ecranul sunt afisate printr-o fereastra care urmareste capul sarpelui.
+        max_width = screen_width * 9 // 10 // block_size * block_size
+        max_height = screen_height * 8 // 10 // block_size * block_size
+        self.viewport = viewport or self.width > max_width or self.height > max_height
+        self.view_width = min(self.width, max_width) if self.viewport else self.width
+        self.view_height = min(self.height, max_height) if self.viewport else self.height
+        x = (screen_width - self.view_width) // 2
+        y = (screen_height - self.view_height) // 2
+        self.root.geometry(f"{self.view_width}x{self.view_height}+{x}+{y}")
+
+        self.renderer = None
+        self.screens = ScreenManager(root)
+        self.screens.register("start", self.create_start_screen, expand=True)
+        self.screens.register("difficulty", self.create_difficulty_screen, expand=True)
+        self.screens.register("instructions", self.create_instructions_screen, expand=True)
+        self.screens.register("game", self.create_game_screen)
+        self.show_start_screen()
 
-        self.create_start_screen()
-
-        self.score = 0
         self.high_score = 0
-        self.snake = [(self.width // 2, self.height // 2 - block_size),
-                      (self.width // 2 - block_size, self.height // 2 - block_size)]
-        self.food = self.generate_food()
         self.obstacles = self.get_obstacles_for_level("usor")
-        self.direction = None
-        self.game_over = False
-        self.game_started = False
+        self.engine = self.create_engine()
+        self.inputs = InputQueue()
+        self.state = MENU
+        self._timers = {}
+
+        self.level_config = LEVEL_CONFIG
+
+    @property
+    def game_started(self):
+        return self.state == RUNNING
+
+    def set_state(self, state):
+        """
+            Trece jocul în starea `state`.
+
+            Toate timerele programate în starea anterioară (bucla jocului, verificarea rețelei) sunt anulate, deci
+            după o tranziție nu rămâne niciun lanț de `after` din jocul anterior.
+
+            Args:
+                state (str): Starea nouă (MENU, READY, RUNNING sau GAME_OVER).
+
+            Raises:
+                ValueError: Dacă tranziția din starea curentă nu este permisă.
+        """
+        if state not in TRANSITIONS[self.state]:
+            raise ValueError(f"Tranzitie invalida: {self.state} -> {state}")
+        self.cancel_timers()
+        self.state = state
+
+    def schedule(self, name, delay_ms, callback):
+        """
+            Programează `callback` după `delay_ms` milisecunde, prin `root.after`.
 
-        self.root.after(0, self.wait_for_start)
+            Un timer programat anterior cu același nume este anulat, deci pentru fiecare nume există cel mult un
+            timer în așteptare (de exemplu un singur lanț de tick-uri).
 
-        self.level_config = {
-            "usor": {"obstacole": 3, "viteza": 150},
-            "normal": {"obstacole": 5, "viteza": 150},
-            "hardcore": {"obstacole": 10, "viteza": 75}
-        }
+            Args:
+                name (str): Numele timerului.
+                delay_ms (int): Întârzierea, în milisecunde.
+                callback (callable): Funcția apelată, fără argumente.
+        """
+        handle = self._timers.pop(name, None)
+        if handle is not None:
+            self.root.after_cancel(handle)
+        self._timers[name] = self.root.after(delay_ms, self._fire, name, callback)
+
+    def _fire(self, name, callback):
+        self._timers.pop(name, None)
+        callback()
+
+    def cancel_timers(self):
+        """
+            Anulează toate timerele programate cu `schedule`.
+        """
+        for handle in self._timers.values():
+            self.root.after_cancel(handle)
+        self._timers.clear()
 
     def load_data(self, obstacles_file):
         """
                 Încarcă datele jocului dintr-un fișier JSON.
 
-                Această metodă inițializează dimensiunile tablei de joc și obstacolele pentru nivelul ușor.
+                Această metodă inițializează dimensiunile tablei de joc și obstacolele pentru nivelul ușor. Nivelele
+                sunt validate și compilate o singură dată, iar rezultatul este păstrat într-un cache pe disc
+                (vezi `levels.load_level_pack`), deci la pornirile următoare fișierul nu mai este parsat.
 
                 Args:
                     obstacles_file (str): Calea către fișierul JSON ce conține datele jocului, inclusiv dimensiunile tablei și obstacolele.
@@ -129,18 +286,20 @@ class SnakeGame:
                 Raises:
                     FileNotFoundError: Dacă fișierul specificat nu există.
                     JSONDecodeError: Dacă fișierul nu este un JSON valid.
+                    LevelError: Dacă nivelele nu sunt valide.
         """
-        with open(obstacles_file, "r") as file:
-            self.data = json.load(file)
+        with self.instrumentation.timed("load_level_pack"):
+            self.levels = load_level_pack(obstacles_file, self.block_size)
 
-        self.width, self.height = self.data["dimensiuniTabla"]["width"], self.data["dimensiuniTabla"]["height"]
+        self.width, self.height = self.levels.width, self.levels.height
         self.obstacles = self.get_obstacles_for_level("usor")
 
     def get_obstacles_for_level(self, level):
         """
                 Obține coordonatele obstacolelor pentru un anumit nivel.
 
-                Această metodă returnează o listă de coordonate (tupluri) pentru obstacolele specifice nivelului ales.
+                Această metodă returnează o listă de coordonate (tupluri) pentru obstacolele specifice nivelului ales,
+                cu același offset față de panoul de scor ca în simulările fără interfață grafică.
 
                 Args:
                     level (str): Nivelul de dificultate pentru care se extrag obstacolele. Valori acceptate: "usor", "normal", "hardcore".
@@ -148,7 +307,7 @@ class SnakeGame:
                 Returns:
                     list of tuple: O listă de coordonate (x, y) pentru fiecare obstacol.
         """
-        return [(obs["x"], obs["y"] + self.block_size) for obs in self.data["nivele"][level]["obstacole"]]
+        return [(col * self.block_size, row * self.block_size) for col, row in self.levels.level(level).obstacles()]
 
     def set_game_parameters(self, nivel):
         """
@@ -159,9 +318,11 @@ class SnakeGame:
                 Args:
                     nivel (str): Nivelul de dificultate pentru care se setează parametrii. Valori acceptate: "usor", "normal", "hardcore".
         """
-        self.obstacles = [(obs["x"], obs["y"] + 2 * self.block_size) for obs in self.data["nivele"][nivel]["obstacole"]]
+        self.obstacles = self.get_obstacles_for_level(nivel)
         config = self.level_config[nivel]
         self.update_speed = config["viteza"]
+        self.scheduler = TickScheduler(self.update_speed)
+        self.inputs = InputQueue()
 
     def load_obstacles(self, obstacles_file):
         """
@@ -184,6 +345,19 @@ class SnakeGame:
         return [(obs["x"] // self.block_size * self.block_size, obs["y"] // self.block_size * self.block_size) for obs
                 in obstacles_data]
 
+    def create_engine(self):
+        """
+                Creează motorul jocului pentru obstacolele curente.
+
+                Coordonatele în pixeli ale obstacolelor sunt transformate în celule de dimensiunea unui bloc. Pentru
+                tablele foarte mari se folosește SparseSnakeEngine (vezi `engine.make_engine`).
+
+                Returns:
+                    SnakeEngine: Motorul jocului, fără interfață grafică.
+        """
+        obstacles = [(x // self.block_size, y // self.block_size) for x, y in self.obstacles]
+        return make_engine(self.width // self.block_size, self.height // self.block_size, obstacles)
+
     # INTERFATA UTILIZATORULUI
     def create_start_screen(self):
         """
@@ -191,13 +365,16 @@ class SnakeGame:
 
             Această metodă inițializează ecranul de start cu titlul jocului și butoane pentru a începe jocul,
             a vedea instrucțiunile sau a ieși din joc. Butonul de start va apela metoda `show_difficulty_options`
-            pentru a selecta nivelul de dificultate.
+            pentru a selecta nivelul de dificultate. Este apelată o singură dată, de `screens`, la prima afișare a
+            ecranului.
 
             Attributes:
                 start_frame (tk.Frame): Un cadru care conține toate widget-urile pentru ecranul de start.
+
+            Returns:
+                tk.Frame: Cadrul ecranului de start.
         """
         self.start_frame = tk.Frame(self.root, bg="lightblue")
-        self.start_frame.pack(expand=True)
 
         title_label = tk.Label(self.start_frame, text="Snake Game", font=("Pixelify Sans", 36, "bold"), bg="lightblue")
         title_label.pack(pady=40)
@@ -213,21 +390,29 @@ class SnakeGame:
         quit_button = tk.Button(self.start_frame, text="Quit", command=self.root.quit, font=self.button_font,
                                 bg="lightgreen")
         quit_button.pack(pady=10)
+        return self.start_frame
 
     def show_difficulty_options(self):
         """
             Afișează opțiunile de dificultate pentru joc.
+        """
+        self.screens.show("difficulty")
 
-            Această metodă creează un nou cadru care conține butoane pentru selectarea nivelului de dificultate:
+    def create_difficulty_screen(self):
+        """
+            Creează ecranul de alegere a dificultății.
+
+            Această metodă creează cadrul care conține butoane pentru selectarea nivelului de dificultate:
             ușor, normal și greu. Fiecare buton va începe jocul la dificultatea respectivă prin apelarea metodei
             `start_game` cu argumentul corespunzător nivelului.
 
             Attributes:
                 difficulty_frame (tk.Frame): Un cadru care conține butoanele pentru selectarea dificultății.
+
+            Returns:
+                tk.Frame: Cadrul ecranului de dificultate.
         """
-        self.start_frame.pack_forget()
         self.difficulty_frame = tk.Frame(self.root, bg="lightblue")
-        self.difficulty_frame.pack(expand=True)
 
         easy_button = tk.Button(self.difficulty_frame, text="Usor", command=lambda: self.start_game("usor"),
                                 font=self.button_font, bg="#60db6d")
@@ -244,26 +429,35 @@ class SnakeGame:
         back_button = tk.Button(self.difficulty_frame, text="Inapoi", command=self.show_start_screen,
                                 font=self.button_font)
         back_button.pack(pady=40)
+        return self.difficulty_frame
 
     def show_instructions(self):
         """
             Afișează instrucțiunile jocului.
+        """
+        self.screens.show("instructions")
+
+    def create_instructions_screen(self):
+        """
+            Creează ecranul cu instrucțiunile jocului.
 
-            Această metodă afișează un cadru care conține instrucțiunile pentru joc, cum ar fi controlul șarpelui și
+            Această metodă creează un cadru care conține instrucțiunile pentru joc, cum ar fi controlul șarpelui și
             regulile de bază. Include de asemenea un buton pentru a reveni la ecranul de start.
 
             Attributes: instructions_frame (tk.Frame): Un cadru care conține instrucțiunile jocului și un buton de
             întoarcere la ecranul de start.
+
+            Returns:
+                tk.Frame: Cadrul ecranului cu instrucțiuni.
         """
-        self.start_frame.pack_forget()
         self.instructions_frame = tk.Frame(self.root, bg="lightblue")
-        self.instructions_frame.pack(expand=True)
 
         instructions_text = "Instructiuni\n\n" \
                             "Foloseste W, A, S, D pentru a misca pitonul.\n" \
                             "Mananca pentru a creste.\n" \
                             "Nu intra in margini sau in obstacole.\n" \
-                            "Nu iti manca propria coada !!"
+                            "Nu iti manca propria coada !!\n" \
+                            "Apasa P pentru pilotul automat."
         instructions_label = tk.Label(self.instructions_frame, text=instructions_text, font=("Pixelify Sans", 20),
                                       bg="lightblue")
         instructions_label.pack(pady=10)
@@ -271,143 +465,256 @@ class SnakeGame:
         back_button = tk.Button(self.instructions_frame, text="Inapoi", command=self.show_start_screen,
                                 font=self.button_font, bg="lightgreen")
         back_button.pack(pady=10)
+        return self.instructions_frame
+
+    def create_game_screen(self):
+        """
+            Creează canvas-ul jocului, folosit de toate jocurile din sesiune.
+
+            Returns:
+                tk.Canvas: Canvas-ul jocului.
+        """
+        self.canvas = tk.Canvas(self.root, width=self.view_width, height=self.view_height)
+        return self.canvas
 
     def show_start_screen(self):
         """
             Revine la ecranul de start al jocului.
 
-            Această metodă ascunde cadrele curente (cum ar fi cadrele de dificultate sau instrucțiuni) și reafișează
-            ecranul de start. Este folosită pentru a oferi utilizatorului posibilitatea de a reveni la ecranul de
-            start fără a închide jocul.
+            Această metodă ascunde ecranul curent (cum ar fi ecranul de dificultate sau de instrucțiuni) și reafișează
+            ecranul de start, construit o singură dată. Este folosită pentru a oferi utilizatorului posibilitatea de
+            a reveni la ecranul de start fără a închide jocul.
         """
-        if hasattr(self, 'difficulty_frame'):
-            self.difficulty_frame.pack_forget()
-        if hasattr(self, 'instructions_frame'):
-            self.instructions_frame.pack_forget()
-
-        self.create_start_screen()
+        self.screens.show("start")
 
     # GESTIONAREA EVENIMENTELOR
     def on_key_press(self, event):
         """
             Gestionarea evenimentelor de apăsare a tastelor.
 
-            Această funcție stabilește direcția șarpelui în funcție de tasta apăsată (W, A, S, D).
-            Înainte de începerea jocului, direcția este setată și jocul începe. Dacă jocul a început deja,
-            modifică direcția șarpelui fără a permite acestuia să se întoarcă direct înapoi.
+            Această funcție stabilește direcția șarpelui în funcție de tasta apăsată (W, A, S, D) prin
+            `set_direction`. Înainte de începerea jocului, direcția este setată și jocul începe. Dacă jocul a început
+            deja, direcția este pusă în coada de comenzi și aplicată la următorul tick liber, fără a permite șarpelui
+            să se întoarcă direct înapoi. Tasta P pornește sau oprește pilotul automat; cât timp acesta conduce,
+            tastele de direcție sunt ignorate. În jocul cu mai mulți jucători, direcția este trimisă serverului.
 
             Args:
                 event (tk.Event): Evenimentul generat de apăsarea unei taste.
         """
-        if not self.game_started:
+        if self.network is not None:
             if event.keysym in ['w', 'a', 's', 'd']:
-                self.direction = {"w": "Up", "a": "Left", "s": "Down", "d": "Right"}.get(event.keysym, None)
-                if self.direction:
-                    self.game_started = True
-                    self.canvas.delete("all")
-                    self.update()
-        else:
-            if event.keysym == 'a' and self.direction != "Right":
-                self.direction = "Left"
-            elif event.keysym == 'd' and self.direction != "Left":
-                self.direction = "Right"
-            elif event.keysym == 'w' and self.direction != "Down":
-                self.direction = "Up"
-            elif event.keysym == 's' and self.direction != "Up":
-                self.direction = "Down"
-
-    def wait_for_start(self):
-        """
-            Așteaptă începerea jocului.
-
-            Această funcție rulează într-o buclă până când jocul este inițiat, verificând dacă
-            utilizatorul a apăsat o tastă de direcție pentru a începe jocul.
-        """
-        if not self.game_started:
-            self.root.after(100, self.wait_for_start)
-        else:
-            pass
+                self.network.send({"w": "Up", "a": "Left", "s": "Down", "d": "Right"}[event.keysym])
+            return
+        if event.keysym == 'p':
+            self.toggle_autopilot()
+        elif event.keysym == 'F9':
+            self.instrumentation.toggle_capture()
+        elif event.keysym in ['w', 'a', 's', 'd'] and self.autopilot is None:
+            self.set_direction({"w": "Up", "a": "Left", "s": "Down", "d": "Right"}[event.keysym])
+
+    def set_direction(self, direction):
+        """
+            Schimbă direcția șarpelui; este calea tastaturii și a direcției de start alese de pilotul automat.
 
-    def start_game(self, nivel="normal", event=None):
+            În starea READY, direcția devine direcția de start și jocul pornește (starea RUNNING). În starea RUNNING
+            direcția este pusă în coada `inputs`, din care `update` aplică o singură comandă pe tick. În celelalte
+            stări direcția este ignorată.
+
+            Args:
+                direction (str): Direcția nouă ("Up", "Down", "Left", "Right").
         """
-            Începe jocul la nivelul specificat.
+        if self.state == RUNNING:
+            self.inputs.push(direction)
+        elif self.state == READY:
+            self.engine.turn(direction)
+            self.set_state(RUNNING)
+            self.canvas.delete(self.start_message)
+            self.recorder = ReplayRecorder(self.engine.seed, self.current_level)
+            self.scheduler.start()
+            self.update()
+
+    def toggle_autopilot(self):
+        """
+            Pornește sau oprește pilotul automat, în orice stare a jocului.
 
-            Această funcție inițializează jocul, stabilind nivelul de dificultate, poziția inițială
-            a șarpelui, mâncarea și obstacolele. De asemenea, pregătește ecranul de joc și se leagă
-            de evenimentele de apăsare a tastelor.
+            Când este pornit înainte de începerea jocului (READY), pilotul alege și direcția de start, deci jocul
+            pornește imediat; pornit în meniu sau după sfârșitul jocului, conduce jocul următor de la același nivel
+            (vezi `reset_game`). Cât timp este pornit, `update` îi cere direcția înaintea fiecărui tick. Pe tablele
+            foarte mari (SparseSnakeEngine) pilotul nu este disponibil: structurile lui au dimensiunea tablei.
+        """
+        if self.autopilot is not None:
+            self.autopilot = None
+            return
+        if isinstance(self.engine, SparseSnakeEngine):
+            return
+        self.autopilot = Autopilot()
+        self.inputs.clear()
+        if self.state == READY:
+            self.set_direction(self.autopilot.choose(self.engine))
+
+    def start_autopilot_game(self):
+        """
+            Pornește jocul nou (starea READY) condus de pilotul automat, dacă acesta a rămas pornit. Pe tablele
+            foarte mari pilotul este oprit, fiindcă nu este disponibil.
+        """
+        if self.autopilot is None:
+            return
+        if isinstance(self.engine, SparseSnakeEngine):
+            self.autopilot = None
+            return
+        self.autopilot.reset()
+        self.set_direction(self.autopilot.choose(self.engine))
+
+    def start_multiplayer(self, host, port):
+        """
+            Pornește jocul cu mai mulți jucători, ca client al unui server `multiplayer.MultiplayerServer`.
+
+            Starea jocului este ținută de server: fereastra doar trimite direcțiile apăsate și desenează mesajele
+            primite. Conexiunea rulează pe un fir separat, iar mesajele sunt citite din coada ei de `poll_network`,
+            pe firul Tk.
 
             Args:
-                nivel (str): Nivelul de dificultate al jocului ('usor', 'normal', 'hardcore').
-                event (tk.Event): Evenimentul (opțional) care a declanșat apelul funcției.
+                host (str): Adresa serverului.
+                port (int): Portul serverului.
+        """
+        self.screens.hide()
+        self.network_state = ClientState()
+        self.network = ThreadedClient(host, port)
+        self.network.start()
+        self.score_label.config(text=f"Conectare la {host}:{port}...")
+        self.root.bind_all("<KeyPress>", self.on_key_press)
+        self.schedule("network", 15, self.poll_network)
+
+    def poll_network(self):
         """
-        self.start_frame.pack_forget()
+            Aplică pe `network_state` mesajele primite de la server și actualizează desenul și scorul.
 
-        if hasattr(self, 'difficulty_frame'):
-            self.difficulty_frame.pack_forget()
+            La primul mesaj (MSG_WELCOME) creează canvas-ul, de dimensiunea tablei serverului, și renderer-ul jocului
+            cu mai mulți jucători; mesajele de stare primite înaintea lui sunt ignorate, deoarece nu există încă nicio
+            tablă pe care să fie aplicate sau desenate. Când serverul închide conexiunea sau trimite un mesaj invalid,
+            conexiunea este închisă cu un mesaj în score_panel și verificarea următoare nu mai este programată.
+        """
+        state = self.network_state
+        while True:
+            try:
+                payload = self.network.messages.get_nowait()
+            except queue.Empty:
+                break
+            if payload is None:
+                self.stop_multiplayer("Conexiunea cu serverul s-a inchis")
+                return
+            try:
+                if state.player is None and payload[0] != MSG_WELCOME:
+                    continue
+                kind = state.apply(payload)
+            except (ValueError, IndexError):
+                self.stop_multiplayer("Mesaj invalid de la server, conexiunea a fost inchisa")
+                return
+            if kind == MSG_WELCOME:
+                self.screens.show("game")
+                self.canvas.config(width=state.cols * self.block_size, height=state.rows * self.block_size)
+                self.renderer = MultiSnakeRenderer(self.canvas, self.block_size, self.snake_color, self.food_color,
+                                                   self.obstacle_color)
+                self.renderer.reset(state)
+            else:
+                self.renderer.update()
 
-        self.canvas = tk.Canvas(self.root, width=self.width, height=self.height)
-        self.canvas.pack()
+        if state.player is not None:
+            score = state.scores.get(state.player)
+            status = f"Scor: {score}" if score is not None else "Astepti sa reapari..."
+            self.score_label.config(text=f"{status}   Jucatori: {len(state.snakes)}")
+        self.schedule("network", 15, self.poll_network)
 
-        self.obstacles = self.get_obstacles_for_level(nivel)
+    def stop_multiplayer(self, message=None):
+        """
+            Închide conexiunea cu serverul, dacă există, și oprește verificarea mesajelor primite.
 
-        self.score = 0
-        self.high_score = 0
-        self.score_label.config(text=f"Scor: {self.score}   High Score: {self.high_score}")
+            Args:
+                message (str): Textul afișat în score_panel (opțional).
+        """
+        if self.network is None:
+            return
+        self.network.close()
+        self.network = None
+        handle = self._timers.pop("network", None)
+        if handle is not None:
+            self.root.after_cancel(handle)
+        if message is not None:
+            self.score_label.config(text=message)
+
+    def on_close(self):
+        """
+            Închide fereastra jocului (WM_DELETE_WINDOW), după ce închide conexiunea cu serverul, dacă există.
+        """
+        self.stop_multiplayer()
+        self.root.destroy()
 
-        self.snake = [(self.width // 2, self.height // 2), (self.width // 2 - self.block_size, self.height // 2)]
-        self.food = self.generate_food()
-        self.direction = None
-        self.game_over = False
-        self.game_started = False
+    def start_game(self, nivel="normal", event=None):
+        """
+            Începe jocul la nivelul specificat.
+
+            Această funcție inițializează jocul, stabilind nivelul de dificultate, poziția inițială
+            a șarpelui, mâncarea și obstacolele. De asemenea, afișează ecranul de joc, al cărui canvas și renderer
+            sunt refolosite de la un joc la altul, și se leagă de evenimentele de apăsare a tastelor. Jocul trece
+            în starea READY și pornește la prima direcție apăsată, fără niciun timer în așteptare.
+
+            Args:
+                nivel (str): Nivelul de dificultate al jocului ('usor', 'normal', 'hardcore').
+                event (tk.Event): Evenimentul (opțional) care a declanșat apelul funcției.
+        """
+        self.set_state(READY)
+        self.screens.show("game")
 
         self.current_level = nivel
         self.set_game_parameters(nivel)
+        self.engine = self.create_engine()
 
-        self.canvas.bind_all("<KeyPress>", self.on_key_press)
+        self.high_score = self.score_store.best(nivel) if self.score_store is not None else 0
+        self.score_label.config(text=f"Scor: {self.engine.score}   High Score: {self.high_score}")
 
-        self.canvas.bind("<KeyPress-w>", self.start_game_up)
-        self.canvas.bind("<KeyPress-a>", self.start_game_left)
-        self.canvas.bind("<KeyPress-s>", self.start_game_down)
-        self.canvas.bind("<KeyPress-d>", self.start_game_right)
+        self.canvas.bind_all("<KeyPress>", self.on_key_press)
 
-        self.draw_obstacles()
-        self.draw_snake()
-        self.draw_food()
+        if self.renderer is None:
+            if self.viewport:
+                self.renderer = ViewportRenderer(self.canvas, self.block_size, self.snake_color, self.food_color,
+                                                 self.obstacle_color, self.view_width // self.block_size,
+                                                 self.view_height // self.block_size)
+            else:
+                renderer_class = SpriteRenderer if self.sprites else CanvasRenderer
+                self.renderer = renderer_class(self.canvas, self.block_size, self.snake_color, self.food_color,
+                                               self.obstacle_color)
+        self.instrument_game()
+        self.renderer.reset(self.engine)
 
         start_message = "Incepe sa joci! Apasa W, A, S, D.\n\n"
-        self.canvas.create_text(self.width // 2, self.height // 2, text=start_message, fill="black",
-                                font=("Pixelify Sans", 16))
-
-        self.root.after(0, self.wait_for_start)
+        self.start_message = self.canvas.create_text(self.view_width // 2, self.view_height // 2, text=start_message,
+                                                     fill="black", font=("Pixelify Sans", 16))
+        self.start_autopilot_game()
 
     def start_game_up(self, event):
         """
             Inițializează jocul și setează direcția de început spre sus.
 
-            Această funcție este legată de evenimentul de apăsare a tastei W. Setează direcția șarpelui
-            spre sus și începe jocul. La fel este si pentru start_game_down, start_game_left, start_game_right.
+            Dacă jocul așteaptă prima direcție (starea READY), setează direcția șarpelui spre sus și începe jocul
+            prin `set_direction`. La fel este si pentru start_game_down, start_game_left, start_game_right.
 
             Args:
                 event (tk.Event): Evenimentul generat de apăsarea tastei W.
         """
-        if not self.game_started:
-            self.direction = "Up"
-            self.start_game(event)
+        if self.state == READY:
+            self.set_direction("Up")
 
     def start_game_down(self, event):
-        if not self.game_started:
-            self.direction = "Down"
-            self.start_game(event)
+        if self.state == READY:
+            self.set_direction("Down")
 
     def start_game_left(self, event):
-        if not self.game_started:
-            self.direction = "Left"
-            self.start_game(event)
+        if self.state == READY:
+            self.set_direction("Left")
 
     def start_game_right(self, event):
-        if not self.game_started:
-            self.direction = "Right"
-            self.start_game(event)
+        if self.state == READY:
+            self.set_direction("Right")
 
     def move_up(self, event):
         """
@@ -420,107 +727,173 @@ class SnakeGame:
                 event (tk.Event): Evenimentul generat de apăsarea tastei corespunzătoare.
         """
         try:
-            if self.direction != "Down":
-                self.direction = "Up"
+            self.engine.turn("Up")
         except Exception as e:
             print(f"Error in move_up: {e}")
 
     def move_left(self, event):
         try:
-            if self.direction != "Right":
-                self.direction = "Left"
+            self.engine.turn("Left")
         except Exception as e:
             print(f"Error in move_left: {e}")
 
     def move_right(self, event):
         try:
-            if self.direction != "Left":
-                self.direction = "Right"
+            self.engine.turn("Right")
         except Exception as e:
             print(f"Error in move_right: {e}")
 
     def move_down(self, event):
         try:
-            if self.direction != "Up":
-                self.direction = "Down"
+            self.engine.turn("Down")
         except Exception as e:
             print(f"Error in move_down: {e}")
 
     # LOGICA JOCULUI
-    def generate_food(self):
-        """
-            Generează poziția aleatoare pentru mâncarea șarpelui.
-
-            Această metodă selectează aleator un punct pe tabla de joc unde va apărea mâncarea. Punctul este ales astfel încât să nu se afle pe șarpe sau pe un obstacol.
-
-            Returns:
-                tuple: Un tuplu (x, y) reprezentând coordonatele mâncării.
-        """
-        while True:
-            x = random.randint(0, (self.width - self.block_size) // self.block_size) * self.block_size
-            y_min = self.score_panel.winfo_height() + self.block_size
-            y_max = self.height - 3 * self.block_size
-            y = random.randint(y_min // self.block_size, y_max // self.block_size) * self.block_size
-
-            if (x, y) not in self.snake and (x, y) not in self.obstacles:
-                return x, y
-
     def update(self):
         """
             Actualizează starea jocului la fiecare frame.
 
-            Această metodă gestionează logica de mișcare a șarpelui, verifică coliziunile și actualizează scorul. De asemenea, redesenează șarpele, mâncarea și obstacolele pe tabla de joc.
-            Dacă șarpele se lovește de margini, de sine sau de un obstacol, jocul se termină.
+            Această metodă avansează motorul jocului cu câte tick-uri sunt scadente conform `TickScheduler`
+            (mișcarea șarpelui, coliziunile și scorul sunt gestionate de `SnakeEngine.step`) și actualizează
+            incremental desenul prin `CanvasRenderer.update`. Următorul apel este programat la termenul următor
+            al planificatorului, deci durata desenării nu încetinește jocul. Tick-urile recuperate după o întârziere
+            sunt afișate de Tkinter într-un singur frame. Înaintea fiecărui tick se aplică cel mult o comandă din coada
+            `inputs`, validată față de direcția aplicată la tick-ul anterior, sau direcția aleasă de pilotul automat.
+            Dacă șarpele se lovește de margini, de sine sau de un obstacol, jocul se termină (starea GAME_OVER); dacă
+            tabla s-a umplut și nu mai există loc pentru mâncare, jocul este câștigat. Următorul tick este programat
+            cu `schedule`, deci există cel mult un lanț de tick-uri.
         """
-        if not self.game_over:
-            x, y = self.snake[0]
-
-            if self.direction == "Left":
-                x -= self.block_size
-            elif self.direction == "Right":
-                x += self.block_size
-            elif self.direction == "Up":
-                y -= self.block_size
-            elif self.direction == "Down":
-                y += self.block_size
-
-            if x < 0 or x >= self.width or y < self.block_size or y >= self.height or \
-                    (x, y) in self.snake[1:] or (x, y) in self.obstacles:
-                self.game_over = True
+        if self.state != RUNNING:
+            return
+
+        for _ in range(self.scheduler.due_ticks()):
+            tick_start = time.perf_counter()
+            # Directia pilotului automat nu trece prin coada `inputs`, ca statisticile comenzilor din raportul de
+            # diagnostic sa masoare doar tastele apasate.
+            if self.autopilot is not None:
+                direction = self.autopilot.choose(self.engine)
+            else:
+                direction = self.inputs.pop(self.engine.direction)
+            if direction is not None:
+                self.engine.turn(direction)
+            self.recorder.record_tick(self.engine.direction)
+            result = self.engine.step()
+
+            if result in (ATE, WON):
+                if self.engine.score > self.high_score:
+                    self.high_score = self.engine.score
+                self.score_label.config(text=f"Scor: {self.engine.score}   High Score: {self.high_score}")
+
+            # Si tick-ul care umple tabla (WON) muta sarpele, deci este desenat inaintea ecranului de final; la o
+            # coliziune motorul nu muta sarpele si nu este nimic nou de desenat.
+            if result in (MOVED, ATE, WON):
+                self.renderer.update()
+
+            if self.engine.game_over:
+                self.save_replay()
+                self.save_debug_report()
+                if self.score_store is not None:
+                    self.score_store.record(self.current_level, self.player, self.engine.score)
+                self.set_state(GAME_OVER)
                 self.display_game_over()
                 return
 
-            self.snake.insert(0, (x, y))
+            self.scheduler.record(time.perf_counter() - tick_start)
 
-            if (x, y) == self.food:
-                self.score += 1
-                self.food = self.generate_food()
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                self.score_label.config(text=f"Scor: {self.score}   High Score: {self.high_score}")
-            else:
-                self.snake.pop()
+        if self.debug_label is not None:
+            self.update_debug_overlay()
+        self.schedule("tick", self.scheduler.delay_ms(), self.update)
 
-            self.canvas.delete("all")
-            self.draw_obstacles()
-            self.draw_snake()
-            self.draw_food()
+    def instrument_game(self):
+        """
+            Instrumentează metodele motorului și ale renderer-ului jocului curent (generate_food, update și
+            draw_*), dacă instrumentarea este activă. Este apelată la fiecare `start_game`, pentru că atunci se
+            creează un motor și un renderer nou.
+        """
+        self.instrumentation.wrap(self.engine, "generate_food")
+        for name in ("update", "draw_snake", "draw_food", "draw_obstacles"):
+            self.instrumentation.wrap(self.renderer, name)
+
+    def update_debug_overlay(self):
+        """
+            Actualizează textul de diagnostic din score_panel: FPS-ul, durata medie a tick-ului și lungimea
+            șarpelui. Textul este schimbat cel mult de două ori pe secundă, ca afișajul să nu coste el însuși timp.
+        """
+        self._overlay_frames += 1
+        now = time.perf_counter()
+        elapsed = now - self._overlay_time
+        if elapsed < 0.5:
+            return
+        fps = self._overlay_frames / elapsed
+        tick_ms = self.scheduler.stats.mean() * 1000
+        self.debug_label.config(text=f"FPS: {fps:.0f}   Tick: {tick_ms:.2f} ms   Lungime: {len(self.engine.snake)}")
+        self._overlay_frames = 0
+        self._overlay_time = now
+
+    def save_replay(self):
+        """
+            Păstrează înregistrarea jocului terminat.
+
+            Înregistrarea este disponibilă în `last_replay` și, dacă `replay_dir` este setat, este salvată în
+            fișierul "<nivel>-<seed>.snkr", de unde poate fi re-simulată cu `replay.replay_game`. Directorul este
+            creat dacă nu există; o eroare de scriere este doar afișată, fără a opri sfârșitul jocului.
+        """
+        self.last_replay = self.recorder.finish()
+        if self.replay_dir:
+            path = os.path.join(self.replay_dir, f"{self.last_replay.level}-{self.last_replay.seed}.snkr")
+            try:
+                os.makedirs(self.replay_dir, exist_ok=True)
+                self.last_replay.save(path)
+            except OSError as e:
+                print(f"Nu s-a putut salva replay-ul {path}: {e}", file=sys.stderr)
+
+    def save_debug_report(self):
+        """
+            Scrie măsurătorile jocului terminat în fișierul "debug-<nivel>-<seed>.json" din `debug_dir`.
 
-            self.root.after(self.update_speed, self.update)
-        else:
-            self.display_game_over()
+            Raportul conține duratele apelurilor instrumentate, statisticile tick-urilor și ale comenzilor, precum
+            și rezultatul profilării, dacă aceasta era pornită (profilarea este oprită). Durata scrierii este măsurată
+            sub numele "save_debug_report" și apare în rapoartele jocurilor următoare. Directorul este creat dacă nu
+            există; o eroare de scriere este doar afișată, ca jocul să ajungă oricum la ecranul de final.
+        """
+        if not self.instrumentation.enabled:
+            return
+        with self.instrumentation.timed("save_debug_report"):
+            self.instrumentation.stop_capture()
+            path = os.path.join(self.debug_dir, f"debug-{self.current_level}-{self.engine.seed}.json")
+            try:
+                os.makedirs(self.debug_dir, exist_ok=True)
+                self.instrumentation.dump(path, extra={
+                    "level": self.current_level,
+                    "seed": self.engine.seed,
+                    "score": self.engine.score,
+                    "length": len(self.engine.snake),
+                    "cause": self.engine.cause,
+                    "ticks": self.scheduler.stats.summary(),
+                    "inputs": self.inputs.summary(),
+                })
+            except OSError as e:
+                print(f"Nu s-a putut scrie raportul {path}: {e}", file=sys.stderr)
 
     def display_game_over(self):
         """
             Afișează fereastra de Game Over și opțiunile după terminarea jocului.
 
-            Această metodă se declanșează atunci când jocul se termină (șarpele se lovește de un obstacol, de margini sau de sine). Afișează scorul actual, cel mai bun scor și oferă opțiunea de a juca din nou sau de a încheia jocul.
+            Această metodă se declanșează atunci când jocul se termină (șarpele se lovește de un obstacol, de margini sau de sine, sau a umplut tabla). Afișează scorul actual, cel mai bun scor și oferă opțiunea de a juca din nou sau de a încheia jocul.
+            Dacă scorurile sunt salvate (`score_store`), afișează și clasamentul nivelului.
         """
         game_over_window = tk.Toplevel(self.root)
         game_over_window.title("Game Over")
 
+        title = "AI CASTIGAT!" if self.engine.cause == WON else "GAME OVER"
+        ranking = ""
+        if self.score_store is not None:
+            lines = [f"{place}. {player} - {score}"
+                     for place, (player, score, _) in enumerate(self.score_store.top(self.current_level, 5), 1)]
+            ranking = "\n\nClasament:\n" + "\n".join(lines)
         game_over_label = tk.Label(game_over_window,
-                                   text=f"GAME OVER\nScorul tau: {self.score}\nHigh Score: {self.high_score}\n\nVrei sa joci iar la acest nivel?",
+                                   text=f"{title}\nScorul tau: {self.engine.score}\nHigh Score: {self.high_score}{ranking}\n\nVrei sa joci iar la acest nivel?",
                                    font=("Pixelify Sans", 16))
         game_over_label.pack(pady=10)
 
@@ -545,97 +918,186 @@ class SnakeGame:
         """
             Reîntoarce jocul la ecranul de start.
 
-            Această metodă este apelată pentru a reîncepe jocul de la început, resetând tabla de joc, scorul și starea șarpelui.
+            Această metodă este apelată pentru a reîncepe jocul de la început, resetând tabla de joc, scorul și starea
+            șarpelui. Pilotul automat este oprit, deci jocul următor pornește din nou la tastele W, A, S, D.
         """
-        self.canvas.pack_forget()
-        self.create_start_screen()
+        self.set_state(MENU)
+        self.stop_multiplayer()
+        self.show_start_screen()
 
-        self.score = 0
-        self.game_over = False
-        self.game_started = False
-        self.snake = [(self.width // 2, self.height // 2),
-                      (self.width // 2 - self.block_size, self.height // 2)]
-        self.direction = None
-        self.food = self.generate_food()
+        self.engine.reset()
+        self.inputs.clear()
+        self.autopilot = None
 
-        self.score_label.config(text=f"Scor: {self.score}   High Score: {self.high_score}")
+        self.score_label.config(text=f"Scor: {self.engine.score}   High Score: {self.high_score}")
 
     def reset_game(self):
         """
             Resetează jocul păstrând nivelul curent.
 
-            Această metodă resetează starea jocului (șarpele, scorul, mâncarea) fără a schimba nivelul curent de dificultate. Folosită pentru a începe un nou joc la același nivel de dificultate.
+            Această metodă resetează starea jocului (șarpele, scorul, mâncarea) fără a schimba nivelul curent de
+            dificultate. Folosită pentru a începe un nou joc la același nivel de dificultate. Dacă pilotul automat
+            este pornit, noul joc începe imediat, condus de pilot.
         """
-        self.canvas.delete("all")
-        self.score = 0
-        self.game_over = False
-        self.game_started = False
-
-        initial_position_x = self.width // 2
-        initial_position_y = self.height // 2
-        self.snake = [(initial_position_x, initial_position_y),
-                      (initial_position_x - self.block_size, initial_position_y)]
-        self.direction = None
-
-        self.food = self.generate_food()
+        self.set_state(READY)
+        self.engine.reset()
+        self.inputs.clear()
 
-        self.draw_obstacles()
-        self.draw_snake()
-        self.draw_food()
+        self.renderer.reset(self.engine)
 
         start_message = "Press W, A, S, D to start"
-        self.canvas.create_text(self.width // 2, self.height // 2, text=start_message, fill="black",
-                                font=("Pixelify Sans", 16))
+        self.start_message = self.canvas.create_text(self.view_width // 2, self.view_height // 2, text=start_message,
+                                                     fill="black", font=("Pixelify Sans", 16))
 
         self.canvas.bind_all("<KeyPress>", self.on_key_press)
+        self.start_autopilot_game()
 
-        self.root.after(0, self.wait_for_start)
 
-    # DESENAREA GRAFICA
-    def draw_snake(self):
-        """
-            Desenează șarpele pe tabla de joc.
+def start_game(argv=None):
+    """
+        Inițiază și rulează jocul Snake.
 
-            Această metodă parcurge fiecare segment al șarpelui și îl desenează pe canvas. Fiecare segment este reprezentat printr-un dreptunghi în poziția corespunzătoare.
-        """
-        for segment in self.snake:
-            x, y = segment
-            self.canvas.create_rectangle(x, y, x + self.block_size, y + self.block_size, fill=self.snake_color)
+        Această funcție creează fereastra principală a jocului, inițializează jocul Snake cu parametrii specificați
+        și intră în bucla principală a evenimentelor Tkinter. Este punctul de intrare principal al jocului.
 
-    def draw_food(self):
-        """
-            Desenează mâncarea pe tabla de joc.
+        Exemplu: python main.py --debug-dir rapoarte
 
-            Această metodă desenează un cerc reprezentând mâncarea șarpelui în locația generată aleatoriu pe tabla de
-            joc.
-        """
-        x, y = self.food
-        self.canvas.create_oval(x, y, x + self.block_size, y + self.block_size, fill=self.food_color)
+        Args:
+            argv (list of str): Argumentele din linia de comandă (implicit sys.argv).
+    """
+    parser = argparse.ArgumentParser(prog="main.py", description="Snake Game")
+    parser.add_argument("--debug-dir", default=None,
+                        help="activeaza instrumentarea si scrie rapoartele JSON in acest director")
+    parser.add_argument("--sprites", action="store_true", help="deseneaza jocul din imagini pre-rasterizate")
+    parser.add_argument("--viewport", action="store_true",
+                        help="afiseaza doar fereastra din jurul capului sarpelui (automat pentru tablele mari)")
+    parser.add_argument("--file", default="tabla.json", help="fisierul cu nivelele")
+    parser.add_argument("--scores", default="scoruri.sqlite3",
+                        help="baza de date SQLite cu scorurile (\"\" - scorurile nu sunt salvate)")
+    parser.add_argument("--player", default=None,
+                        help="numele sub care sunt salvate scorurile (implicit numele utilizatorului)")
+    parser.add_argument("--connect", default=None, metavar="HOST:PORT",
+                        help="joaca pe un server cu mai multi jucatori (vezi python main.py server)")
+    parser.add_argument("--serve", default=None, choices=list(LEVEL_CONFIG),
+                        help="porneste un server local pentru nivelul dat si joaca pe el")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="portul serverului pornit cu --serve")
+    args = parser.parse_args(argv)
+    if args.player is None:
+        try:
+            args.player = getpass.getuser()
+        except (OSError, KeyError):
+            args.player = "jucator"
 
-    def draw_obstacles(self):
-        """
-            Desenează obstacolele pe tabla de joc.
+    score_store = ScoreStore(args.scores) if args.scores else None
+    root = tk.Tk()
+    game = SnakeGame(root, block_size=20, obstacles_file=args.file, debug_dir=args.debug_dir,
+                      sprites=args.sprites, viewport=args.viewport, score_store=score_store, player=args.player)
+    if args.serve is not None:
+        server = start_local_server(args.serve, args.file, port=args.port)
+        game.start_multiplayer("127.0.0.1", server.port)
+    elif args.connect is not None:
+        host, _, port = args.connect.rpartition(":")
+        game.start_multiplayer(host or "127.0.0.1", int(port))
+    try:
+        root.mainloop()
+    finally:
+        if score_store is not None:
+            score_store.close()
+
+
+def self_play(argv=None):
+    """
+        Rulează jocuri fără interfață grafică pe toate nucleele și afișează rezultatele în format JSON.
 
-            Această metodă iterează prin lista de obstacole și desenează fiecare obstacol pe canvas. Fiecare obstacol
-            este reprezentat printr-un dreptunghi în poziția specificată.
-        """
-        for obstacle in self.obstacles:
-            x, y = obstacle
-            self.canvas.create_rectangle(x, y, x + self.block_size, y + self.block_size, fill=self.obstacle_color)
+        Exemplu: python main.py selfplay --games 100000 --policy greedy --levels usor hardcore
 
+        Args:
+            argv (list of str): Argumentele din linia de comandă (implicit sys.argv după "selfplay").
+    """
+    from selfplay import run_self_play
 
-def start_game():
+    parser = argparse.ArgumentParser(prog="main.py selfplay", description="Self-play Snake fara interfata grafica")
+    parser.add_argument("--games", type=int, default=1000, help="numarul de jocuri pentru fiecare nivel")
+    parser.add_argument("--levels", nargs="+", default=list(LEVEL_CONFIG), choices=list(LEVEL_CONFIG))
+    parser.add_argument("--policy", default="greedy", help="random, greedy, autopilot sau modul:functie")
+    parser.add_argument("--workers", type=int, default=None, help="numarul de procese (implicit toate nucleele)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ticks", type=int, default=10000)
+    parser.add_argument("--file", default="tabla.json", help="fisierul cu nivelele")
+    args = parser.parse_args(argv)
+
+    results = run_self_play(args.games, levels=args.levels, policy=args.policy, workers=args.workers,
+                            seed=args.seed, max_ticks=args.max_ticks, obstacles_file=args.file)
+    print(json.dumps(results, indent=4))
+
+
+def serve(argv=None):
     """
-        Inițiază și rulează jocul Snake.
+        Rulează serverul jocului cu mai mulți jucători până la Ctrl+C.
 
-        Această funcție creează fereastra principală a jocului, inițializează jocul Snake cu parametrii specificați
-        și intră în bucla principală a evenimentelor Tkinter. Este punctul de intrare principal al jocului.
+        Exemplu: python main.py server --level normal --host 0.0.0.0 --port 8765
+
+        Args:
+            argv (list of str): Argumentele din linia de comandă (implicit sys.argv după "server").
     """
-    obstacles_file = "tabla.json"
-    root = tk.Tk()
-    game = SnakeGame(root, block_size=20, obstacles_file=obstacles_file)
-    root.mainloop()
+    from multiplayer import MultiplayerServer
+
+    parser = argparse.ArgumentParser(prog="main.py server", description="Server Snake cu mai multi jucatori")
+    parser.add_argument("--level", default="normal", choices=list(LEVEL_CONFIG))
+    parser.add_argument("--host", default="127.0.0.1", help="adresa pe care asculta serverul")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--file", default="tabla.json", help="fisierul cu nivelele")
+    args = parser.parse_args(argv)
+
+    server = MultiplayerServer.from_level(args.level, args.file, seed=args.seed, host=args.host, port=args.port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def export(argv=None):
+    """
+        Desenează replay-uri salvate, fără display, ca GIF-uri animate sau secvențe PNG, pe toate nucleele.
+
+        Pentru fiecare fișier "<nume>.snkr" este scris "<nume>.gif" sau directorul "<nume>/" cu PNG-uri în
+        directorul de ieșire.
+
+        Exemplu: python main.py export replays/*.snkr --output clipuri --format gif
+
+        Args:
+            argv (list of str): Argumentele din linia de comandă (implicit sys.argv după "export").
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from raster import export_replay
+
+    parser = argparse.ArgumentParser(prog="main.py export", description="Export replay-uri Snake ca GIF sau PNG")
+    parser.add_argument("replays", nargs="+", help="fisierele replay (.snkr)")
+    parser.add_argument("--output", default="export", help="directorul in care sunt scrise imaginile")
+    parser.add_argument("--format", default="gif", choices=["gif", "png"])
+    parser.add_argument("--delay", type=int, default=10, help="durata unui cadru GIF, in sutimi de secunda")
+    parser.add_argument("--workers", type=int, default=None, help="numarul de procese (implicit toate nucleele)")
+    parser.add_argument("--file", default="tabla.json", help="fisierul cu nivelele folosit la inregistrare")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        jobs = {}
+        for path in args.replays:
+            name = os.path.splitext(os.path.basename(path))[0]
+            output = os.path.join(args.output, f"{name}.gif" if args.format == "gif" else name)
+            jobs[path] = executor.submit(export_replay, path, output, args.format, args.file, delay=args.delay)
+        for path, job in jobs.items():
+            print(f"{path}: {job.result()} cadre")
 
 
 if __name__ == "__main__":
-    start_game()
+    if len(sys.argv) > 1 and sys.argv[1] == "selfplay":
+        self_play(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "server":
+        serve(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == "export":
+        export(sys.argv[2:])
+    else:
+        start_game(sys.argv[1:])
@@ -0,0 +1,889 @@
+import asyncio
+import itertools
+import queue
+import random
+import threading
+import time
+from collections import deque
+
+from engine import SnakeEngine, DIRECTIONS, OPPOSITE, LEFT, RIGHT, CELL_EMPTY, CELL_SNAKE, CELL_OBSTACLE
+from inputs import InputQueue
+from levels import LEVEL_CONFIG, load_level_pack
+from replay import DIRECTION_CODES, encode_varint, decode_varint
+from scheduler import TickScheduler
+
+# Protocolul: fiecare mesaj al serverului este precedat de lungimea lui (varint) si incepe cu tipul mesajului.
+# Campurile sunt varint-uri; celulele sunt trimise ca index (rand * cols + coloana). Clientul trimite cate un octet
+# pentru fiecare apasare: codul directiei (indexul in DIRECTION_CODES).
+#
+# MSG_WELCOME: id-ul jucatorului, nivelul (lungime + text), cols, rows, perioada tick-ului in ms, obstacolele
+#     (numar + celule)
+# MSG_SNAPSHOT: tick-ul, sarpii (numar, apoi pentru fiecare: id, scor, lungime, celulele de la cap la coada),
+#     mancarea (numar + celule)
+# MSG_DELTA: tick-ul, mutarile (numar, apoi id si noul cap << 1 | a mancat), sarpii morti (numar + id-uri),
+#     sarpii aparuti (numar, apoi id, lungime si celule), mancarea disparuta si mancarea noua (numar + celule)
+MSG_WELCOME = 0
+MSG_SNAPSHOT = 1
+MSG_DELTA = 2
+
+DEFAULT_PORT = 8765
+# Numarul de tick-uri dupa care reapare un sarpe mort.
+RESPAWN_TICKS = 10
+# Peste atatia octeti netrimisi, clientul nu mai primeste delta-uri, ci o stare completa cand se elibereaza.
+MAX_BUFFER = 64 * 1024
+# Peste atatia octeti netrimisi, clientul este deconectat.
+MAX_BACKLOG = 1024 * 1024
+
+_CODES = {direction: code for code, direction in enumerate(DIRECTION_CODES)}
+
+
+class MultiSnakeState:
+    """
+    Starea autoritara a unui joc cu mai multi sarpi pe aceeasi tabla.
+
+    Regulile sunt cele din SnakeEngine, aplicate simultan tuturor sarpilor: un cap care intra in margine, intr-un
+    obstacol sau in orice sarpe (inclusiv in cozi, care se elibereaza abia dupa mutare) moare, iar doua capete care
+    intra in aceeasi celula mor amandoua. Un sarpe mort dispare de pe tabla si reapare dupa RESPAWN_TICKS tick-uri,
+    cu scorul 0. Pe tabla sunt mereu food_count mancaruri, cat timp exista loc.
+
+    Atribute:
+
+    • cols: int - numarul de coloane ale tablei
+    • rows: int - numarul de randuri ale tablei
+    • obstacles: list - celulele (coloana, rand) ocupate de obstacole
+    • grid: bytearray - harta de ocupare (CELL_EMPTY, CELL_SNAKE, CELL_OBSTACLE), la indexul rand * cols + coloana
+    • snakes: dict - pentru fiecare jucator viu, deque-ul indecsilor celulelor sarpelui, capul fiind primul
+    • directions: dict - directia curenta a fiecarui jucator viu
+    • scores: dict - scorul fiecarui jucator
+    • food: set - indecsii celulelor cu mancare
+    • tick: int - numarul de tick-uri simulate
+    • rng: obiect de tip random.Random - generatorul folosit pentru mancare si pentru pozitiile de start
+
+    Metode:
+
+    • add_player(player) - adauga un jucator, care apare pe tabla la urmatorul tick
+    • remove_player(player) - scoate un jucator din joc
+    • turn(player, direction) - schimba directia unui jucator
+    • step() - avanseaza jocul cu un tick si returneaza schimbarile
+
+    """
+
+    def __init__(self, cols, rows, obstacles=(), food_count=3, seed=None):
+        """
+            Inițializează starea jocului.
+
+            Args:
+                cols (int): Numărul de coloane ale tablei.
+                rows (int): Numărul de rânduri ale tablei.
+                obstacles (iterable of tuple): Celulele (coloană, rând) ocupate de obstacole.
+                food_count (int): Numărul de mâncăruri de pe tablă.
+                seed (int): Sămânța generatorului (opțional).
+        """
+        self.cols = cols
+        self.rows = rows
+        self.obstacles = list(obstacles)
+        self.food_count = food_count
+        self.rng = random.Random(seed)
+        self.grid = bytearray(cols * rows)
+        for col, row in self.obstacles:
+            if 0 <= col < cols and 0 <= row < rows:
+                self.grid[row * cols + col] = CELL_OBSTACLE
+        self.snakes = {}
+        self.directions = {}
+        self.scores = {}
+        self.food = set()
+        self.tick = 0
+        self._respawns = {}
+        self._departed = []
+        self._moves = {direction: dy * cols + dx for direction, (dx, dy) in DIRECTIONS.items()}
+        self._refill_food()
+
+    def _random_cell(self, first_row, last_row, fits):
+        """
+            Alege o celulă aleatoare între rândurile date pentru care `fits(index)` este adevărat: întâi prin
+            încercări aleatoare, apoi, dacă tabla este aproape plină, prin căutare exactă.
+
+            Returns:
+                int: Indexul celulei sau None dacă nu există nicio celulă potrivită.
+        """
+        if last_row < first_row:
+            return None
+        start, end = first_row * self.cols, (last_row + 1) * self.cols
+        for _ in range(32):
+            index = self.rng.randrange(start, end)
+            if fits(index):
+                return index
+        cells = [index for index in range(start, end) if fits(index)]
+        return self.rng.choice(cells) if cells else None
+
+    def _refill_food(self):
+        added = []
+        grid, food = self.grid, self.food
+        first_row = SnakeEngine.FOOD_FIRST_ROW
+        last_row = min(self.rows - SnakeEngine.FOOD_BOTTOM_MARGIN, self.rows - 1)
+        while len(food) < self.food_count:
+            index = self._random_cell(first_row, last_row,
+                                      lambda index: grid[index] == CELL_EMPTY and index not in food)
+            if index is None:
+                break
+            food.add(index)
+            added.append(index)
+        return added
+
+    def _spawn(self, player):
+        """
+            Plasează un șarpe de lungime 2, orientat spre dreapta, cu cel puțin trei celule libere în fața capului.
+
+            Returns:
+                list of int: Celulele șarpelui, capul fiind primul, sau None dacă nu există loc.
+        """
+        cols, grid, food = self.cols, self.grid, self.food
+
+        def fits(index):
+            col = index % cols
+            if col < 1 or col + 3 >= cols:
+                return False
+            return all(grid[cell] == CELL_EMPTY and cell not in food for cell in range(index - 1, index + 4))
+
+        head = self._random_cell(SnakeEngine.FIRST_ROW, self.rows - 1, fits)
+        if head is None:
+            return None
+        cells = [head, head - 1]
+        for index in cells:
+            grid[index] = CELL_SNAKE
+        self.snakes[player] = deque(cells)
+        self.directions[player] = RIGHT
+        self.scores[player] = 0
+        return cells
+
+    def add_player(self, player):
+        """
+            Adaugă un jucător. Șarpele lui apare pe tablă la următorul tick (sau la primul tick la care există
+            loc), ca toți clienții să afle de el din schimbările acelui tick.
+
+            Args:
+                player (int): Id-ul jucătorului.
+        """
+        self.scores[player] = 0
+        self._respawns[player] = self.tick + 1
+
+    def remove_player(self, player):
+        """
+            Scoate un jucător din joc și eliberează celulele șarpelui lui.
+
+            Args:
+                player (int): Id-ul jucătorului.
+
+            Returns:
+                bool: True dacă șarpele jucătorului era pe tablă.
+        """
+        self.scores.pop(player, None)
+        self._respawns.pop(player, None)
+        self.directions.pop(player, None)
+        snake = self.snakes.pop(player, None)
+        if snake is None:
+            return False
+        for index in snake:
+            self.grid[index] = CELL_EMPTY
+        self._departed.append(player)
+        return True
+
+    def turn(self, player, direction):
+        """
+            Schimbă direcția unui jucător, fără a permite întoarcerea directă înapoi.
+
+            Args:
+                player (int): Id-ul jucătorului.
+                direction (str): Direcția nouă ("Up", "Down", "Left", "Right").
+
+            Returns:
+                bool: True dacă direcția a fost acceptată.
+        """
+        current = self.directions.get(player)
+        if current is None or direction == OPPOSITE[current]:
+            return False
+        self.directions[player] = direction
+        return True
+
+    def step(self):
+        """
+            Avansează jocul cu un tick: toți șerpii se mută simultan.
+
+            Returns:
+                dict: Schimbările tick-ului: "moves" (tupluri (jucător, noul cap, a mâncat)), "deaths" (jucătorii
+                morți sau ieșiți din joc de la tick-ul anterior), "spawns" (tupluri (jucător, celule)),
+                "food_removed" și "food_added" (celule).
+        """
+        self.tick += 1
+        cols, rows, grid, food = self.cols, self.rows, self.grid, self.food
+        first_row = SnakeEngine.FIRST_ROW * cols
+
+        targets = {}
+        deaths = []
+        departed, self._departed = self._departed, []
+        for player, snake in self.snakes.items():
+            head = snake[0]
+            direction = self.directions[player]
+            target = head + self._moves[direction]
+            col = head % cols
+            if ((direction == RIGHT and col == cols - 1) or (direction == LEFT and col == 0)
+                    or target < first_row or target >= cols * rows or grid[target] != CELL_EMPTY):
+                deaths.append(player)
+            else:
+                targets.setdefault(target, []).append(player)
+        for players in targets.values():
+            if len(players) > 1:
+                deaths.extend(players)
+
+        moves = []
+        eaten = []
+        for target, players in targets.items():
+            if len(players) > 1:
+                continue
+            player = players[0]
+            snake = self.snakes[player]
+            ate = target in food
+            if ate:
+                eaten.append(target)
+                self.scores[player] += 1
+            else:
+                grid[snake.pop()] = CELL_EMPTY
+            moves.append((player, target, ate))
+        for player, target, _ in moves:
+            self.snakes[player].appendleft(target)
+            grid[target] = CELL_SNAKE
+
+        for player in deaths:
+            for index in self.snakes.pop(player):
+                grid[index] = CELL_EMPTY
+            del self.directions[player]
+            self._respawns[player] = self.tick + RESPAWN_TICKS
+
+        food.difference_update(eaten)
+        spawns = []
+        for player, due in list(self._respawns.items()):
+            if due <= self.tick:
+                cells = self._spawn(player)
+                if cells is not None:
+                    del self._respawns[player]
+                    spawns.append((player, cells))
+        added = self._refill_food()
+        return {"moves": moves, "deaths": departed + deaths, "spawns": spawns, "food_removed": eaten,
+                "food_added": added}
+
+
+def _encode_cells(cells, out):
+    encode_varint(len(cells), out)
+    for index in cells:
+        encode_varint(index, out)
+
+
+def _decode_cells(data, position):
+    count, position = decode_varint(data, position)
+    cells = []
+    for _ in range(count):
+        index, position = decode_varint(data, position)
+        cells.append(index)
+    return cells, position
+
+
+def frame(payload):
+    """
+        Adaugă lungimea mesajului în fața lui, pentru trimiterea pe un stream.
+
+        Args:
+            payload (bytes): Mesajul.
+
+        Returns:
+            bytes: Mesajul precedat de lungimea lui (varint).
+    """
+    out = bytearray()
+    encode_varint(len(payload), out)
+    out += payload
+    return bytes(out)
+
+
+def encode_welcome(player, level, state, period_ms):
+    """
+        Returns:
+            bytes: Mesajul MSG_WELCOME pentru un jucător nou.
+    """
+    out = bytearray([MSG_WELCOME])
+    encode_varint(player, out)
+    name = level.encode("utf-8")
+    encode_varint(len(name), out)
+    out += name
+    encode_varint(state.cols, out)
+    encode_varint(state.rows, out)
+    encode_varint(period_ms, out)
+    _encode_cells([row * state.cols + col for col, row in state.obstacles], out)
+    return bytes(out)
+
+
+def encode_snapshot(state):
+    """
+        Returns:
+            bytes: Mesajul MSG_SNAPSHOT cu starea completă a jocului.
+    """
+    out = bytearray([MSG_SNAPSHOT])
+    encode_varint(state.tick, out)
+    encode_varint(len(state.snakes), out)
+    for player, snake in state.snakes.items():
+        encode_varint(player, out)
+        encode_varint(state.scores[player], out)
+        _encode_cells(snake, out)
+    _encode_cells(sorted(state.food), out)
+    return bytes(out)
+
+
+def encode_delta(tick, changes):
+    """
+        Args:
+            tick (int): Tick-ul la care s-au produs schimbările.
+            changes (dict): Schimbările returnate de `MultiSnakeState.step`.
+
+        Returns:
+            bytes: Mesajul MSG_DELTA.
+    """
+    out = bytearray([MSG_DELTA])
+    encode_varint(tick, out)
+    encode_varint(len(changes["moves"]), out)
+    for player, head, ate in changes["moves"]:
+        encode_varint(player, out)
+        encode_varint(head << 1 | ate, out)
+    _encode_cells(changes["deaths"], out)
+    encode_varint(len(changes["spawns"]), out)
+    for player, cells in changes["spawns"]:
+        encode_varint(player, out)
+        _encode_cells(cells, out)
+    _encode_cells(changes["food_removed"], out)
+    _encode_cells(changes["food_added"], out)
+    return bytes(out)
+
+
+class ClientState:
+    """
+    Copia starii jocului tinuta de un client, actualizata din mesajele serverului.
+
+    Dupa fiecare mesaj aplicat, atributele moved, died, spawned, food_removed si food_added descriu schimbarile lui,
+    ca un renderer sa poata actualiza desenul incremental; full este True cand mesajul a inlocuit toata starea
+    (MSG_WELCOME sau MSG_SNAPSHOT).
+
+    Atribute:
+
+    • player: int - id-ul jucatorului acestui client (None inainte de MSG_WELCOME)
+    • level: str - nivelul jucat
+    • cols: int - numarul de coloane ale tablei
+    • rows: int - numarul de randuri ale tablei
+    • period_ms: int - perioada unui tick al serverului, in milisecunde
+    • obstacles: list - celulele (coloana, rand) ocupate de obstacole
+    • tick: int - ultimul tick primit
+    • snakes: dict - pentru fiecare jucator viu, deque-ul celulelor (coloana, rand) ale sarpelui, capul primul
+    • scores: dict - scorul fiecarui jucator viu
+    • food: set - celulele (coloana, rand) cu mancare
+    • full: bool - True daca ultimul mesaj a inlocuit toata starea
+    • moved: list - tupluri (jucator, cap nou, celula eliberata de coada sau None) din ultimul mesaj
+    • died: list - tupluri (jucator, celule) pentru sarpii morti in ultimul mesaj
+    • spawned: list - jucatorii aparuti in ultimul mesaj
+    • food_removed: list - celulele de mancare disparute in ultimul mesaj
+    • food_added: list - celulele de mancare noi din ultimul mesaj
+
+    Metode:
+
+    • apply(payload) - aplica un mesaj al serverului
+
+    """
+
+    def __init__(self):
+        self.player = None
+        self.level = None
+        self.cols = 0
+        self.rows = 0
+        self.period_ms = 0
+        self.obstacles = []
+        self.tick = 0
+        self.snakes = {}
+        self.scores = {}
+        self.food = set()
+        self._clear_changes()
+
+    def _clear_changes(self):
+        self.full = False
+        self.moved = []
+        self.died = []
+        self.spawned = []
+        self.food_removed = []
+        self.food_added = []
+
+    def _cell(self, index):
+        return index % self.cols, index // self.cols
+
+    def apply(self, payload):
+        """
+            Aplică un mesaj al serverului.
+
+            Args:
+                payload (bytes): Mesajul, fără lungimea din față.
+
+            Returns:
+                int: Tipul mesajului.
+
+            Raises:
+                ValueError: Dacă mesajul nu este valid.
+        """
+        self._clear_changes()
+        kind, position = payload[0], 1
+        if kind == MSG_WELCOME:
+            self.player, position = decode_varint(payload, position)
+            length, position = decode_varint(payload, position)
+            self.level = payload[position:position + length].decode("utf-8")
+            position += length
+            self.cols, position = decode_varint(payload, position)
+            self.rows, position = decode_varint(payload, position)
+            self.period_ms, position = decode_varint(payload, position)
+            obstacles, position = _decode_cells(payload, position)
+            self.obstacles = [self._cell(index) for index in obstacles]
+            self.snakes, self.scores, self.food = {}, {}, set()
+            self.full = True
+        elif kind == MSG_SNAPSHOT:
+            self.tick, position = decode_varint(payload, position)
+            count, position = decode_varint(payload, position)
+            self.snakes, self.scores = {}, {}
+            for _ in range(count):
+                player, position = decode_varint(payload, position)
+                self.scores[player], position = decode_varint(payload, position)
+                cells, position = _decode_cells(payload, position)
+                self.snakes[player] = deque(self._cell(index) for index in cells)
+            food, position = _decode_cells(payload, position)
+            self.food = {self._cell(index) for index in food}
+            self.full = True
+        elif kind == MSG_DELTA:
+            self.tick, position = decode_varint(payload, position)
+            count, position = decode_varint(payload, position)
+            for _ in range(count):
+                player, position = decode_varint(payload, position)
+                value, position = decode_varint(payload, position)
+                snake = self.snakes[player]
+                snake.appendleft(self._cell(value >> 1))
+                if value & 1:
+                    self.scores[player] += 1
+                    self.moved.append((player, snake[0], None))
+                else:
+                    self.moved.append((player, snake[0], snake.pop()))
+            deaths, position = _decode_cells(payload, position)
+            for player in deaths:
+                # Un jucator iesit inainte ca acest client sa primeasca starea completa nu mai este in snakes.
+                snake = self.snakes.pop(player, None)
+                if snake is not None:
+                    self.died.append((player, snake))
+                self.scores.pop(player, None)
+            count, position = decode_varint(payload, position)
+            for _ in range(count):
+                player, position = decode_varint(payload, position)
+                cells, position = _decode_cells(payload, position)
+                self.snakes[player] = deque(self._cell(index) for index in cells)
+                self.scores[player] = 0
+                self.spawned.append(player)
+            removed, position = _decode_cells(payload, position)
+            added, position = _decode_cells(payload, position)
+            self.food_removed = [self._cell(index) for index in removed]
+            self.food_added = [self._cell(index) for index in added]
+            self.food.difference_update(self.food_removed)
+            self.food.update(self.food_added)
+        else:
+            raise ValueError(f"Mesaj necunoscut: {kind}")
+        return kind
+
+
+class _Connection:
+    """
+        Un client conectat la server: stream-ul lui, comenzile în așteptare și starea de resincronizare.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.inputs = InputQueue()
+        self.stale = False
+
+
+class MultiplayerServer:
+    """
+    Server asyncio pentru jocul cu mai multi jucatori: simuleaza starea autoritara (MultiSnakeState) si trimite
+    clientilor, la fiecare tick, doar schimbarile (MSG_DELTA).
+
+    Mesajul unui tick este codificat o singura data si acelasi buffer este scris tuturor clientilor, fara sa se
+    astepte trimiterea lui, deci un client lent nu intarzie bucla. Cand un client are mai mult de max_buffer octeti
+    netrimisi, nu mai primeste delta-uri; dupa ce bufferul se goleste primeste o stare completa (MSG_SNAPSHOT) si
+    continua cu delta-uri. Un client cu peste MAX_BACKLOG octeti netrimisi este deconectat. Comenzile fiecarui
+    client trec printr-un InputQueue, cate una pe tick. Tick-urile sunt planificate cu TickScheduler, deci un server
+    supraincarcat renunta la tick-uri in loc sa acumuleze intarziere.
+
+    Atribute:
+
+    • state: obiect de tip MultiSnakeState - starea jocului
+    • level: str - numele nivelului, trimis clientilor
+    • period_ms: int - perioada unui tick, in milisecunde
+    • host: str - adresa pe care asculta serverul
+    • port: int - portul pe care asculta serverul (portul real dupa `start`, daca s-a cerut portul 0)
+    • max_buffer: int - numarul de octeti netrimisi peste care un client trece pe stari complete
+    • clients: dict - conexiunile active, dupa id-ul jucatorului
+    • scheduler: obiect de tip TickScheduler - planifica tick-urile si masoara durata lor
+
+    Metode:
+
+    • from_level(level, obstacles_file, block_size, **kwargs) - creeaza serverul pentru un nivel din fisier
+    • start() - porneste ascultarea conexiunilor
+    • run(ticks=None) - ruleaza bucla jocului
+    • serve_forever() - porneste serverul si ruleaza bucla pana la oprire
+    • close() - inchide serverul si conexiunile
+
+    """
+
+    def __init__(self, state, level, period_ms, host="127.0.0.1", port=DEFAULT_PORT, max_buffer=MAX_BUFFER):
+        """
+            Inițializează serverul.
+
+            Args:
+                state (MultiSnakeState): Starea jocului.
+                level (str): Numele nivelului.
+                period_ms (int): Perioada unui tick, în milisecunde.
+                host (str): Adresa pe care ascultă serverul.
+                port (int): Portul pe care ascultă serverul (0 - un port liber ales de sistem).
+                max_buffer (int): Numărul de octeți netrimiși peste care un client trece pe stări complete.
+        """
+        self.state = state
+        self.level = level
+        self.period_ms = period_ms
+        self.host = host
+        self.port = port
+        self.max_buffer = max_buffer
+        self.clients = {}
+        self.scheduler = None
+        self._server = None
+        self._ids = itertools.count(1)
+
+    @classmethod
+    def from_level(cls, level="normal", obstacles_file="tabla.json", block_size=20, food_count=None, seed=None,
+                   **kwargs):
+        """
+            Creează serverul pentru un nivel din fișierul de nivele, cu viteza nivelului.
+
+            Args:
+                level (str): Nivelul ("usor", "normal", "hardcore").
+                obstacles_file (str): Calea către fișierul JSON cu nivelele.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                food_count (int): Numărul de mâncăruri (opțional); implicit una la 300 de celule, cel puțin 3.
+                seed (int): Sămânța generatorului (opțional).
+                **kwargs: Argumente transmise constructorului (host, port, max_buffer).
+
+            Returns:
+                MultiplayerServer: Serverul.
+        """
+        pack = load_level_pack(obstacles_file, block_size)
+        if food_count is None:
+            food_count = max(3, pack.cols * pack.rows // 300)
+        state = MultiSnakeState(pack.cols, pack.rows, pack.level(level).obstacles(), food_count, seed)
+        return cls(state, level, LEVEL_CONFIG[level]["viteza"], **kwargs)
+
+    async def start(self):
+        """
+            Pornește ascultarea conexiunilor.
+        """
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def run(self, ticks=None):
+        """
+            Rulează bucla jocului.
+
+            Args:
+                ticks (int): Numărul de tick-uri simulate (opțional); implicit până la anularea task-ului.
+        """
+        loop = asyncio.get_running_loop()
+        self.scheduler = TickScheduler(self.period_ms, clock=loop.time)
+        self.scheduler.start()
+        played = 0
+        while ticks is None or played < ticks:
+            for _ in range(self.scheduler.due_ticks()):
+                start = time.perf_counter()
+                self._tick()
+                self.scheduler.record(time.perf_counter() - start)
+                played += 1
+            await asyncio.sleep(self.scheduler.delay_ms() / 1000)
+
+    async def serve_forever(self):
+        """
+            Pornește serverul și rulează bucla jocului până la oprire.
+        """
+        await self.start()
+        try:
+            await self.run()
+        finally:
+            self.close()
+
+    def close(self):
+        """
+            Închide serverul și toate conexiunile.
+        """
+        if self._server is not None:
+            self._server.close()
+        for connection in self.clients.values():
+            connection.writer.close()
+        self.clients.clear()
+
+    def _tick(self):
+        """
+            Aplică câte o comandă a fiecărui client, avansează starea și trimite schimbările.
+        """
+        state = self.state
+        for player, connection in self.clients.items():
+            direction = connection.inputs.pop(state.directions.get(player))
+            if direction is not None:
+                state.turn(player, direction)
+        changes = state.step()
+        message = frame(encode_delta(state.tick, changes))
+        snapshot = None
+        for player, connection in list(self.clients.items()):
+            writer = connection.writer
+            if writer.is_closing():
+                continue
+            backlog = writer.transport.get_write_buffer_size()
+            if backlog > MAX_BACKLOG:
+                writer.close()
+                continue
+            if backlog > self.max_buffer:
+                connection.stale = True
+                continue
+            if connection.stale:
+                if snapshot is None:
+                    snapshot = frame(encode_snapshot(state))
+                writer.write(snapshot)
+                connection.stale = False
+            else:
+                writer.write(message)
+
+    async def _handle(self, reader, writer):
+        """
+            Tratează un client: îl adaugă în joc, îi trimite starea și citește comenzile lui până la deconectare.
+        """
+        player = next(self._ids)
+        self.state.add_player(player)
+        connection = _Connection(writer)
+        self.clients[player] = connection
+        writer.write(frame(encode_welcome(player, self.level, self.state, self.period_ms)))
+        writer.write(frame(encode_snapshot(self.state)))
+        try:
+            while True:
+                data = await reader.read(64)
+                if not data:
+                    break
+                for code in data:
+                    if code < len(DIRECTION_CODES):
+                        connection.inputs.push(DIRECTION_CODES[code])
+        except ConnectionError:
+            pass
+        finally:
+            self.clients.pop(player, None)
+            self.state.remove_player(player)
+            writer.close()
+
+
+class MultiplayerClient:
+    """
+    Client asyncio: trimite directiile jucatorului si aplica mesajele serverului pe un ClientState.
+
+    Atribute:
+
+    • host: str - adresa serverului
+    • port: int - portul serverului
+    • state: obiect de tip ClientState - copia starii jocului
+    • on_message: callable - apelata cu tipul fiecarui mesaj aplicat (optional)
+
+    Metode:
+
+    • connect() - se conecteaza la server
+    • run() - citeste si aplica mesajele serverului pana la deconectare
+    • send(direction) - trimite o directie serverului
+    • close() - inchide conexiunea
+
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, on_message=None):
+        self.host = host
+        self.port = port
+        self.on_message = on_message
+        self.state = ClientState()
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        """
+            Se conectează la server.
+        """
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+    async def run(self):
+        """
+            Citește mesajele serverului și le aplică pe `state` până când serverul închide conexiunea.
+        """
+        async for payload in read_messages(self._reader):
+            kind = self.state.apply(payload)
+            if self.on_message is not None:
+                self.on_message(kind)
+
+    def send(self, direction):
+        """
+            Trimite o direcție serverului.
+
+            Args:
+                direction (str): Direcția ("Up", "Down", "Left", "Right").
+        """
+        self._writer.write(bytes([_CODES[direction]]))
+
+    def close(self):
+        """
+            Închide conexiunea.
+        """
+        if self._writer is not None:
+            self._writer.close()
+
+
+async def read_messages(reader):
+    """
+        Citește mesajele încadrate (lungime + conținut) de pe un stream, până la închiderea lui.
+
+        Args:
+            reader (asyncio.StreamReader): Stream-ul.
+
+        Yields:
+            bytes: Conținutul fiecărui mesaj.
+    """
+    buffer = bytearray()
+    while True:
+        data = await reader.read(65536)
+        if not data:
+            return
+        buffer += data
+        position = 0
+        while True:
+            try:
+                length, start = decode_varint(buffer, position)
+            except ValueError:
+                break
+            if start + length > len(buffer):
+                break
+            yield bytes(buffer[start:start + length])
+            position = start + length
+        del buffer[:position]
+
+
+class ThreadedClient:
+    """
+    Client pentru interfata Tkinter: conexiunea ruleaza pe un fir separat, cu propria bucla asyncio, iar mesajele
+    primite sunt puse intr-o coada citita de firul Tk.
+
+    Atribute:
+
+    • host: str - adresa serverului
+    • port: int - portul serverului
+    • messages: obiect de tip queue.Queue - mesajele serverului, neaplicate; None la deconectare
+
+    Metode:
+
+    • start() - porneste firul conexiunii
+    • send(direction) - trimite o directie serverului, din orice fir
+    • close() - inchide conexiunea
+
+    """
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT):
+        self.host = host
+        self.port = port
+        self.messages = queue.Queue()
+        self._loop = None
+        self._task = None
+        self._writer = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="MultiplayerClient", daemon=True)
+
+    def start(self):
+        """
+            Pornește firul conexiunii.
+        """
+        self._thread.start()
+
+    def _run(self):
+        loop = asyncio.new_event_loop()
+        self._task = loop.create_task(self._receive())
+        self._loop = loop
+        if self._closed:
+            self._task.cancel()
+        try:
+            loop.run_until_complete(self._task)
+        except (OSError, asyncio.CancelledError):
+            pass
+        finally:
+            self.messages.put(None)
+            loop.close()
+
+    async def _receive(self):
+        reader, self._writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            async for payload in read_messages(reader):
+                self.messages.put(payload)
+        finally:
+            self._writer.close()
+
+    def send(self, direction):
+        """
+            Trimite o direcție serverului. Poate fi apelată din firul Tk.
+
+            Args:
+                direction (str): Direcția ("Up", "Down", "Left", "Right").
+        """
+        if self._writer is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._writer.write, bytes([_CODES[direction]]))
+
+    def close(self):
+        """
+            Închide conexiunea, chiar dacă este încă în curs de stabilire; firul conexiunii se termină după aceea.
+            Poate fi apelată din firul Tk, de mai multe ori.
+        """
+        self._closed = True
+        if self._loop is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass
+
+
+def start_local_server(level="normal", obstacles_file="tabla.json", block_size=20, host="127.0.0.1", port=0):
+    """
+        Pornește un server pe un fir separat, de exemplu pentru a juca local cu alți clienți de pe aceeași mașină.
+
+        Args:
+            level (str): Nivelul.
+            obstacles_file (str): Calea către fișierul JSON cu nivelele.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+            host (str): Adresa pe care ascultă serverul.
+            port (int): Portul (0 - un port liber ales de sistem).
+
+        Returns:
+            MultiplayerServer: Serverul, deja pornit; portul real este în `port`.
+    """
+    server = MultiplayerServer.from_level(level, obstacles_file, block_size, host=host, port=port)
+    ready = threading.Event()
+
+    async def serve():
+        try:
+            await server.start()
+        finally:
+            ready.set()
+        await server.run()
+
+    thread = threading.Thread(target=asyncio.run, args=(serve(),), name="MultiplayerServer", daemon=True)
+    thread.start()
+    ready.wait()
+    if server._server is None:
+        raise OSError(f"Serverul nu a putut asculta pe {host}:{port}")
+    return server
@@ -0,0 +1,487 @@
+import os
+import struct
+import zlib
+
+from engine import CELL_OBSTACLE, CELL_SNAKE
+from replay import Replay, replay_game
+
+# Culorile Tk folosite de joc, ca (rosu, verde, albastru); Tk foloseste culorile X11, deci "green" este #00ff00.
+COLORS = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 255, 0),
+    "blue": (0, 0, 255),
+    "orange": (255, 165, 0),
+    "yellow": (255, 255, 0),
+    "gray": (190, 190, 190),
+    "lightblue": (173, 216, 230),
+    "lightgreen": (144, 238, 144),
+}
+# Fundalul implicit al unui tk.Canvas.
+CANVAS_BACKGROUND = "#d9d9d9"
+
+# Indecsii culorilor in paleta framebuffer-ului; TRANSPARENT este folosit doar in cadrele GIF.
+BACKGROUND, OUTLINE, SNAKE, FOOD, OBSTACLE, TRANSPARENT = range(6)
+_PALETTE_SIZE = 8
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Dimensiunea minima a codurilor LZW din GIF: 3 biti, pentru o paleta de 8 culori.
+_GIF_CODE_SIZE = 3
+_GIF_MAX_CODE = 4096
+
+
+def parse_color(color):
+    """
+        Transformă o culoare Tk într-un tuplu (roșu, verde, albastru).
+
+        Args:
+            color (str): Numele culorii (din COLORS) sau "#rgb" / "#rrggbb".
+
+        Returns:
+            tuple: Componentele (roșu, verde, albastru), între 0 și 255.
+
+        Raises:
+            ValueError: Dacă culoarea nu este cunoscută.
+    """
+    if color.startswith("#") and len(color) in (4, 7):
+        digits = color[1:]
+        if len(digits) == 3:
+            digits = "".join(digit * 2 for digit in digits)
+        try:
+            return tuple(int(digits[index:index + 2], 16) for index in (0, 2, 4))
+        except ValueError:
+            pass
+    rgb = COLORS.get(color.lower())
+    if rgb is None:
+        raise ValueError(f"Culoare necunoscuta: {color!r}")
+    return rgb
+
+
+class FrameRenderer:
+    """
+    Desenarea jocului intr-un framebuffer in memorie, fara Tk si fara display.
+
+    Framebuffer-ul este un bytearray cu cate un octet (indexul culorii in paleta) pentru fiecare pixel, ca tabla
+    desenata de CanvasRenderer: segmentele sarpelui si obstacolele sunt dreptunghiuri cu contur negru, iar mancarea
+    este un cerc. Fiecare rand de pixeli incepe cu un octet 0, filtrul "None" din PNG, deci framebuffer-ul este chiar
+    imaginea necomprimata dintr-un PNG si este comprimat direct, fara copiere. Blocurile sunt rasterizate o singura
+    data, iar `update` redeseneaza doar celulele schimbate la ultimul tick: noul cap, celula eliberata de coada si
+    vechea si noua pozitie a mancarii.
+
+    Atribute:
+
+    • block_size: int - dimensiunea unui bloc, in pixeli
+    • palette: list - culorile (rosu, verde, albastru) ale paletei, in ordinea indecsilor BACKGROUND ... TRANSPARENT
+    • engine: obiect de tip SnakeEngine - motorul a carui stare este desenata
+    • width: int - latimea imaginii, in pixeli
+    • height: int - inaltimea imaginii, in pixeli
+    • stride: int - numarul de octeti ai unui rand din framebuffer (width + 1)
+    • frame: bytearray - framebuffer-ul
+
+    Metode:
+
+    • reset(engine) - deseneaza complet starea motorului engine
+    • update() - redeseneaza celulele schimbate dupa un tick al motorului
+    • pop_dirty() - zona redesenata de la apelul anterior
+    • row(y) - pixelii unui rand
+    • to_png(level=6) - imaginea curenta, ca fisier PNG
+
+    """
+
+    def __init__(self, block_size, snake_color, food_color, obstacle_color, background=CANVAS_BACKGROUND):
+        """
+            Inițializează renderer-ul.
+
+            Args:
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                snake_color (str): Culoarea șarpelui.
+                food_color (str): Culoarea mâncării.
+                obstacle_color (str): Culoarea obstacolelor.
+                background (str): Culoarea fundalului; implicit fundalul unui tk.Canvas.
+
+            Raises:
+                ValueError: Dacă o culoare nu este cunoscută.
+        """
+        self.block_size = block_size
+        self.palette = [parse_color(background), COLORS["black"], parse_color(snake_color), parse_color(food_color),
+                        parse_color(obstacle_color), COLORS["black"]]
+        self.palette += [COLORS["black"]] * (_PALETTE_SIZE - len(self.palette))
+        self.engine = None
+        self.width = self.height = self.stride = 0
+        self.frame = bytearray()
+        self._dirty = None
+        self._food = None
+
+        size = block_size
+        empty = bytes([BACKGROUND]) * size
+        self._empty_tile = [empty] * size
+        self._snake_tile = self._rectangle_tile(SNAKE)
+        self._obstacle_tile = self._rectangle_tile(OBSTACLE)
+        self._food_tile = []
+        radius = size / 2
+        for y in range(size):
+            row = bytearray(empty)
+            dy = y + 0.5 - radius
+            if radius * radius > dy * dy:
+                half = (radius * radius - dy * dy) ** 0.5
+                left, right = round(radius - half), round(radius + half)
+                row[left:right] = bytes([FOOD]) * (right - left)
+            self._food_tile.append(bytes(row))
+
+    def _rectangle_tile(self, color):
+        size = self.block_size
+        border = bytes([OUTLINE]) * size
+        if size <= 2:
+            return [border] * size
+        inner = bytes([OUTLINE]) + bytes([color]) * (size - 2) + bytes([OUTLINE])
+        return [border] + [inner] * (size - 2) + [border]
+
+    def reset(self, engine):
+        """
+            Desenează complet starea unui motor de joc.
+
+            Este apelată la începutul fiecărui joc; pentru o tablă nouă framebuffer-ul este realocat.
+
+            Args:
+                engine (SnakeEngine): Motorul a cărui stare este desenată.
+        """
+        self.engine = engine
+        width, height = engine.cols * self.block_size, engine.rows * self.block_size
+        if (width, height) != (self.width, self.height):
+            self.width, self.height, self.stride = width, height, width + 1
+            self.frame = bytearray(self.stride * height)
+        else:
+            self.frame[:] = bytes(len(self.frame))
+        background = bytes([BACKGROUND]) * width
+        for y in range(height):
+            start = y * self.stride + 1
+            self.frame[start:start + width] = background
+
+        for cell in engine.obstacles:
+            self._draw(cell, self._obstacle_tile)
+        for cell in engine.snake:
+            self._draw(cell, self._snake_tile)
+        self._food = engine.food
+        if self._food is not None:
+            self._draw(self._food, self._food_tile)
+        self._dirty = [0, 0, engine.cols - 1, engine.rows - 1]
+
+    def update(self):
+        """
+            Redesenează celulele schimbate după un tick al motorului.
+
+            Ca în CanvasRenderer, este apelată după fiecare `step`; o celulă este redesenată după starea ei din harta
+            de ocupare a motorului.
+        """
+        engine = self.engine
+        if engine.last_tail is not None:
+            self._redraw(engine.last_tail)
+        self._redraw(engine.snake[0])
+        if engine.food != self._food:
+            previous, self._food = self._food, engine.food
+            if previous is not None:
+                self._redraw(previous)
+            if self._food is not None:
+                self._redraw(self._food)
+
+    def _redraw(self, cell):
+        col, row = cell
+        if cell == self._food:
+            tile = self._food_tile
+        else:
+            value = self.engine.grid[row * self.engine.cols + col]
+            tile = (self._snake_tile if value == CELL_SNAKE else
+                    self._obstacle_tile if value == CELL_OBSTACLE else self._empty_tile)
+        self._draw(cell, tile)
+        dirty = self._dirty
+        if dirty is None:
+            self._dirty = [col, row, col, row]
+        else:
+            dirty[0], dirty[1] = min(dirty[0], col), min(dirty[1], row)
+            dirty[2], dirty[3] = max(dirty[2], col), max(dirty[3], row)
+
+    def _draw(self, cell, tile):
+        col, row = cell
+        size, stride, frame = self.block_size, self.stride, self.frame
+        start = row * size * stride + col * size + 1
+        for line in tile:
+            frame[start:start + size] = line
+            start += stride
+
+    def pop_dirty(self):
+        """
+            Returnează zona redesenată de la apelul anterior și o golește.
+
+            Returns:
+                tuple: Dreptunghiul (x, y, lățime, înălțime), în pixeli, care cuprinde toate celulele redesenate, sau
+                None dacă nu s-a redesenat nimic.
+        """
+        dirty, self._dirty = self._dirty, None
+        if dirty is None:
+            return None
+        size = self.block_size
+        return (dirty[0] * size, dirty[1] * size, (dirty[2] - dirty[0] + 1) * size,
+                (dirty[3] - dirty[1] + 1) * size)
+
+    def row(self, y):
+        """
+            Args:
+                y (int): Rândul de pixeli.
+
+            Returns:
+                bytearray: Indecșii culorilor pixelilor din rând (o copie).
+        """
+        start = y * self.stride + 1
+        return self.frame[start:start + self.width]
+
+    def to_png(self, level=6):
+        """
+            Returnează imaginea curentă ca fișier PNG cu paletă.
+
+            Args:
+                level (int): Nivelul de compresie zlib (0-9).
+
+            Returns:
+                bytes: Conținutul fișierului PNG.
+        """
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 3, 0, 0, 0)
+        palette = b"".join(bytes(rgb) for rgb in self.palette)
+        return (_PNG_SIGNATURE + _png_chunk(b"IHDR", header) + _png_chunk(b"PLTE", palette)
+                + _png_chunk(b"IDAT", zlib.compress(self.frame, level)) + _png_chunk(b"IEND", b""))
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+class PngSequence:
+    """
+    Scrie cadrele unui FrameRenderer ca fisiere PNG numerotate intr-un director.
+
+    Atribute:
+
+    • directory: str - directorul fisierelor
+    • pattern: str - numele fisierelor, formatat cu numarul cadrului
+    • count: int - numarul de cadre scrise
+
+    Metode:
+
+    • add(renderer) - scrie imaginea curenta a renderer-ului
+    • close() - nu mai face nimic; exista pentru aceeasi interfata ca GifWriter
+
+    """
+
+    def __init__(self, directory, pattern="frame{:05d}.png", level=6):
+        """
+            Args:
+                directory (str): Directorul fișierelor; este creat dacă nu există.
+                pattern (str): Numele fișierelor, formatat cu numărul cadrului.
+                level (int): Nivelul de compresie zlib (0-9).
+        """
+        self.directory = directory
+        self.pattern = pattern
+        self.count = 0
+        self._level = level
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, renderer):
+        """
+            Scrie imaginea curentă a renderer-ului în fișierul următor.
+
+            Args:
+                renderer (FrameRenderer): Renderer-ul.
+
+            Returns:
+                str: Calea fișierului scris.
+        """
+        path = os.path.join(self.directory, self.pattern.format(self.count))
+        with open(path, "wb") as file:
+            file.write(renderer.to_png(self._level))
+        self.count += 1
+        return path
+
+    def close(self):
+        pass
+
+
+class GifWriter:
+    """
+    Scrie cadrele unui FrameRenderer intr-un GIF animat, pe masura ce sunt adaugate.
+
+    Primul cadru contine toata imaginea. Fiecare cadru urmator contine doar dreptunghiul redesenat de renderer de la
+    cadrul anterior (FrameRenderer.pop_dirty) si este desenat peste cadrul anterior; in acest dreptunghi, randurile
+    de pixeli nemodificate sunt transparente, deci se comprima aproape complet. Astfel un cadru costa de obicei cateva
+    celule, nu toata tabla.
+
+    Atribute:
+
+    • path: str - calea fisierului GIF
+    • delay: int - durata unui cadru, in sutimi de secunda
+    • count: int - numarul de cadre scrise
+
+    Metode:
+
+    • add(renderer) - adauga imaginea curenta a renderer-ului
+    • close() - termina si inchide fisierul
+
+    """
+
+    def __init__(self, path, delay=10, loop=0):
+        """
+            Args:
+                path (str): Calea fișierului GIF.
+                delay (int): Durata unui cadru, în sutimi de secundă.
+                loop (int): De câte ori se repetă animația; 0 - la nesfârșit.
+        """
+        self.path = path
+        self.delay = delay
+        self.count = 0
+        self._loop = loop
+        self._file = open(path, "wb")
+        self._previous = None
+
+    def add(self, renderer):
+        """
+            Adaugă imaginea curentă a renderer-ului ca un cadru nou.
+
+            Args:
+                renderer (FrameRenderer): Renderer-ul; trebuie să fie același pentru toate cadrele.
+        """
+        dirty = renderer.pop_dirty()
+        if self._previous is None:
+            self._file.write(b"GIF89a" + struct.pack("<HHBBB", renderer.width, renderer.height,
+                                                     0xF0 | (_GIF_CODE_SIZE - 1), BACKGROUND, 0))
+            self._file.write(b"".join(bytes(rgb) for rgb in renderer.palette))
+            self._file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", self._loop) + b"\x00")
+            dirty = (0, 0, renderer.width, renderer.height)
+        elif dirty is None:
+            # Nimic nu s-a schimbat: un pixel transparent pastreaza durata cadrului.
+            dirty = (0, 0, 1, 1)
+
+        x, y, width, height = dirty
+        stride, frame, previous = renderer.stride, renderer.frame, self._previous
+        transparent = bytes([TRANSPARENT]) * width
+        pixels = bytearray()
+        for line in range(y, y + height):
+            start = line * stride + 1 + x
+            row = frame[start:start + width]
+            pixels += transparent if previous is not None and previous[start:start + width] == row else row
+        self._previous = bytearray(frame)
+
+        # Disposal 1 (cadrul ramane desenat sub urmatorul), cu TRANSPARENT ca index transparent.
+        self._file.write(b"\x21\xf9\x04\x05" + struct.pack("<HB", self.delay, TRANSPARENT) + b"\x00")
+        self._file.write(b"\x2c" + struct.pack("<HHHHB", x, y, width, height, 0))
+        data = _lzw_encode(pixels, _GIF_CODE_SIZE)
+        blocks = bytearray([_GIF_CODE_SIZE])
+        for start in range(0, len(data), 255):
+            block = data[start:start + 255]
+            blocks.append(len(block))
+            blocks += block
+        blocks.append(0)
+        self._file.write(blocks)
+        self.count += 1
+
+    def close(self):
+        """
+            Scrie terminatorul GIF și închide fișierul.
+        """
+        if not self._file.closed:
+            self._file.write(b"\x3b")
+            self._file.close()
+
+
+def export_replay(path, output, image_format="gif", obstacles_file="tabla.json", block_size=20, delay=10,
+                  colors=("green", "red", "blue")):
+    """
+        Desenează un replay cadru cu cadru, fără display, într-un GIF animat sau într-un director de PNG-uri.
+
+        Args:
+            path (str): Calea fișierului replay (.snkr).
+            output (str): Calea fișierului GIF sau a directorului cu PNG-uri.
+            image_format (str): "gif" sau "png".
+            obstacles_file (str): Calea către fișierul JSON cu nivelele folosit la înregistrare.
+            block_size (int): Dimensiunea unui bloc, în pixeli, pentru imagini și pentru fișierul de nivele.
+            delay (int): Durata unui cadru GIF, în sutimi de secundă.
+            colors (tuple): Culorile șarpelui, mâncării și obstacolelor.
+
+        Returns:
+            int: Numărul de cadre scrise.
+
+        Raises:
+            ValueError: Dacă formatul sau o culoare nu sunt cunoscute, sau fișierul nu este un replay valid.
+    """
+    if image_format == "gif":
+        writer = GifWriter(output, delay=delay)
+    elif image_format == "png":
+        writer = PngSequence(output)
+    else:
+        raise ValueError(f"Format necunoscut: {image_format!r}")
+    renderer = FrameRenderer(block_size, *colors)
+
+    def draw(engine):
+        if renderer.engine is engine:
+            renderer.update()
+        else:
+            renderer.reset(engine)
+        writer.add(renderer)
+
+    try:
+        replay_game(Replay.load(path), obstacles_file, block_size, on_tick=draw)
+    finally:
+        writer.close()
+    return writer.count
+
+
+def _lzw_encode(pixels, code_size):
+    """
+        Comprimă pixelii cu varianta LZW din GIF (coduri de lungime variabilă, de la code_size + 1 la 12 biți).
+
+        Returns:
+            bytearray: Codurile, împachetate începând cu bitul cel mai puțin semnificativ.
+    """
+    clear = 1 << code_size
+    end = clear + 1
+    out = bytearray()
+    bits = 0
+    count = 0
+
+    size = code_size + 1
+    next_code = end + 1
+    table = {}
+    bits |= clear << count
+    count += size
+    prefix = pixels[0]
+    for pixel in pixels[1:]:
+        key = prefix << 8 | pixel
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        bits |= prefix << count
+        count += size
+        while count >= 8:
+            out.append(bits & 0xFF)
+            bits >>= 8
+            count -= 8
+        if next_code < _GIF_MAX_CODE:
+            table[key] = next_code
+            if next_code == 1 << size:
+                size += 1
+            next_code += 1
+        else:
+            bits |= clear << count
+            count += size
+            table.clear()
+            size = code_size + 1
+            next_code = end + 1
+        prefix = pixel
+    bits |= prefix << count
+    count += size
+    bits |= end << count
+    count += size
+    while count > 0:
+        out.append(bits & 0xFF)
+        bits >>= 8
+        count -= 8
+    return out
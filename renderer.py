@@ -0,0 +1,547 @@
+import tkinter as tk
+from collections import deque
+
+from engine import CELL_OBSTACLE, CELL_SNAKE
+
+# Imaginile pre-rasterizate, comune tuturor renderer-elor: (interpretor Tk, forma, dimensiune, culoare) -> PhotoImage.
+_TILES = {}
+
+
+def _tile(canvas, shape, size, color):
+    """
+        Returnează imaginea unui bloc, rasterizată o singură dată pentru fiecare formă, dimensiune și culoare.
+
+        Blocurile "rectangle" au un contur negru de un pixel, ca dreptunghiurile desenate de CanvasRenderer; blocurile
+        "oval" sunt cercuri pline, cu pixelii din afara cercului transparenți.
+
+        Args:
+            canvas (tk.Canvas): Canvas-ul pe care va fi folosită imaginea.
+            shape (str): "rectangle" sau "oval".
+            size (int): Latura blocului, în pixeli.
+            color (str): Culoarea blocului.
+
+        Returns:
+            tk.PhotoImage: Imaginea blocului.
+    """
+    key = (canvas.tk, shape, size, color)
+    image = _TILES.get(key)
+    if image is None:
+        image = tk.PhotoImage(master=canvas, width=size, height=size)
+        if shape == "rectangle":
+            image.put("black", to=(0, 0, size, size))
+            image.put(color, to=(1, 1, size - 1, size - 1))
+        else:
+            radius = size / 2
+            for y in range(size):
+                dy = y + 0.5 - radius
+                half = (radius * radius - dy * dy) ** 0.5
+                left, right = round(radius - half), round(radius + half)
+                if right > left:
+                    image.put(color, to=(left, y, right, y + 1))
+        _TILES[key] = image
+    return image
+
+
+class CanvasRenderer:
+    """
+    Desenarea incrementala (retained-mode) a jocului pe un tk.Canvas.
+
+    Obstacolele sunt create o singura data pe nivel, iar la fiecare tick sunt mutate doar elementele care s-au
+    schimbat: dreptunghiul cozii este refolosit pentru noul cap (prin `coords`), iar mancarea este mutata in noua
+    pozitie. Astfel costul unui frame este O(1), indiferent de lungimea sarpelui sau de numarul de obstacole.
+
+    Atribute:
+
+    • canvas: obiect de tip Canvas - canvas-ul pe care se deseneaza jocul
+    • block_size: int - dimensiunea unui bloc din tabla de joc, in pixeli
+    • snake_color: str - culoarea sarpelui
+    • food_color: str - culoarea mancarii
+    • obstacle_color: str - culoarea obstacolelor
+    • engine: obiect de tip SnakeEngine - motorul a carui stare este desenata
+
+    Metode:
+
+    • reset(engine) - sterge tabla si deseneaza complet starea motorului engine
+    • update() - actualizeaza desenul dupa un tick al motorului
+    • draw_snake() - deseneaza sarpele
+    • draw_food() - deseneaza mancarea
+    • draw_obstacles() - deseneaza obstacolele
+
+    """
+
+    def __init__(self, canvas, block_size, snake_color, food_color, obstacle_color):
+        """
+            Inițializează renderer-ul.
+
+            Args:
+                canvas (tk.Canvas): Canvas-ul pe care se desenează jocul.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                snake_color (str): Culoarea șarpelui.
+                food_color (str): Culoarea mâncării.
+                obstacle_color (str): Culoarea obstacolelor.
+        """
+        self.canvas = canvas
+        self.block_size = block_size
+        self.snake_color = snake_color
+        self.food_color = food_color
+        self.obstacle_color = obstacle_color
+        self.engine = None
+
+        self._snake_items = deque()
+        self._obstacle_items = []
+        self._food_item = None
+        self._food_cell = None
+
+    def _box(self, cell):
+        col, row = cell
+        x, y = col * self.block_size, row * self.block_size
+        return x, y, x + self.block_size, y + self.block_size
+
+    def _create_segment(self, cell):
+        return self.canvas.create_rectangle(*self._box(cell), fill=self.snake_color)
+
+    def _create_food(self, cell):
+        return self.canvas.create_oval(*self._box(cell), fill=self.food_color)
+
+    def _move(self, item, cell):
+        self.canvas.coords(item, *self._box(cell))
+
+    def reset(self, engine):
+        """
+            Desenează complet starea unui motor de joc.
+
+            Este apelată o singură dată la începutul fiecărui joc sau nivel; șterge tot ce era pe canvas și creează
+            obstacolele, șarpele și mâncarea.
+
+            Args:
+                engine (SnakeEngine): Motorul a cărui stare este desenată.
+        """
+        self.engine = engine
+        self.canvas.delete("all")
+        self._snake_items.clear()
+        self._obstacle_items = []
+        self._food_item = None
+        self._food_cell = None
+
+        self.draw_obstacles()
+        self.draw_snake()
+        self.draw_food()
+
+    def update(self):
+        """
+            Actualizează desenul după un tick al motorului.
+
+            Dacă șarpele s-a mișcat, dreptunghiul cozii este mutat în poziția noului cap; dacă a crescut, se creează
+            un singur dreptunghi nou. Mâncarea este mutată doar dacă și-a schimbat poziția.
+        """
+        head = self.engine.snake[0]
+        if self.engine.last_tail is not None:
+            item = self._snake_items.pop()
+            self._move(item, head)
+        else:
+            item = self._create_segment(head)
+        self._snake_items.appendleft(item)
+
+        if self.engine.food != self._food_cell:
+            self.draw_food()
+
+    def draw_snake(self):
+        """
+            Desenează șarpele pe tabla de joc.
+
+            Această metodă parcurge fiecare segment al șarpelui și îl desenează pe canvas. Fiecare segment este reprezentat printr-un dreptunghi în poziția corespunzătoare.
+        """
+        for item in self._snake_items:
+            self.canvas.delete(item)
+        self._snake_items.clear()
+        for segment in self.engine.snake:
+            self._snake_items.append(self._create_segment(segment))
+
+    def draw_food(self):
+        """
+            Desenează mâncarea pe tabla de joc.
+
+            Ovalul mâncării este creat o singură dată și apoi doar mutat în noua poziție. Dacă tabla este plină și
+            nu există mâncare, ovalul este ascuns.
+        """
+        food = self.engine.food
+        self._food_cell = food
+        if food is None:
+            if self._food_item is not None:
+                self.canvas.itemconfigure(self._food_item, state="hidden")
+            return
+        if self._food_item is None:
+            self._food_item = self._create_food(food)
+        else:
+            self._move(self._food_item, food)
+            self.canvas.itemconfigure(self._food_item, state="normal")
+
+    def draw_obstacles(self):
+        """
+            Desenează obstacolele pe tabla de joc.
+
+            Obstacolele nu se mișcă, deci sunt create o singură dată pe nivel, la apelul `reset`.
+        """
+        for item in self._obstacle_items:
+            self.canvas.delete(item)
+        self._obstacle_items = [self.canvas.create_rectangle(*self._box(obstacle), fill=self.obstacle_color)
+                                for obstacle in self.engine.obstacles]
+
+
+class SpriteRenderer(CanvasRenderer):
+    """
+    Renderer care deseneaza jocul din imagini pre-rasterizate in loc de forme vectoriale.
+
+    Segmentele sarpelui si mancarea sunt elemente imagine care folosesc blocuri PhotoImage rasterizate o singura data
+    (vezi `_tile`), deci Tk doar copiaza pixelii in loc sa rasterizeze fiecare forma. Obstacolele sunt copiate intr-o
+    singura imagine de fundal pe nivel, afisata ca un singur element pe canvas, oricat de multe ar fi; imaginea este
+    refolosita cat timp nivelul nu se schimba.
+
+    Atribute:
+
+    • background: obiect de tip PhotoImage - imaginea cu obstacolele nivelului curent
+
+    Metode:
+
+    • draw_obstacles() - deseneaza obstacolele in imaginea de fundal
+
+    """
+
+    def __init__(self, canvas, block_size, snake_color, food_color, obstacle_color):
+        """
+            Inițializează renderer-ul.
+
+            Args:
+                canvas (tk.Canvas): Canvas-ul pe care se desenează jocul.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                snake_color (str): Culoarea șarpelui.
+                food_color (str): Culoarea mâncării.
+                obstacle_color (str): Culoarea obstacolelor.
+        """
+        super().__init__(canvas, block_size, snake_color, food_color, obstacle_color)
+        self.background = None
+        self._background_key = None
+        self._snake_tile = _tile(canvas, "rectangle", block_size, snake_color)
+        self._food_tile = _tile(canvas, "oval", block_size, food_color)
+
+    def _create_segment(self, cell):
+        col, row = cell
+        return self.canvas.create_image(col * self.block_size, row * self.block_size, image=self._snake_tile,
+                                        anchor="nw")
+
+    def _create_food(self, cell):
+        col, row = cell
+        return self.canvas.create_image(col * self.block_size, row * self.block_size, image=self._food_tile,
+                                        anchor="nw")
+
+    def _move(self, item, cell):
+        col, row = cell
+        self.canvas.coords(item, col * self.block_size, row * self.block_size)
+
+    def draw_obstacles(self):
+        """
+            Desenează obstacolele pe tabla de joc.
+
+            Blocul obstacolului este copiat în imaginea de fundal a nivelului pentru fiecare obstacol, iar imaginea
+            este afișată ca un singur element. Imaginea este reconstruită doar când se schimbă nivelul.
+        """
+        for item in self._obstacle_items:
+            self.canvas.delete(item)
+        self._obstacle_items = []
+        obstacles = self.engine.obstacles
+        if not obstacles:
+            return
+        # Fiecare joc primeste un motor nou, cu o lista noua de obstacole: imaginea este cheiata dupa continutul
+        # listei si dimensiunea tablei, nu dupa identitatea listei.
+        key = (self.engine.cols, self.engine.rows, tuple(obstacles))
+        if self._background_key != key:
+            size = self.block_size
+            tile = _tile(self.canvas, "rectangle", size, self.obstacle_color)
+            self.background = tk.PhotoImage(master=self.canvas, width=self.engine.cols * size,
+                                            height=self.engine.rows * size)
+            for col, row in obstacles:
+                self.background.tk.call(self.background, "copy", tile, "-to", col * size, row * size)
+            self._background_key = key
+        self._obstacle_items = [self.canvas.create_image(0, 0, image=self.background, anchor="nw")]
+
+
+class ViewportRenderer(CanvasRenderer):
+    """
+    Renderer cu camera: deseneaza doar fereastra de view_cols x view_rows celule din jurul capului sarpelui.
+
+    Pe canvas exista doar elementele celulelor vizibile, deci costul desenului nu depinde de dimensiunea tablei si
+    tabla poate avea milioane de celule (de exemplu cu SparseSnakeEngine). Camera ramane pe loc cat timp capul este
+    in interiorul ferestrei, la cel putin margin celule de marginea ei; cand capul iese din aceasta zona, camera este
+    recentrata pe cap si fereastra este redesenata din harta de ocupare a motorului (O(celule vizibile)). Intre
+    recentrari, un tick costa O(1), ca in CanvasRenderer.
+
+    Atribute:
+
+    • view_cols: int - numarul de coloane vizibile
+    • view_rows: int - numarul de randuri vizibile
+    • margin: int - distanta minima, in celule, dintre cap si marginea ferestrei inainte de recentrare
+    • camera: tuple - celula (coloana, rand) din coltul stanga-sus al ferestrei
+
+    Metode:
+
+    • visible(cell) - verifica daca o celula este in fereastra
+    • center(cell) - muta camera astfel incat celula sa fie in centrul ferestrei
+
+    """
+
+    def __init__(self, canvas, block_size, snake_color, food_color, obstacle_color, view_cols, view_rows,
+                 margin=None):
+        """
+            Inițializează renderer-ul.
+
+            Args:
+                canvas (tk.Canvas): Canvas-ul pe care se desenează jocul.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                snake_color (str): Culoarea șarpelui.
+                food_color (str): Culoarea mâncării.
+                obstacle_color (str): Culoarea obstacolelor.
+                view_cols (int): Numărul de coloane vizibile.
+                view_rows (int): Numărul de rânduri vizibile.
+                margin (int): Distanța minimă dintre cap și marginea ferestrei (opțional); implicit un sfert din
+                    latura mai mică a ferestrei.
+        """
+        super().__init__(canvas, block_size, snake_color, food_color, obstacle_color)
+        self.view_cols = view_cols
+        self.view_rows = view_rows
+        self.margin = margin if margin is not None else max(1, min(view_cols, view_rows) // 4)
+        self.camera = (0, 0)
+        self._segment_items = {}
+
+    def _box(self, cell):
+        col, row = cell
+        camera_col, camera_row = self.camera
+        x, y = (col - camera_col) * self.block_size, (row - camera_row) * self.block_size
+        return x, y, x + self.block_size, y + self.block_size
+
+    def _visible_cells(self):
+        cols = self.engine.cols
+        camera_col, camera_row = self.camera
+        last_col = min(camera_col + self.view_cols, cols)
+        for row in range(camera_row, min(camera_row + self.view_rows, self.engine.rows)):
+            offset = row * cols
+            for col in range(camera_col, last_col):
+                yield col, row, offset + col
+
+    def visible(self, cell):
+        """
+            Verifică dacă o celulă este în fereastra camerei.
+
+            Args:
+                cell (tuple): Celula (coloană, rând).
+
+            Returns:
+                bool: True dacă celula este vizibilă.
+        """
+        col, row = cell
+        camera_col, camera_row = self.camera
+        return camera_col <= col < camera_col + self.view_cols and camera_row <= row < camera_row + self.view_rows
+
+    def center(self, cell):
+        """
+            Mută camera astfel încât celula să fie în centrul ferestrei, fără a ieși din tablă.
+
+            Args:
+                cell (tuple): Celula (coloană, rând).
+        """
+        col, row = cell
+        camera_col = min(max(col - self.view_cols // 2, 0), max(self.engine.cols - self.view_cols, 0))
+        camera_row = min(max(row - self.view_rows // 2, 0), max(self.engine.rows - self.view_rows, 0))
+        self.camera = (camera_col, camera_row)
+
+    def _needs_recenter(self, cell):
+        col, row = cell
+        camera_col, camera_row = self.camera
+        margin = self.margin
+        left, top = col - camera_col, row - camera_row
+        return ((left < margin and camera_col > 0)
+                or (left >= self.view_cols - margin and camera_col + self.view_cols < self.engine.cols)
+                or (top < margin and camera_row > 0)
+                or (top >= self.view_rows - margin and camera_row + self.view_rows < self.engine.rows))
+
+    def reset(self, engine):
+        """
+            Centrează camera pe capul șarpelui și desenează complet fereastra.
+
+            Args:
+                engine (SnakeEngine): Motorul a cărui stare este desenată.
+        """
+        self.engine = engine
+        self.center(engine.snake[0])
+        self.canvas.delete("all")
+        self._redraw()
+
+    def _redraw(self):
+        """
+            Desenează din nou toate celulele vizibile, după o mutare a camerei.
+        """
+        self.canvas.delete("board")
+        self._segment_items = {}
+        self._obstacle_items = []
+        self._food_item = None
+        self._food_cell = None
+
+        self.draw_obstacles()
+        self.draw_snake()
+        self.draw_food()
+
+    def _create_segment(self, cell):
+        return self.canvas.create_rectangle(*self._box(cell), fill=self.snake_color, tags="board")
+
+    def _create_food(self, cell):
+        return self.canvas.create_oval(*self._box(cell), fill=self.food_color, tags="board")
+
+    def update(self):
+        """
+            Actualizează desenul după un tick al motorului.
+
+            Dacă noul cap iese din zona camerei, fereastra este recentrată și redesenată; altfel dreptunghiul cozii
+            (dacă era vizibilă) este mutat în poziția capului, ca în CanvasRenderer.
+        """
+        head = self.engine.snake[0]
+        if self._needs_recenter(head):
+            self.center(head)
+            self._redraw()
+            return
+
+        tail = self.engine.last_tail
+        item = self._segment_items.pop(tail, None) if tail is not None else None
+        if item is not None:
+            self._move(item, head)
+        else:
+            item = self._create_segment(head)
+        self._segment_items[head] = item
+
+        if self.engine.food != self._food_cell:
+            self.draw_food()
+
+    def draw_snake(self):
+        """
+            Desenează segmentele vizibile ale șarpelui.
+
+            Dacă șarpele are mai multe segmente decât fereastra celule, sunt parcurse celulele ferestrei, altfel
+            segmentele șarpelui.
+        """
+        for item in self._segment_items.values():
+            self.canvas.delete(item)
+        self._segment_items = {}
+        if len(self.engine.snake) > self.view_cols * self.view_rows:
+            grid = self.engine.grid
+            cells = [(col, row) for col, row, index in self._visible_cells() if grid[index] == CELL_SNAKE]
+        else:
+            cells = [cell for cell in self.engine.snake if self.visible(cell)]
+        for cell in cells:
+            self._segment_items[cell] = self._create_segment(cell)
+
+    def draw_food(self):
+        """
+            Desenează mâncarea dacă este în fereastra camerei; altfel ovalul ei este ascuns.
+        """
+        food = self.engine.food
+        if food is not None and not self.visible(food):
+            self._food_cell = food
+            if self._food_item is not None:
+                self.canvas.itemconfigure(self._food_item, state="hidden")
+            return
+        super().draw_food()
+
+    def draw_obstacles(self):
+        """
+            Desenează obstacolele vizibile, citite din harta de ocupare a motorului.
+        """
+        for item in self._obstacle_items:
+            self.canvas.delete(item)
+        grid = self.engine.grid
+        self._obstacle_items = [self.canvas.create_rectangle(*self._box((col, row)), fill=self.obstacle_color,
+                                                             tags="board")
+                                for col, row, index in self._visible_cells() if grid[index] == CELL_OBSTACLE]
+
+
+class MultiSnakeRenderer(CanvasRenderer):
+    """
+    Desenarea incrementala a unui joc cu mai multi jucatori, din copia starii tinuta de client
+    (multiplayer.ClientState).
+
+    Ca in CanvasRenderer, la fiecare mesaj al serverului sunt mutate doar elementele care s-au schimbat: pentru
+    fiecare sarpe, dreptunghiul cozii este refolosit pentru noul cap. Sarpele jucatorului are culoarea snake_color,
+    ceilalti sarpi culoarea other_color.
+
+    Atribute:
+
+    • other_color: str - culoarea sarpilor celorlalti jucatori
+    • state: obiect de tip ClientState - starea desenata
+
+    Metode:
+
+    • reset(state) - sterge tabla si deseneaza complet starea
+    • update() - actualizeaza desenul dupa un mesaj aplicat pe stare
+
+    """
+
+    def __init__(self, canvas, block_size, snake_color, food_color, obstacle_color, other_color="orange"):
+        """
+            Inițializează renderer-ul.
+
+            Args:
+                canvas (tk.Canvas): Canvas-ul pe care se desenează jocul.
+                block_size (int): Dimensiunea unui bloc, în pixeli.
+                snake_color (str): Culoarea șarpelui jucătorului.
+                food_color (str): Culoarea mâncării.
+                obstacle_color (str): Culoarea obstacolelor.
+                other_color (str): Culoarea șerpilor celorlalți jucători.
+        """
+        super().__init__(canvas, block_size, snake_color, food_color, obstacle_color)
+        self.other_color = other_color
+        self.state = None
+        self._snakes = {}
+        self._foods = {}
+
+    def _create_player_segment(self, player, cell):
+        color = self.snake_color if player == self.state.player else self.other_color
+        return self.canvas.create_rectangle(*self._box(cell), fill=color)
+
+    def reset(self, state):
+        """
+            Desenează complet starea, de exemplu după MSG_WELCOME sau MSG_SNAPSHOT.
+
+            Args:
+                state (ClientState): Starea desenată.
+        """
+        self.state = state
+        self.canvas.delete("all")
+        self._obstacle_items = [self.canvas.create_rectangle(*self._box(obstacle), fill=self.obstacle_color)
+                                for obstacle in state.obstacles]
+        self._snakes = {player: deque(self._create_player_segment(player, cell) for cell in snake)
+                        for player, snake in state.snakes.items()}
+        self._foods = {cell: self._create_food(cell) for cell in state.food}
+
+    def update(self):
+        """
+            Actualizează desenul după un mesaj aplicat pe stare; dacă mesajul a înlocuit toată starea, o desenează
+            din nou complet.
+        """
+        state = self.state
+        if state.full:
+            self.reset(state)
+            return
+        for player, head, tail in state.moved:
+            items = self._snakes[player]
+            if tail is not None:
+                item = items.pop()
+                self._move(item, head)
+            else:
+                item = self._create_player_segment(player, head)
+            items.appendleft(item)
+        for player, _ in state.died:
+            for item in self._snakes.pop(player, ()):
+                self.canvas.delete(item)
+        for player in state.spawned:
+            self._snakes[player] = deque(self._create_player_segment(player, cell) for cell in state.snakes[player])
+        for cell in state.food_removed:
+            self.canvas.delete(self._foods.pop(cell))
+        for cell in state.food_added:
+            self._foods[cell] = self._create_food(cell)
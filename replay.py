@@ -0,0 +1,233 @@
+from engine import make_engine, UP, DOWN, LEFT, RIGHT
+from levels import load_level_pack
+
+# Formatul binar: MAGIC, versiunea, apoi varint-uri: seed, lungimea si textul nivelului, numarul de evenimente,
+# evenimentele (diferenta de tick-uri fata de evenimentul anterior << 2 | codul directiei) si numarul total de
+# tick-uri al jocului.
+MAGIC = b"SNKR"
+VERSION = 1
+DIRECTION_CODES = (UP, DOWN, LEFT, RIGHT)
+
+
+def encode_varint(value, out):
+    """
+        Adaugă un întreg nenegativ la `out`, codificat ca varint (7 biți pe octet, LEB128).
+
+        Args:
+            value (int): Valoarea codificată.
+            out (bytearray): Bufferul în care se scrie.
+    """
+    if value < 0:
+        raise ValueError("varint-ul trebuie sa fie nenegativ")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def decode_varint(data, position):
+    """
+        Citește un varint din `data`, începând de la `position`.
+
+        Returns:
+            tuple: Valoarea citită și poziția de după ea.
+
+        Raises:
+            ValueError: Dacă datele se termină în mijlocul varint-ului.
+    """
+    value = 0
+    shift = 0
+    while True:
+        if position >= len(data):
+            raise ValueError("Replay trunchiat")
+        byte = data[position]
+        position += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, position
+        shift += 7
+
+
+class Replay:
+    """
+    Inregistrarea unui joc: tot ce trebuie pentru a-l reproduce exact.
+
+    Atribute:
+
+    • seed: int - samanta jocului (SnakeEngine.seed)
+    • level: str - nivelul jucat
+    • events: list - tupluri (tick, directie) pentru fiecare tick la care s-a schimbat directia
+    • ticks: int - numarul total de tick-uri ale jocului
+
+    Metode:
+
+    • to_bytes() - codifica jocul in formatul binar compact
+    • from_bytes(data) - decodifica un joc din formatul binar
+    • save(path) - salveaza jocul intr-un fisier
+    • load(path) - incarca un joc dintr-un fisier
+
+    """
+
+    def __init__(self, seed, level, events=None, ticks=0):
+        self.seed = seed
+        self.level = level
+        self.events = events if events is not None else []
+        self.ticks = ticks
+
+    def to_bytes(self):
+        """
+            Returns:
+                bytes: Jocul codificat în formatul binar compact.
+        """
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        encode_varint(self.seed, out)
+        level = self.level.encode("utf-8")
+        encode_varint(len(level), out)
+        out += level
+        encode_varint(len(self.events), out)
+        previous = 0
+        for tick, direction in self.events:
+            encode_varint((tick - previous) << 2 | DIRECTION_CODES.index(direction), out)
+            previous = tick
+        encode_varint(self.ticks, out)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """
+            Decodifică un joc din formatul binar compact.
+
+            Args:
+                data (bytes): Datele produse de `to_bytes`.
+
+            Returns:
+                Replay: Jocul decodificat.
+
+            Raises:
+                ValueError: Dacă datele nu sunt un replay valid.
+        """
+        if data[:len(MAGIC)] != MAGIC or len(data) <= len(MAGIC) or data[len(MAGIC)] != VERSION:
+            raise ValueError("Fisierul nu este un replay Snake valid")
+        position = len(MAGIC) + 1
+        seed, position = decode_varint(data, position)
+        length, position = decode_varint(data, position)
+        level = bytes(data[position:position + length]).decode("utf-8")
+        position += length
+        count, position = decode_varint(data, position)
+        events = []
+        tick = 0
+        for _ in range(count):
+            value, position = decode_varint(data, position)
+            tick += value >> 2
+            events.append((tick, DIRECTION_CODES[value & 3]))
+        ticks, position = decode_varint(data, position)
+        return cls(seed, level, events, ticks)
+
+    def save(self, path):
+        """
+            Salvează jocul într-un fișier binar.
+
+            Args:
+                path (str): Calea fișierului.
+        """
+        with open(path, "wb") as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        """
+            Încarcă un joc dintr-un fișier binar.
+
+            Args:
+                path (str): Calea fișierului.
+
+            Returns:
+                Replay: Jocul încărcat.
+        """
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+
+class ReplayRecorder:
+    """
+    Inregistreaza un joc pe masura ce este jucat.
+
+    Se apeleaza `record_tick` inainte de fiecare SnakeEngine.step, cu directia care va fi aplicata; sunt pastrate
+    doar tick-urile la care directia s-a schimbat.
+
+    Atribute:
+
+    • replay: obiect de tip Replay - jocul inregistrat pana acum
+
+    Metode:
+
+    • record_tick(direction) - inregistreaza directia unui tick
+    • finish() - returneaza inregistrarea completa
+
+    """
+
+    def __init__(self, seed, level):
+        """
+            Args:
+                seed (int): Sămânța jocului (SnakeEngine.seed, după reset).
+                level (str): Nivelul jucat.
+        """
+        self.replay = Replay(seed, level)
+        self._direction = None
+
+    def record_tick(self, direction):
+        """
+            Înregistrează direcția cu care se joacă următorul tick.
+
+            Args:
+                direction (str): Direcția motorului înainte de apelul `step`.
+        """
+        if direction != self._direction:
+            self.replay.events.append((self.replay.ticks, direction))
+            self._direction = direction
+        self.replay.ticks += 1
+
+    def finish(self):
+        """
+            Returns:
+                Replay: Jocul înregistrat.
+        """
+        return self.replay
+
+
+def replay_game(replay, obstacles_file="tabla.json", block_size=20, on_tick=None):
+    """
+        Re-simulează un joc înregistrat, fără interfață grafică și la viteză maximă.
+
+        Motorul este creat cu `engine.make_engine`, ca în joc, deci pe tablele foarte mari replay-ul folosește tot
+        SparseSnakeEngine și reproduce aceeași mâncare.
+
+        Args:
+            replay (Replay): Jocul înregistrat.
+            obstacles_file (str): Calea către fișierul JSON cu nivelele folosit la înregistrare.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+            on_tick (callable): Funcția apelată cu motorul la începutul jocului și după fiecare tick (opțional), de
+                exemplu pentru a desena cadrele jocului.
+
+        Returns:
+            SnakeEngine: Motorul în starea de la sfârșitul jocului.
+    """
+    pack = load_level_pack(obstacles_file, block_size)
+    engine = make_engine(pack.cols, pack.rows, pack.level(replay.level).obstacles(), seed=replay.seed)
+
+    if on_tick is not None:
+        on_tick(engine)
+
+    events = iter(replay.events)
+    next_event = next(events, None)
+    for tick in range(replay.ticks):
+        while next_event is not None and next_event[0] == tick:
+            engine.turn(next_event[1])
+            next_event = next(events, None)
+        engine.step()
+        if on_tick is not None:
+            on_tick(engine)
+        if engine.game_over:
+            break
+    return engine
@@ -0,0 +1,166 @@
+import math
+import time
+from collections import deque
+
+
+class TickStats:
+    """
+    Statistici despre durata tick-urilor jocului.
+
+    Pastreaza duratele ultimelor `window` tick-uri intr-o fereastra glisanta, plus totalurile pentru intreaga
+    sesiune.
+
+    Atribute:
+
+    • samples: deque - duratele (in secunde) ale ultimelor tick-uri
+    • ticks: int - numarul total de tick-uri inregistrate
+    • missed: int - numarul de termene ratate (tick-uri pornite cu cel putin o perioada intarziere)
+    • dropped: int - numarul de tick-uri abandonate pentru ca intarzierea depasea limita de recuperare
+    • max: float - cea mai lunga durata a unui tick din sesiune, in secunde
+
+    Metode:
+
+    • record(duration) - inregistreaza durata unui tick
+    • mean() - durata medie a tick-urilor din fereastra
+    • p95() - percentila 95 a duratelor din fereastra
+    • summary() - dictionar cu toate statisticile, in milisecunde
+
+    """
+
+    def __init__(self, window=1000):
+        self.samples = deque(maxlen=window)
+        self.ticks = 0
+        self.missed = 0
+        self.dropped = 0
+        self.max = 0.0
+
+    def record(self, duration):
+        """
+            Înregistrează durata unui tick.
+
+            Args:
+                duration (float): Durata tick-ului, în secunde.
+        """
+        self.samples.append(duration)
+        self.ticks += 1
+        if duration > self.max:
+            self.max = duration
+
+    def mean(self):
+        """
+            Returns:
+                float: Durata medie a tick-urilor din fereastră, în secunde (0 dacă nu există date).
+        """
+        return sum(self.samples) / len(self.samples) if self.samples else 0.0
+
+    def p95(self):
+        """
+            Returns:
+                float: Percentila 95 a duratelor din fereastră, în secunde (0 dacă nu există date).
+        """
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def summary(self):
+        """
+            Returns:
+                dict: Numărul de tick-uri, termenele ratate, tick-urile abandonate și duratele medie, p95 și maximă
+                în milisecunde.
+        """
+        return {
+            "ticks": self.ticks,
+            "missed": self.missed,
+            "dropped": self.dropped,
+            "mean_ms": self.mean() * 1000,
+            "p95_ms": self.p95() * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+class TickScheduler:
+    """
+    Planificator cu pas fix pentru bucla jocului.
+
+    Termenele tick-urilor sunt calculate din momentul pornirii (termen += perioada), nu din momentul in care s-a
+    terminat tick-ul anterior, deci timpul de desenare nu se aduna la perioada si viteza jocului nu deriva sub
+    incarcare. Daca bucla a intarziat, tick-urile ratate sunt recuperate (cel mult `max_catch_up` odata); peste
+    aceasta limita planificatorul renunta la ele si se resincronizeaza.
+
+    Atribute:
+
+    • period: float - perioada unui tick, in secunde
+    • max_catch_up: int - numarul maxim de tick-uri simulate la un singur apel
+    • clock: functie - ceasul folosit (implicit time.perf_counter)
+    • stats: obiect de tip TickStats - statisticile tick-urilor
+
+    Metode:
+
+    • start() - porneste planificatorul; primul tick este scadent imediat
+    • due_ticks() - numarul de tick-uri care trebuie simulate acum
+    • delay_ms() - numarul de milisecunde pana la urmatorul termen, pentru root.after
+    • record(duration) - inregistreaza durata unui tick
+
+    """
+
+    def __init__(self, period_ms, max_catch_up=5, clock=time.perf_counter):
+        """
+            Inițializează planificatorul.
+
+            Args:
+                period_ms (int): Perioada unui tick, în milisecunde (viteza nivelului).
+                max_catch_up (int): Numărul maxim de tick-uri recuperate la un singur apel.
+                clock (callable): Ceasul folosit, în secunde.
+        """
+        self.period = period_ms / 1000
+        self.max_catch_up = max_catch_up
+        self.clock = clock
+        self.stats = TickStats()
+        self._next = None
+
+    def start(self):
+        """
+            Pornește planificatorul; primul tick este scadent imediat.
+        """
+        self._next = self.clock()
+
+    def due_ticks(self):
+        """
+            Calculează câte tick-uri trebuie simulate acum și avansează termenul următor.
+
+            Returns:
+                int: Numărul de tick-uri scadente (0 dacă termenul următor nu a sosit încă).
+        """
+        if self._next is None:
+            self.start()
+        now = self.clock()
+        if now < self._next:
+            return 0
+
+        due = int((now - self._next) / self.period) + 1
+        if due > 1:
+            self.stats.missed += due - 1
+        if due > self.max_catch_up:
+            self.stats.dropped += due - self.max_catch_up
+            due = self.max_catch_up
+            self._next = now + self.period
+        else:
+            self._next += due * self.period
+        return due
+
+    def delay_ms(self):
+        """
+            Returns:
+                int: Numărul de milisecunde până la următorul termen (cel puțin 0).
+        """
+        return max(0, math.ceil((self._next - self.clock()) * 1000))
+
+    def record(self, duration):
+        """
+            Înregistrează durata unui tick.
+
+            Args:
+                duration (float): Durata tick-ului, în secunde.
+        """
+        self.stats.record(duration)
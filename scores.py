@@ -0,0 +1,171 @@
+import queue
+import sqlite3
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    level TEXT NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    created REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_level_score ON scores (level, score DESC, created);
+"""
+
+# Semnalul de oprire pentru firul care scrie in baza de date.
+_STOP = object()
+
+
+class ScoreStore:
+    """
+    Scorurile jocurilor terminate, pastrate intr-o baza de date SQLite, pe nivel si jucator.
+
+    Scrierile nu se fac pe firul Tk: `record` doar pune scorul intr-o coada, iar un fir separat aduna scorurile
+    venite intr-un interval scurt si le scrie intr-o singura tranzactie. Baza de date foloseste jurnalul WAL, deci
+    o oprire brusca a jocului pierde cel mult scorurile din ultimul lot, fara sa strice fisierul. Clasamentele sunt
+    citite printr-un index (nivel, scor), iar scorurile inca nescrise sunt incluse din memorie. Citirile folosesc o
+    conexiune separata si nu asteapta firul de scriere: cu jurnalul WAL, cititorii nu sunt blocati de o tranzactie
+    in curs, iar lacatul protejeaza doar lista scorurilor nescrise.
+
+    Atribute:
+
+    • path: str - calea fisierului SQLite
+    • batch_delay: float - cat asteapta firul de scriere, in secunde, dupa primul scor dintr-un lot
+
+    Metode:
+
+    • record(level, player, score) - adauga un scor, fara sa blocheze apelantul
+    • top(level, limit=10) - cele mai bune scoruri ale unui nivel
+    • best(level, player=None) - cel mai bun scor al unui nivel
+    • flush() - asteapta scrierea tuturor scorurilor din coada
+    • close() - scrie scorurile ramase si opreste firul de scriere
+
+    """
+
+    def __init__(self, path, batch_delay=0.5):
+        """
+            Deschide (sau creează) baza de date și pornește firul de scriere.
+
+            Args:
+                path (str): Calea fișierului SQLite.
+                batch_delay (float): Cât așteaptă firul de scriere, în secunde, după primul scor dintr-un lot.
+        """
+        self.path = path
+        self.batch_delay = batch_delay
+        self._connection = sqlite3.connect(path)
+        with self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = []
+        self._thread = threading.Thread(target=self._write_loop, name="ScoreStore", daemon=True)
+        self._thread.start()
+
+    def record(self, level, player, score):
+        """
+            Adaugă scorul unui joc terminat. Scorul este scris în baza de date de firul de scriere.
+
+            Args:
+                level (str): Nivelul jucat.
+                player (str): Numele jucătorului.
+                score (int): Scorul.
+        """
+        entry = (level, player, score, time.time())
+        with self._lock:
+            self._pending.append(entry)
+            self._queue.put(entry)
+
+    def top(self, level, limit=10):
+        """
+            Returnează cele mai bune scoruri ale unui nivel.
+
+            Args:
+                level (str): Nivelul.
+                limit (int): Numărul maxim de scoruri.
+
+            Returns:
+                list of tuple: Tupluri (jucător, scor, moment) ordonate descrescător după scor; la scor egal, primul
+                este cel mai vechi.
+        """
+        # Scorurile nescrise sunt copiate inaintea interogarii: un scor scris intre timp apare in ambele si este
+        # eliminat mai jos, dar niciunul nu poate lipsi.
+        with self._lock:
+            pending = [(player, score, created) for entry_level, player, score, created in self._pending
+                       if entry_level == level]
+        rows = self._connection.execute(
+            "SELECT player, score, created FROM scores WHERE level = ? ORDER BY score DESC, created LIMIT ?",
+            (level, limit)).fetchall()
+        rows.extend(set(pending).difference(rows))
+        rows.sort(key=lambda row: (-row[1], row[2]))
+        return rows[:limit]
+
+    def best(self, level, player=None):
+        """
+            Returnează cel mai bun scor al unui nivel.
+
+            Args:
+                level (str): Nivelul.
+                player (str): Numele jucătorului (opțional); implicit cel mai bun scor al oricărui jucător.
+
+            Returns:
+                int: Cel mai bun scor sau 0 dacă nu există niciun scor.
+        """
+        with self._lock:
+            pending = [score for entry_level, entry_player, score, _ in self._pending
+                       if entry_level == level and (player is None or entry_player == player)]
+        if player is None:
+            (best,), = self._connection.execute("SELECT MAX(score) FROM scores WHERE level = ?", (level,))
+        else:
+            (best,), = self._connection.execute("SELECT MAX(score) FROM scores WHERE level = ? AND player = ?",
+                                                 (level, player))
+        return max([best or 0] + pending)
+
+    def flush(self):
+        """
+            Așteaptă până când toate scorurile din coadă au fost scrise în baza de date.
+        """
+        self._queue.join()
+
+    def close(self):
+        """
+            Scrie scorurile rămase în coadă, oprește firul de scriere și închide baza de date.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._connection.close()
+
+    def _write_loop(self):
+        """
+            Firul de scriere: așteaptă un scor, adună scorurile venite în următoarele `batch_delay` secunde și le
+            scrie într-o singură tranzacție.
+        """
+        connection = sqlite3.connect(self.path)
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.batch_delay
+            while batch[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            if batch[-1] is _STOP:
+                running = False
+            entries = [entry for entry in batch if entry is not _STOP]
+            if entries:
+                with connection:
+                    connection.executemany("INSERT INTO scores (level, player, score, created) VALUES (?, ?, ?, ?)",
+                                           entries)
+                # Scorurile sunt scoase din memorie doar dupa commit, ca o citire sa le gaseasca mereu undeva.
+                with self._lock:
+                    del self._pending[:len(entries)]
+            for _ in batch:
+                self._queue.task_done()
+        connection.close()
@@ -0,0 +1,85 @@
+class ScreenManager:
+    """
+    Ecranele ferestrei principale (start, dificultate, instructiuni, joc), construite o singura data si comutate.
+
+    Fiecare ecran este inregistrat cu o functie care il construieste; functia este apelata doar la prima afisare a
+    ecranului, iar la afisarile urmatoare widget-ul existent este doar impachetat din nou (pack), dupa ce ecranul
+    curent a fost ascuns (pack_forget). Astfel numarul de widget-uri ramane constant oricate jocuri se joaca, iar
+    comutarea intre ecrane nu mai creeaza nimic.
+
+    Atribute:
+
+    • root: obiect de tip Tk - fereastra in care sunt afisate ecranele
+    • current: str - numele ecranului afisat sau None
+
+    Metode:
+
+    • register(name, builder, **pack_options) - inregistreaza un ecran
+    • get(name) - widget-ul unui ecran, construit la primul apel
+    • show(name) - ascunde ecranul curent si afiseaza ecranul name
+    • hide() - ascunde ecranul curent
+
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.current = None
+        self._builders = {}
+        self._pack_options = {}
+        self._screens = {}
+
+    def register(self, name, builder, **pack_options):
+        """
+            Înregistrează un ecran.
+
+            Args:
+                name (str): Numele ecranului.
+                builder (callable): Funcția fără argumente care construiește ecranul și returnează widget-ul lui
+                    (nepachetat).
+                **pack_options: Opțiunile transmise lui `pack` la fiecare afișare.
+        """
+        self._builders[name] = builder
+        self._pack_options[name] = pack_options
+
+    def get(self, name):
+        """
+            Returnează widget-ul unui ecran, construindu-l la primul apel.
+
+            Args:
+                name (str): Numele ecranului.
+
+            Returns:
+                tk.Widget: Widget-ul ecranului.
+
+            Raises:
+                KeyError: Dacă ecranul nu este înregistrat.
+        """
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = self._screens[name] = self._builders[name]()
+        return screen
+
+    def show(self, name):
+        """
+            Ascunde ecranul curent și afișează ecranul `name`.
+
+            Args:
+                name (str): Numele ecranului.
+
+            Returns:
+                tk.Widget: Widget-ul ecranului afișat.
+        """
+        screen = self.get(name)
+        if self.current != name:
+            self.hide()
+            screen.pack(**self._pack_options[name])
+            self.current = name
+        return screen
+
+    def hide(self):
+        """
+            Ascunde ecranul curent.
+        """
+        if self.current is not None:
+            self._screens[self.current].pack_forget()
+            self.current = None
@@ -0,0 +1,192 @@
+import importlib
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from autopilot import Autopilot
+from engine import SnakeEngine, DIRECTIONS, OPPOSITE
+from levels import LEVEL_CONFIG, load_level_pack
+
+# Cauza raportata pentru jocurile oprite dupa max_ticks tick-uri.
+TICK_LIMIT = "limit"
+
+
+def random_policy(engine, rng):
+    """
+        Politica aleatoare: alege orice direcție care nu este opusă direcției curente.
+
+        Args:
+            engine (SnakeEngine): Motorul jocului.
+            rng (random.Random): Generatorul de numere aleatoare al workerului.
+
+        Returns:
+            str: Direcția aleasă.
+    """
+    choices = [d for d in DIRECTIONS if engine.direction is None or d != OPPOSITE[engine.direction]]
+    return rng.choice(choices)
+
+
+def greedy_policy(engine, rng):
+    """
+        Politica lacomă: se apropie de mâncare, evitând celulele ocupate și marginile dacă se poate.
+
+        Args:
+            engine (SnakeEngine): Motorul jocului.
+            rng (random.Random): Generatorul de numere aleatoare al workerului.
+
+        Returns:
+            str: Direcția aleasă.
+    """
+    col, row = engine.snake[0]
+    safe = []
+    for direction, (dx, dy) in DIRECTIONS.items():
+        if engine.direction is not None and direction == OPPOSITE[engine.direction]:
+            continue
+        c, r = col + dx, row + dy
+        if 0 <= c < engine.cols and engine.FIRST_ROW <= r < engine.rows and not engine.grid[r * engine.cols + c]:
+            safe.append(direction)
+    if not safe:
+        return random_policy(engine, rng)
+    if engine.food is None:
+        return rng.choice(safe)
+    food_col, food_row = engine.food
+    return min(safe, key=lambda d: abs(col + DIRECTIONS[d][0] - food_col) + abs(row + DIRECTIONS[d][1] - food_row))
+
+
+POLICIES = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "autopilot": Autopilot(),
+}
+
+
+def resolve_policy(spec):
+    """
+        Găsește politica după nume.
+
+        Args:
+            spec (str): Numele unei politici din POLICIES sau "modul:functie" pentru o politică externă, cu
+                semnătura policy(engine, rng) -> direcție.
+
+        Returns:
+            callable: Funcția politicii.
+
+        Raises:
+            ValueError: Dacă politica nu există.
+    """
+    if spec in POLICIES:
+        return POLICIES[spec]
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Politica necunoscuta: {spec!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def play_game(engine, policy, rng, max_ticks):
+    """
+        Joacă un singur joc până la capăt, fără interfață grafică.
+
+        Args:
+            engine (SnakeEngine): Motorul jocului, deja resetat.
+            policy (callable): Politica, cu semnătura policy(engine, rng) -> direcție.
+            rng (random.Random): Generatorul de numere aleatoare transmis politicii.
+            max_ticks (int): Numărul maxim de tick-uri; jocul este oprit cu cauza TICK_LIMIT.
+
+        Returns:
+            tuple: Scorul, numărul de tick-uri jucate și cauza terminării jocului.
+    """
+    ticks = 0
+    while not engine.game_over:
+        if ticks >= max_ticks:
+            return engine.score, ticks, TICK_LIMIT
+        engine.step(policy(engine, rng))
+        ticks += 1
+    return engine.score, ticks, engine.cause
+
+
+def _new_summary():
+    return {"games": 0, "score_sum": 0, "score_max": 0, "ticks_sum": 0, "causes": Counter()}
+
+
+def _merge_summary(total, part):
+    total["games"] += part["games"]
+    total["score_sum"] += part["score_sum"]
+    total["score_max"] = max(total["score_max"], part["score_max"])
+    total["ticks_sum"] += part["ticks_sum"]
+    total["causes"].update(part["causes"])
+
+
+def _run_chunk(obstacles_file, block_size, level, policy_spec, seed, games, max_ticks):
+    """
+        Rulează un lot de jocuri într-un proces worker și întoarce doar rezumatul lor.
+    """
+    pack = load_level_pack(obstacles_file, block_size)
+    rng = random.Random(seed)
+    engine = SnakeEngine(pack.cols, pack.rows, pack.level(level).obstacles(), seed=seed)
+    policy = resolve_policy(policy_spec)
+
+    summary = _new_summary()
+    for _ in range(games):
+        engine.reset()
+        score, ticks, cause = play_game(engine, policy, rng, max_ticks)
+        summary["games"] += 1
+        summary["score_sum"] += score
+        summary["score_max"] = max(summary["score_max"], score)
+        summary["ticks_sum"] += ticks
+        summary["causes"][cause] += 1
+    return level, summary
+
+
+def run_self_play(games, levels=tuple(LEVEL_CONFIG), policy="greedy", workers=None, seed=0, max_ticks=10000,
+                  obstacles_file="tabla.json", block_size=20):
+    """
+        Rulează jocuri fără interfață grafică pe toate nucleele, cu o politică dată.
+
+        Jocurile fiecărui nivel sunt împărțite în loturi distribuite unui ProcessPoolExecutor. Fiecare lot are
+        propria sămânță (seed + indexul lotului), deci rezultatele sunt reproductibile pentru același număr de
+        workeri și loturi.
+
+        Args:
+            games (int): Numărul de jocuri pentru fiecare nivel.
+            levels (iterable of str): Nivelele jucate ("usor", "normal", "hardcore").
+            policy (str): Numele politicii sau "modul:functie" (vezi `resolve_policy`).
+            workers (int): Numărul de procese; implicit numărul de nuclee.
+            seed (int): Sămânța de bază.
+            max_ticks (int): Numărul maxim de tick-uri pentru un joc.
+            obstacles_file (str): Calea către fișierul JSON cu nivelele.
+            block_size (int): Dimensiunea unui bloc, în pixeli.
+
+        Returns:
+            dict: Pentru fiecare nivel: numărul de jocuri, scorul mediu și maxim, durata medie în tick-uri și
+            numărul de jocuri terminate din fiecare cauză.
+    """
+    resolve_policy(policy)
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, min(1000, games // (workers * 4)))
+
+    jobs = []
+    for level in levels:
+        for start in range(0, games, chunk):
+            jobs.append((level, min(chunk, games - start)))
+
+    totals = {level: _new_summary() for level in levels}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_chunk, obstacles_file, block_size, level, policy, seed + index, count,
+                                   max_ticks)
+                   for index, (level, count) in enumerate(jobs)]
+        for future in futures:
+            level, summary = future.result()
+            _merge_summary(totals[level], summary)
+
+    results = {}
+    for level, total in totals.items():
+        played = total["games"] or 1
+        results[level] = {
+            "games": total["games"],
+            "mean_score": total["score_sum"] / played,
+            "max_score": total["score_max"],
+            "mean_ticks": total["ticks_sum"] / played,
+            "causes": dict(total["causes"]),
+        }
+    return results